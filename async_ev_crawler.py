@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+asyncio 기반 전기차 보조금 크롤러
+하나의 이벤트 루프에서 여러 지역/연도/차종 요청을 동시에 처리합니다.
+"""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from electric_car_csv_crawler import (RequestsEVCrawler, count_by_region_name, parse_crawler_options,
+                                      parse_matrix_options, parse_sink_options)
+from rate_limiter import request_with_retry_async
+
+# 비동기 HTTP 클라이언트 (선택적)
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    print("⚠️  httpx가 설치되지 않음. pip install httpx")
+
+# HTTP/2 지원 (h2 설치 시에만 사용)
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class AsyncEVCrawler(RequestsEVCrawler):
+    """RequestsEVCrawler의 세션 초기화/파싱/저장을 그대로 쓰고 요청만 비동기로 처리"""
+
+    def __init__(self, target_year=None, max_concurrency=32, max_requests_per_second=4.0, **kwargs):
+        super().__init__(target_year, max_workers=max_concurrency,
+                         max_requests_per_second=max_requests_per_second, **kwargs)
+        self.max_concurrency = max(1, int(max_concurrency))
+
+    def create_async_client(self):
+        """세션 쿠키/헤더를 공유하는 keep-alive 커넥션 풀 클라이언트 생성"""
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency
+        )
+        return httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            cookies=self.session.cookies,
+            http2=HTTP2_AVAILABLE,
+            limits=limits,
+            timeout=self.request_timeout,
+            follow_redirects=True
+        )
+
+    async def get_local_car_price_list_async(self, client, year, car_type="11"):
+        """지자체 차종별 보조금 목록 페이지 (요청/응답 처리는 동기 경로와 같은 코어 함수 사용)"""
+        try:
+            url, data, headers = self.list_page_request(year, car_type)
+
+            # 스레드 워커와 같은 공유 제한기 사용 (429/5xx 시 백오프 후 재시도)
+            response = await request_with_retry_async(
+                lambda: client.post(url, data=data, headers=headers),
+                self.rate_limiter, description=f"{year}년 목록 페이지")
+            return self.list_page_from_response(year, response)
+
+        except Exception as e:
+            print(f"   ❌ {year}년 목록 페이지 요청 실패: {e}")
+            return None
+
+    async def get_local_car_detail_async(self, client, year, local_cd, car_type, local_nm):
+        """특정 지역의 차량별 보조금 상세 정보 (캐시/재생/조건부 요청 처리는 동기 경로와 같은 코어 함수 사용)
+
+        응답 캐시 파일 읽기/쓰기는 작업 스레드에서 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        done, cached = await loop.run_in_executor(None, self.cached_detail, year, local_cd, car_type, local_nm)
+        if done:
+            return cached
+
+        try:
+            url, data, headers = self.detail_page_request(year, local_cd, car_type, local_nm, cached)
+            response = await request_with_retry_async(
+                lambda: client.post(url, data=data, headers=headers),
+                self.rate_limiter, description=f"{local_nm} 상세 페이지")
+            return await loop.run_in_executor(
+                None, self.detail_from_response, year, local_cd, car_type, local_nm, response, cached)
+
+        except Exception as e:
+            print(f"   ❌ {local_nm} 상세 페이지 요청 실패: {e}")
+            return None
+
+    def finished_region(self, year, car_type, region):
+        """요청 없이 끝나는 지역(저널에서 재개, 건너뛰기)이면 (상태, 차량 리스트), 아니면 None"""
+        resumed = self.resume_region(year, car_type, region)
+        if resumed:
+            return resumed
+        if self.skip_region(year, car_type, region):
+            return 'skipped', []
+        return None
+
+    async def crawl_region_async(self, client, semaphore, year, car_type, region, on_region=None, callback_executor=None):
+        """단일 지역 수집 - 반환값: (상태, 차량 수) (차량 리스트는 on_region에 넘긴 뒤 버림)
+
+        상태 파일 읽기/파싱은 작업 스레드에서, on_region(CSV 기록, 싱크)은 callback_executor(단일 스레드)에서
+        실행해 이벤트 루프가 다른 지역의 요청을 계속 처리하게 합니다.
+        """
+        loop = asyncio.get_running_loop()
+        finished = await loop.run_in_executor(None, self.finished_region, year, car_type, region)
+        if finished:
+            status, vehicles = finished
+        else:
+            async with semaphore:
+                detail_html = await self.get_local_car_detail_async(
+                    client, year, region['code'], car_type, region['name'])
+
+            status, vehicles = await loop.run_in_executor(
+                None, self.parse_region_html, year, car_type, region, detail_html)
+        if on_region:
+            await loop.run_in_executor(callback_executor, on_region, year, car_type, region, vehicles)
+        return status, len(vehicles)
+
+    async def crawl_combinations_async(self, combinations, regions_by_combination, on_region=None):
+        """(연도, 차종) 조합 전체를 하나의 이벤트 루프/클라이언트로 수집
+
+        regions_by_combination: {(연도, 차종): 지역 목록} (세션/지역 목록 준비는 이벤트 루프 시작 전에 끝냄)
+        on_region(연도, 차종, 지역, 차량 리스트)를 넘기면 지역이 끝날 때마다 호출
+        반환값: {(연도, 차종): {지역명: 차량 수}} (데이터가 있는 지역만)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = {}
+
+        async with self.create_async_client() as client:
+            print(f"\n⚙️ 비동기 요청: 동시 {self.max_concurrency}개, 최대 초당 {self.max_requests_per_second}건, "
+                  f"HTTP/2 {'사용' if HTTP2_AVAILABLE else '미사용'}")
+
+            # 조합별 목록 페이지를 먼저 열어 서버 세션 상태를 맞춤
+            await asyncio.gather(*[
+                self.get_local_car_price_list_async(client, year, car_type)
+                for year, car_type in combinations
+            ])
+
+            # on_region은 동기 경로처럼 한 번에 하나씩 (CSV 기록 순서/싱크 상태 보호)
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='region-callback') as callback_executor:
+                tasks = []
+                for year, car_type in combinations:
+                    for region in regions_by_combination[(year, car_type)]:
+                        tasks.append(self.crawl_region_async(client, semaphore, year, car_type, region,
+                                                             on_region, callback_executor))
+
+                outcomes = await asyncio.gather(*tasks)
+
+        if self.response_cache:
+            self.response_cache.print_stats()
+
+        # 지역 목록 순서대로 결과 정리
+        index = 0
+        for year, car_type in combinations:
+            regions = regions_by_combination[(year, car_type)]
+            success_count = 0
+            no_data_count = 0
+            fail_count = 0
+            skipped_count = 0
+
+            region_counts = []
+            for region in regions:
+                status, vehicle_count = outcomes[index]
+                index += 1
+                region_counts.append(vehicle_count)
+
+                if status == 'success':
+                    success_count += 1
+                elif status == 'no_data':
+                    no_data_count += 1
+                elif status == 'skipped':
+                    skipped_count += 1
+                else:
+                    fail_count += 1
+
+            self.print_crawl_summary(year, car_type, len(regions), {
+                'success': success_count, 'no_data': no_data_count, 'failed': fail_count,
+                'skipped': skipped_count})
+            results[(year, car_type)] = count_by_region_name(regions, region_counts)
+
+        return results
+
+    def crawl_combinations(self, combinations, regions=None, on_region=None):
+        """(연도, 차종) 조합 × 지역 비동기 크롤링 (반환 구조는 RequestsEVCrawler와 동일)"""
+        if self.replay_from_cache:
+            # 캐시 재생은 네트워크를 쓰지 않으므로 기존 경로로 처리
+            return super().crawl_combinations(combinations, regions, on_region)
+
+        if not HTTPX_AVAILABLE:
+            print("⚠️  httpx가 없어 스레드 방식으로 수집합니다.")
+            return super().crawl_combinations(combinations, regions, on_region)
+
+        # 쿠키 초기화와 지역 목록 조회(네트워크 사용 가능)는 이벤트 루프 시작 전에 동기 세션으로 한 번만 수행
+        if not self.ensure_session():
+            return None
+
+        regions_by_combination = {
+            (year, car_type): regions if regions is not None else self.get_all_regions(year, car_type)
+            for year, car_type in combinations
+        }
+        return asyncio.run(self.crawl_combinations_async(combinations, regions_by_combination, on_region))
+
+
+if __name__ == "__main__":
+    # 옵션: --concurrency N (동시 요청 수), 나머지는 electric_car_csv_crawler.py와 같음
+    # --rps N, --no-cache, --cache-ttl 시간, --replay, --parser lxml|bs4, --compact, --refresh-regions
+    # 범위 옵션: --years 2023,2024,2025 --car-types 11,12 --split-car-types
+    # 체크포인트 옵션: --no-resume
+    # 건너뛰기 옵션: --probe-all (데이터가 계속 없는 지역도 모두 요청), --probe-days N
+    # 추가 싱크: --sheets, --results-json 파일
+    options = parse_crawler_options(sys.argv, {'max_concurrency': 32, 'max_requests_per_second': 4.0})
+    for i, arg in enumerate(sys.argv):
+        if arg == '--concurrency' and i + 1 < len(sys.argv):
+            options['max_concurrency'] = int(sys.argv[i + 1])
+
+    crawler = AsyncEVCrawler(sinks=parse_sink_options(sys.argv), **options)
+    matrix = parse_matrix_options(sys.argv)
+    crawler.run_matrix(matrix.get('years', [crawler.target_year]),
+                       matrix.get('car_types', ["11"]),
+                       matrix['split_car_types'])
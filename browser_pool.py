@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+JavaScript 렌더링 크롤링용 헤드리스 브라우저 풀
+Chromium을 프로세스당 한 번만 띄워 두고 페이지를 재사용합니다. 국고/지자체 테이블 수집과
+실패 시 다른 방법으로 재시도하는 경우 모두 같은 브라우저를 쓰므로 브라우저 시작 비용(수 초)은 한 번만 듭니다.
+
+- Playwright: 브라우저 하나 + 컨텍스트 하나, 페이지 재사용
+- pyppeteer / requests-html: pyppeteer 브라우저 하나를 같은 이벤트 루프에서 함께 사용
+  (requests-html은 내부적으로 pyppeteer로 렌더링하므로 HTMLSession에 풀의 브라우저를 넘겨줍니다)
+- 이미지/폰트/CSS/미디어 요청은 요청 가로채기로 차단 (테이블 텍스트만 필요)
+  requests-html은 렌더링할 때마다 내부에서 새 페이지를 만들어 가로채기를 걸 수 없으므로 차단하지 않습니다.
+
+풀은 단일 스레드에서 쓰는 것을 전제로 하며, 프로세스 종료 시(atexit) 자동으로 닫힙니다.
+다른 스레드에서 Playwright 렌더링이 필요하면 PlaywrightThread(전용 스레드가 자기 풀을 소유)에 작업을 넘깁니다.
+"""
+
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+# 선택적 imports (설치된 라이브러리에 따라)
+try:
+    from requests_html import HTMLSession
+
+    REQUESTS_HTML_AVAILABLE = True
+except ImportError:
+    REQUESTS_HTML_AVAILABLE = False
+
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+try:
+    import pyppeteer
+
+    PYPPETEER_AVAILABLE = True
+except ImportError:
+    PYPPETEER_AVAILABLE = False
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 가로채서 차단할 리소스 종류 (Playwright/pyppeteer 공통 이름)
+BLOCKED_RESOURCE_TYPES = frozenset(['image', 'font', 'stylesheet', 'media'])
+
+# Playwright 대기 중 중단 요청을 확인하는 간격 (밀리초)
+STOP_CHECK_MS = 200
+
+PYPPETEER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu'
+]
+
+
+def _route_request(route):
+    """Playwright 요청 가로채기 - 차단 대상이면 중단, 아니면 그대로 진행"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def wait_playwright(wait, stop, timeout_ms):
+    """Playwright 대기 wait(timeout=밀리초)를 짧게 나눠 호출하면서 stop(threading.Event) 확인
+
+    대기가 끝나면 True, stop이 설정되면 False, timeout_ms가 지나면 Playwright TimeoutError.
+    Playwright 동기 API는 다른 스레드에서 멈출 수 없으므로 소유 스레드가 대기 사이사이에 확인합니다.
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not stop.is_set():
+        remaining = (deadline - time.monotonic()) * 1000
+        try:
+            wait(timeout=max(1, min(STOP_CHECK_MS, remaining)))
+            return True
+        except PlaywrightTimeoutError:
+            if remaining <= STOP_CHECK_MS:
+                raise
+    return False
+
+
+async def _intercept_request(request):
+    """pyppeteer 요청 가로채기 - 차단 대상이면 중단, 아니면 그대로 진행"""
+    try:
+        if request.resourceType in BLOCKED_RESOURCE_TYPES:
+            await request.abort()
+        else:
+            await request.continue_()
+    except Exception:
+        # 페이지 이동으로 이미 취소된 요청
+        pass
+
+
+class BrowserPool:
+    """엔진별 브라우저를 처음 쓸 때 한 번만 띄우고 페이지를 재사용하는 풀"""
+
+    def __init__(self, block_resources=True):
+        self.block_resources = block_resources
+
+        # Playwright
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._pages = []
+
+        # pyppeteer / requests-html (같은 이벤트 루프와 브라우저 공유)
+        self._loop = None
+        self._pyppeteer_browser = None
+        self._pyppeteer_pages = []
+        self._html_session = None
+
+        self.stats = {'launches': 0, 'pages': 0, 'reused': 0}
+
+    # Playwright
+    def _playwright_context(self):
+        """Playwright 브라우저 컨텍스트 (처음 호출 시 브라우저 시작)"""
+        if self._context is None:
+            print("🧭 Playwright 브라우저 시작 (프로세스당 한 번)")
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._context = self._browser.new_context(user_agent=USER_AGENT)
+            if self.block_resources:
+                self._context.route("**/*", _route_request)
+            self.stats['launches'] += 1
+        return self._context
+
+    @contextmanager
+    def playwright_page(self):
+        """재사용 가능한 Playwright 페이지 (with 블록이 끝나면 풀에 반납)"""
+        context = self._playwright_context()
+        if self._pages:
+            page = self._pages.pop()
+            self.stats['reused'] += 1
+        else:
+            page = context.new_page()
+            self.stats['pages'] += 1
+        try:
+            yield page
+        finally:
+            if not page.is_closed():
+                self._pages.append(page)
+
+    # pyppeteer / requests-html
+    def event_loop(self):
+        """pyppeteer 브라우저가 돌아가는 풀 전용 이벤트 루프"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _get_pyppeteer_browser(self):
+        if self._pyppeteer_browser is None:
+            print("🧭 Chromium(pyppeteer) 브라우저 시작 (프로세스당 한 번)")
+            self._pyppeteer_browser = await pyppeteer.launch(headless=True, args=PYPPETEER_ARGS)
+            self.stats['launches'] += 1
+        return self._pyppeteer_browser
+
+    async def _get_pyppeteer_page(self):
+        if self._pyppeteer_pages:
+            self.stats['reused'] += 1
+            return self._pyppeteer_pages.pop()
+
+        browser = await self._get_pyppeteer_browser()
+        page = await browser.newPage()
+        await page.setUserAgent(USER_AGENT)
+        if self.block_resources:
+            await page.setRequestInterception(True)
+            page.on('request', lambda request: asyncio.ensure_future(_intercept_request(request)))
+        self.stats['pages'] += 1
+        return page
+
+    async def with_pyppeteer_page(self, work):
+        """work(page) 코루틴 함수를 재사용 페이지로 실행 (풀의 이벤트 루프 안에서, 취소 가능)"""
+        page = await self._get_pyppeteer_page()
+        try:
+            return await work(page)
+        finally:
+            if not page.isClosed():
+                self._pyppeteer_pages.append(page)
+
+    def run_async(self, coroutine):
+        """코루틴을 풀의 이벤트 루프에서 끝까지 실행하고 결과 반환"""
+        return self.event_loop().run_until_complete(coroutine)
+
+    def run_pyppeteer(self, work):
+        """work(page) 코루틴 함수를 풀의 이벤트 루프에서 재사용 페이지로 실행하고 결과 반환"""
+        return self.run_async(self.with_pyppeteer_page(work))
+
+    def html_session(self):
+        """풀의 pyppeteer 브라우저로 렌더링하는 requests-html 세션 (한 번 만들어 재사용)"""
+        if self._html_session is None:
+            session = HTMLSession()
+            # HTMLSession.browser는 _browser가 있으면 새로 띄우지 않고 session.loop에서 렌더링
+            session.loop = self.event_loop()
+            session._browser = session.loop.run_until_complete(self._get_pyppeteer_browser())
+            self._html_session = session
+        return self._html_session
+
+    def close(self):
+        """모든 브라우저 종료 (다시 쓰면 새로 시작)"""
+        if self._context is not None:
+            try:
+                self._context.close()
+                self._browser.close()
+                self._playwright.stop()
+            except Exception as e:
+                print(f"⚠️ Playwright 브라우저 종료 실패: {e}")
+            self._playwright = self._browser = self._context = None
+            self._pages = []
+
+        if self._html_session is not None:
+            # 브라우저는 아래에서 닫으므로 HTTP 세션만 정리
+            super(HTMLSession, self._html_session).close()
+            self._html_session = None
+
+        if self._pyppeteer_browser is not None:
+            try:
+                self._loop.run_until_complete(self._pyppeteer_browser.close())
+            except Exception as e:
+                print(f"⚠️ Chromium(pyppeteer) 브라우저 종료 실패: {e}")
+            self._pyppeteer_browser = None
+            self._pyppeteer_pages = []
+
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
+
+        if self.stats['launches']:
+            print(f"🧭 브라우저 풀 종료: 브라우저 시작 {self.stats['launches']}회, "
+                  f"페이지 생성 {self.stats['pages']}회, 재사용 {self.stats['reused']}회")
+            self.stats = {'launches': 0, 'pages': 0, 'reused': 0}
+
+
+class PlaywrightThread:
+    """Playwright 전용 스레드 - 이 스레드가 자기 BrowserPool을 소유하고 계속 재사용
+
+    Playwright 동기 API는 브라우저를 띄운 스레드에서만 쓸 수 있으므로, 다른 스레드(이벤트 루프 등)는
+    submit(work)으로 작업을 넘깁니다. 브라우저는 처음 쓸 때 한 번만 시작하고 close()에서 같은 스레드가 닫습니다.
+    데몬 스레드라 프로세스 종료를 막지 않으며, atexit에서 close()를 부르면 브라우저를 닫은 뒤 끝납니다.
+    """
+
+    def __init__(self, block_resources=True):
+        self.pool = BrowserPool(block_resources)
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            work, args, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(work(self.pool, *args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, work, *args):
+        """work(풀, *args)를 전용 스레드에서 실행 - concurrent.futures.Future 반환 (asyncio.wrap_future로 대기 가능)"""
+        future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='playwright', daemon=True)
+                self._thread.start()
+            self._jobs.put((work, args, future))
+        return future
+
+    def close(self):
+        """진행 중인 작업이 끝나면 전용 스레드에서 브라우저를 닫고 스레드 종료 (다시 쓰면 새로 시작)"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._jobs.put((lambda pool: pool.close(), (), Future()))
+            self._jobs.put(None)
+        thread.join()
+
+
+_shared_pool = None
+_shared_playwright_thread = None
+_shared_lock = threading.Lock()
+
+
+def shared_browser_pool():
+    """프로세스 공유 브라우저 풀 (처음 호출 시 생성, 종료 시 자동으로 닫힘)"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+def shared_playwright_thread():
+    """프로세스 공유 Playwright 전용 스레드 (처음 호출 시 생성, 종료 시 자동으로 브라우저를 닫음)"""
+    global _shared_playwright_thread
+    with _shared_lock:
+        if _shared_playwright_thread is None:
+            _shared_playwright_thread = PlaywrightThread()
+            atexit.register(_shared_playwright_thread.close)
+        return _shared_playwright_thread
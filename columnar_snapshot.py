@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+연도별 보조금 데이터 컬럼형 스냅샷 (Arrow IPC)
+csv/{연도}.csv를 보조금은 숫자, 지역/광역시도/제조사/차종은 사전 인코딩된 컬럼으로 변환해
+csv/{연도}.arrow로 저장하고, 메모리 맵으로 바로 읽는 로더를 제공합니다.
+
+사용법:
+    python columnar_snapshot.py            # csv 폴더의 모든 연도 CSV 변환 후 로드 시간 확인
+    python columnar_snapshot.py 2024 2025  # 지정 연도만 변환
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+
+from streaming_csv_writer import CSV_COLUMNS, CSV_HEADERS
+
+# Arrow (선택적)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+SNAPSHOT_EXTENSION = '.arrow'
+
+# 스냅샷 파일명: {연도}.arrow (차종 합침) 또는 {연도}_{차종}.arrow (--split-car-types)
+SNAPSHOT_NAME = re.compile(r'^(\d{4})(?:_([^_.]+))?' + re.escape(SNAPSHOT_EXTENSION) + '$')
+
+# 반복값이 많은 문자열 컬럼 (사전 인코딩)
+DICTIONARY_COLUMNS = ('region', 'category', 'manufacturer', 'model')
+
+# 숫자로 변환할 보조금 컬럼 (단위: 만원, "1,247.4" 형식)
+AMOUNT_COLUMNS = ('national_subsidy', 'local_subsidy', 'total_subsidy')
+
+
+def snapshot_path(csv_path):
+    """CSV 경로에 대응하는 스냅샷 경로 (csv/2025.csv → csv/2025.arrow)"""
+    return os.path.splitext(csv_path)[0] + SNAPSHOT_EXTENSION
+
+
+def _amount_column(column):
+    """"1,247.4" 같은 문자열 금액을 float64로 변환 (빈 값/숫자가 아닌 값은 null)"""
+    text = pc.utf8_trim_whitespace(pc.replace_substring(column, ',', ''))
+    valid = pc.match_substring_regex(text, r'^-?\d+(\.\d+)?$')
+    return pc.if_else(valid, text, pa.scalar(None, pa.string())).cast(pa.float64())
+
+
+def read_csv_table(csv_path):
+    """크롤러 CSV(UTF-8 BOM, 한국어 헤더)를 영문 컬럼명의 문자열 테이블로 읽기"""
+    header_to_column = {CSV_HEADERS[column]: column for column in CSV_COLUMNS}
+    convert_options = pa_csv.ConvertOptions(
+        column_types={header: pa.string() for header in header_to_column},
+        strings_can_be_null=False
+    )
+    table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+    return table.rename_columns([header_to_column.get(name, name) for name in table.column_names])
+
+
+def build_snapshot_table(csv_path):
+    """CSV → 타입이 지정된 컬럼형 테이블 (수집일시/연도는 메타데이터로 이동)"""
+    table = read_csv_table(csv_path)
+
+    crawl_date = table['crawl_date'][0].as_py() if table.num_rows else ''
+    data_year = table['data_year'][0].as_py() if table.num_rows else os.path.splitext(os.path.basename(csv_path))[0]
+
+    arrays = []
+    names = []
+    for column in CSV_COLUMNS:
+        if column == 'crawl_date':
+            continue
+        values = table[column]
+        if column == 'data_year':
+            values = values.cast(pa.int16())
+        elif column in AMOUNT_COLUMNS:
+            values = _amount_column(values)
+        elif column in DICTIONARY_COLUMNS:
+            values = values.dictionary_encode()
+        arrays.append(values)
+        names.append(column)
+
+    metadata = {
+        'crawl_date': crawl_date,
+        'data_year': str(data_year),
+        'source': os.path.basename(csv_path),
+        'amount_unit': '만원'
+    }
+    return pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(metadata)
+
+
+def write_snapshot(csv_path, output_path=None):
+    """CSV를 Arrow IPC 파일로 저장 (압축하지 않아 메모리 맵으로 복사 없이 읽힘)"""
+    if not PYARROW_AVAILABLE:
+        print("⚠️  pyarrow가 설치되지 않아 컬럼형 스냅샷을 건너뜁니다. pip install pyarrow")
+        return None
+
+    output_path = output_path or snapshot_path(csv_path)
+    try:
+        table = build_snapshot_table(csv_path)
+
+        temp_path = output_path + '.tmp'
+        with pa.OSFile(temp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_path, output_path)
+
+        print(f"🧊 컬럼형 스냅샷 저장 완료: {output_path} ({table.num_rows}행, "
+              f"{os.path.getsize(output_path) / 1024:.0f}KB)")
+        return output_path
+
+    except Exception as e:
+        print(f"❌ 컬럼형 스냅샷 저장 실패: {e}")
+        return None
+
+
+def load_snapshot(path):
+    """스냅샷을 메모리 맵으로 로드 (pyarrow.Table)"""
+    source = pa.memory_map(path, 'r')
+    return pa.ipc.open_file(source).read_all()
+
+
+def snapshot_metadata(table):
+    """스냅샷 메타데이터 (crawl_date, data_year, source, amount_unit)"""
+    metadata = table.schema.metadata or {}
+    return {key.decode('utf-8'): value.decode('utf-8') for key, value in metadata.items()}
+
+
+def snapshot_name(year, car_type=None):
+    """스냅샷 파일명 (차종을 주면 차종별 파일: 2025_11.arrow)"""
+    return f"{year}_{car_type}{SNAPSHOT_EXTENSION}" if car_type else f"{year}{SNAPSHOT_EXTENSION}"
+
+
+def load_snapshots(years=None, folder='csv', car_type=None):
+    """여러 연도 스냅샷을 하나의 테이블로 로드 (연도 미지정 시 폴더의 전체 연도)
+
+    한 가지 파일명 형식만 읽습니다 - car_type이 없으면 {연도}.arrow, 있으면 {연도}_{차종}.arrow.
+    (같은 연도의 합친 파일과 차종별 파일을 함께 읽으면 행이 중복되므로)
+    연도별 수집일시는 반환 테이블 메타데이터의 'crawl_dates'에 "연도=수집일시" 형식으로 기록됩니다.
+    """
+    if years is None:
+        paths = []
+        for path in sorted(glob.glob(os.path.join(folder, f"*{SNAPSHOT_EXTENSION}"))):
+            match = SNAPSHOT_NAME.match(os.path.basename(path))
+            if match and match.group(2) == (str(car_type) if car_type else None):
+                paths.append(path)
+    else:
+        paths = [os.path.join(folder, snapshot_name(year, car_type)) for year in years]
+
+    tables = []
+    crawl_dates = []
+    for path in paths:
+        table = load_snapshot(path)
+        metadata = snapshot_metadata(table)
+        crawl_dates.append(f"{metadata.get('data_year', '')}={metadata.get('crawl_date', '')}")
+        # 연도별 사전이 달라도 합칠 수 있도록 공통 사전으로 통합
+        tables.append(table.replace_schema_metadata(None))
+
+    if not tables:
+        return None
+
+    combined = pa.concat_tables(tables).unify_dictionaries()
+    return combined.replace_schema_metadata({'crawl_dates': ';'.join(crawl_dates)})
+
+
+if __name__ == "__main__":
+    if not PYARROW_AVAILABLE:
+        print("❌ pyarrow가 필요합니다. pip install pyarrow")
+        sys.exit(1)
+
+    if len(sys.argv) > 1:
+        csv_files = [os.path.join('csv', f"{year}.csv") for year in sys.argv[1:]]
+    else:
+        csv_files = sorted(glob.glob(os.path.join('csv', '*.csv')))
+
+    written = [path for path in (write_snapshot(csv_file) for csv_file in csv_files) if path]
+    if not written:
+        print("❌ 변환할 CSV 파일이 없습니다.")
+        sys.exit(1)
+
+    # 파일명 형식(차종 합침 / 차종별)마다 따로 로드 (섞으면 같은 연도 행이 중복됨)
+    groups = {}
+    for path in written:
+        match = SNAPSHOT_NAME.match(os.path.basename(path))
+        if match:
+            groups.setdefault(match.group(2), []).append(match.group(1))
+
+    for car_type, years in sorted(groups.items(), key=lambda item: item[0] or ''):
+        start = time.perf_counter()
+        table = load_snapshots(years, car_type=car_type)
+        elapsed = (time.perf_counter() - start) * 1000
+        label = f"차종 {car_type}" if car_type else "전체 차종"
+        print(f"⚡ 스냅샷 {len(years)}개 로드 ({label}): {table.num_rows}행, {elapsed:.1f}ms")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+운영용 압축 JSON 내보내기
+들여쓰기 없는 구분자로 저장하고, 같은 키가 반복되는 레코드 목록은 스키마 헤더(짧은 키/원래 이름/타입)와
+값 배열(행)로 바꿉니다. "19.2", "1,247.4" 같은 금액 문자열은 내보낼 때 한 번만 숫자로 바꿔 둡니다.
+
+표 형식:
+    {
+      "columns": [{"key": "n", "name": "national_subsidy", "type": "number"}, ...],
+      "rows": [[686, ...], ...]          # 값 순서 = columns 순서
+    }
+
+사용법 (기존 JSON을 압축 형식으로 다시 저장하지는 않고 크기만 비교):
+    python compact_json.py csv/2025.json
+"""
+
+import json
+import math
+import os
+import sys
+
+COMPACT_FORMAT = 'ev-compact'
+COMPACT_VERSION = 1
+
+# 컬럼 타입 (number만 변환, 나머지는 값 그대로)
+TEXT = 'string'
+NUMBER = 'number'
+BOOLEAN = 'boolean'
+
+# 크롤러 차량 필드 → 짧은 키 (CSV/샤드/요약 JSON이 같은 키 사용)
+VEHICLE_KEYS = {
+    'region': 'r',
+    'category': 'g',
+    'manufacturer': 'm',
+    'model': 'c',
+    'model_detail': 'd',
+    'national_subsidy': 'n',
+    'local_subsidy': 'l',
+    'total_subsidy': 't'
+}
+AMOUNT_FIELDS = ('national_subsidy', 'local_subsidy', 'total_subsidy')
+
+
+def to_number(value):
+    """금액 문자열 → 숫자 ("1,247.4" → 1247.4, "686" → 686), 숫자가 아니면 None"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if isinstance(value, float) and math.isnan(value) else value
+    try:
+        number = float(str(value).replace(',', '').strip())
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def vehicle_columns(fields, names=None):
+    """크롤러 차량 필드 목록 → 컬럼 정의 [(짧은 키, 이름, 타입)]
+
+    names를 주면 원래 이름 대신 사용합니다 (예: CSV_HEADERS로 한국어 헤더).
+    """
+    names = names or {}
+    return [
+        (VEHICLE_KEYS[field], names.get(field, field), NUMBER if field in AMOUNT_FIELDS else TEXT)
+        for field in fields
+    ]
+
+
+# csv/{연도}.json 요약의 차량 컬럼 (지역은 묶음 키)
+SUMMARY_COLUMNS = vehicle_columns(['manufacturer', 'model', 'model_detail'] + list(AMOUNT_FIELDS))
+
+
+def schema_header(columns):
+    """컬럼 정의 → JSON 스키마 헤더"""
+    return [{'key': key, 'name': name, 'type': kind} for key, name, kind in columns]
+
+
+def pack_rows(records, columns):
+    """dict 레코드 목록 → 값 배열 목록 (number 컬럼은 숫자로, 없는 필드는 None)"""
+    converters = [(name, to_number if kind == NUMBER else None) for _, name, kind in columns]
+    return [
+        [convert(record.get(name)) if convert else record.get(name) for name, convert in converters]
+        for record in records
+    ]
+
+
+def pack_table(records, columns):
+    """dict 레코드 목록 → {'columns': 스키마 헤더, 'rows': 값 배열 목록}"""
+    return {'columns': schema_header(columns), 'rows': pack_rows(records, columns)}
+
+
+def unpack_rows(columns, rows, use_short_keys=False):
+    """스키마 헤더 + 값 배열 → dict 레코드 목록 (기본은 원래 이름, use_short_keys면 짧은 키)"""
+    keys = [column['key'] if use_short_keys else column['name'] for column in columns]
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def unpack_table(table, use_short_keys=False):
+    """pack_table 결과 → dict 레코드 목록"""
+    return unpack_rows(table['columns'], table['rows'], use_short_keys)
+
+
+def compact_header():
+    """압축 형식 파일 머리 (읽는 쪽에서 형식 구분용)"""
+    return {'format': COMPACT_FORMAT, 'version': COMPACT_VERSION}
+
+
+def is_compact(data):
+    """압축 형식으로 저장된 데이터인지"""
+    return isinstance(data, dict) and data.get('format') == COMPACT_FORMAT
+
+
+def dumps(data, compact=False):
+    """JSON 문자열 (compact: 공백 없는 구분자, 아니면 기존처럼 indent=2)"""
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def dump_json(data, path, compact=False):
+    """JSON 저장 (임시 파일에 쓴 뒤 교체)"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(dumps(data, compact))
+    os.replace(temp_path, path)
+    return path
+
+
+def dump_json_stream(document, entries, path, stream_key=None, compact=False):
+    """JSON 객체를 항목 단위로 저장 (dump_json과 같은 형식, 임시 파일에 쓴 뒤 교체)
+
+    entries((키, 값) 반복자)는 document[stream_key] 객체의 항목으로 하나씩 기록하고 (stream_key는 마지막 키),
+    stream_key가 None이면 최상위 객체의 항목이 됩니다. 항목 전체를 메모리에 모으지 않습니다.
+    """
+    if stream_key is None:
+        skeleton, depth = dumps({}, compact), 1
+    else:
+        skeleton, depth = dumps({**document, stream_key: {}}, compact), 2
+    split = skeleton.rindex('{}') + 1
+    indent = '\n' + '  ' * depth
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(skeleton[:split])
+        written = 0
+        for key, value in entries:
+            if compact:
+                f.write((',' if written else '') + dumps(key, True) + ':' + dumps(value, True))
+            else:
+                f.write((',' if written else '') + indent + dumps(key) + ': ' + dumps(value).replace('\n', indent))
+            written += 1
+        if written and not compact:
+            f.write('\n' + '  ' * (depth - 1))
+        f.write(skeleton[split:])
+    os.replace(temp_path, path)
+    return path
+
+
+def compact_summary(summary):
+    """csv/{연도}.json 요약(기존 형식) → 압축 형식"""
+    return {
+        **compact_header(),
+        'crawl_info': summary['crawl_info'],
+        'columns': schema_header(SUMMARY_COLUMNS),
+        'data': {region: pack_rows(vehicles, SUMMARY_COLUMNS) for region, vehicles in summary['data'].items()}
+    }
+
+
+def expand_summary(summary):
+    """압축 형식 요약 → 기존 형식 (금액은 숫자로 남음, 기존 형식이면 그대로)"""
+    if not is_compact(summary):
+        return summary
+    return {
+        'crawl_info': summary['crawl_info'],
+        'data': {region: unpack_rows(summary['columns'], rows) for region, rows in summary['data'].items()}
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python compact_json.py csv/2025.json")
+        sys.exit(1)
+
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        if is_compact(summary):
+            print(f"ℹ️ {path}: 이미 압축 형식입니다")
+            continue
+
+        verbose = dumps(summary).encode('utf-8')
+        compact = dumps(compact_summary(summary), compact=True).encode('utf-8')
+        print(f"📦 {path}: {len(verbose) / 1024:.0f}KB → {len(compact) / 1024:.0f}KB "
+              f"({len(compact) / len(verbose) * 100:.0f}%)")
@@ -5,9 +5,33 @@
 """
 
 import json
+import sys
 from datetime import datetime
 from collections import defaultdict
 
+from compact_json import BOOLEAN, NUMBER, TEXT, compact_header, dump_json, pack_table
+from subsidy_matrix import build_subsidy_matrix, matrix_filename, save_subsidy_matrix
+from vehicle_record import VehicleRecord
+
+# 압축 형식(--compact)의 표 컬럼 (짧은 키, 이름, 타입)
+VEHICLE_COLUMNS = [
+    ('i', 'id', TEXT),
+    ('m', 'manufacturer', TEXT),
+    ('c', 'model', TEXT),
+    ('g', 'category', TEXT),
+    ('n', 'nationalSubsidy', NUMBER)
+]
+REGION_COLUMNS = [
+    ('r', 'region', TEXT),
+    ('a', 'avgSubsidy', NUMBER),
+    ('x', 'maxSubsidy', NUMBER),
+    ('s', 'minSubsidy', NUMBER),
+    ('v', 'vehicleCount', NUMBER),
+    ('h', 'hasDetailData', BOOLEAN),
+    ('d', 'description', TEXT),
+    ('p', 'parentRegion', TEXT)
+]
+
 # 광역시/특별시 기본 데이터 (크롤링 데이터에 없는 경우 사용)
 MAJOR_CITIES_DEFAULT = {
     "서울특별시": {
@@ -109,9 +133,12 @@ MAJOR_CITIES_DEFAULT = {
 }
 
 def load_existing_data():
-    """기존 크롤링 데이터 로드"""
+    """기존 크롤링 데이터 로드 (차량은 VehicleRecord, 금액은 여기서 한 번만 숫자로 변환)"""
     with open('ev_subsidy_all_regions_20250712_191009.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return {
+            region: [VehicleRecord.from_dict(vehicle) for vehicle in vehicles]
+            for region, vehicles in json.load(f).items()
+        }
 
 def get_region_category(region_name):
     """지역명에서 상위 지역 카테고리 추출"""
@@ -176,14 +203,13 @@ def process_vehicle_subsidy_by_region():
         
         for vehicle in vehicles:
             try:
-                # 데이터 파싱
-                manufacturer = vehicle['manufacturer']
-                model = vehicle['model_detail']
-                national_str = vehicle['national_subsidy'].replace(',', '')
-                local_str = vehicle['local_subsidy'].replace(',', '')
+                manufacturer = vehicle.manufacturer
+                model = vehicle.model_detail
+                if model is None or vehicle.national_subsidy is None or vehicle.local_subsidy is None:
+                    raise ValueError("모델명/보조금 누락")
                 
-                national = int(float(national_str))
-                local = int(float(local_str))
+                national = int(vehicle.national_subsidy)
+                local = int(vehicle.local_subsidy)
                 
                 # 차량 ID 생성
                 vehicle_id = f"{manufacturer}_{model}"
@@ -194,7 +220,7 @@ def process_vehicle_subsidy_by_region():
                         'id': vehicle_id,
                         'manufacturer': manufacturer,
                         'model': model,
-                        'category': vehicle['model'],
+                        'category': vehicle.model,
                         'nationalSubsidy': national
                     }
                 
@@ -256,8 +282,18 @@ def process_vehicle_subsidy_by_region():
     
     return final_result
 
-def save_processed_data():
-    """처리된 데이터 저장"""
+def compact_tables(data):
+    """vehicles/regions 목록을 스키마 헤더 + 값 배열 표로 바꾼 압축 형식"""
+    return {
+        **compact_header(),
+        **data,
+        'vehicles': pack_table(data['vehicles'], VEHICLE_COLUMNS),
+        'regions': pack_table(data['regions'], REGION_COLUMNS)
+    }
+
+
+def save_processed_data(compact=False):
+    """처리된 데이터 저장 (compact: 공백 없는 운영용 압축 형식)"""
     data = process_vehicle_subsidy_by_region()
     
     # 통계 출력
@@ -275,9 +311,8 @@ def save_processed_data():
     
     # 전체 데이터 저장
     filename = f"ev_complete_data_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"\n✅ 전체 데이터: {filename}")
+    dump_json(compact_tables(data) if compact else data, filename, compact)
+    print(f"\n✅ 전체 데이터: {filename}" + (" (압축 형식)" if compact else ""))
     
     # 웹용 경량 버전 (vehicleSubsidyByRegion 제외)
     light_data = {
@@ -288,9 +323,18 @@ def save_processed_data():
     }
     
     light_filename = f"ev_data_final_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(light_filename, 'w', encoding='utf-8') as f:
-        json.dump(light_data, f, ensure_ascii=False, indent=2)
+    dump_json(compact_tables(light_data) if compact else light_data, light_filename, compact)
     print(f"✅ 경량 버전: {light_filename}")
+    
+    # 지역 × 차량 보조금 행렬 (웹에서 전체 데이터 대신 백그라운드 로드)
+    matrix = build_subsidy_matrix(
+        data['vehicleSubsidyByRegion'],
+        vehicle_ids=[vehicle['id'] for vehicle in data['vehicles']],
+        metadata=data['metadata']
+    )
+    matrix_file = save_subsidy_matrix(matrix, matrix_filename(datetime.now().strftime('%Y%m%d')))
+    print(f"✅ 보조금 행렬: {matrix_file}")
 
 if __name__ == "__main__":
-    save_processed_data()
\ No newline at end of file
+    # --compact: 운영용 압축 JSON (웹 로더는 두 형식 모두 읽음)
+    save_processed_data(compact='--compact' in sys.argv)
\ No newline at end of file
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+크롤링 체크포인트 저널
+지역 작업이 끝날 때마다 상태와 파싱 결과를 한 줄(JSON Lines)씩 추가 기록해
+중간에 프로세스가 종료되어도 다음 실행에서 남은 지역만 이어서 수집합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from vehicle_record import VehicleRecord
+
+# 이어받을 수 있는 상태 (접근 실패 지역은 다시 시도)
+RESUMABLE_STATUSES = ('success', 'no_data')
+
+
+class CrawlCheckpoint:
+    """(연도, 차종, 지역코드) 단위 추가 전용 저널
+
+    같은 연도/차종 범위의 실행끼리만 공유하며, max_age_seconds보다 오래된 저널은
+    데이터가 낡았으므로 이어받지 않고 새로 시작합니다.
+    """
+
+    def __init__(self, years, car_types, checkpoint_dir=os.path.join('ev_data', 'checkpoints'),
+                 max_age_seconds=24 * 3600, resume=True):
+        self.years = [str(year) for year in years]
+        self.car_types = [str(car_type) for car_type in car_types]
+        self.max_age_seconds = max_age_seconds
+        self.path = os.path.join(
+            checkpoint_dir, f"crawl_{'-'.join(self.years)}_{'-'.join(self.car_types)}.jsonl")
+
+        self._lock = threading.Lock()
+        self.entries = {}
+
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        if resume:
+            self.entries = self.load()
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+        new_journal = not os.path.exists(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if new_journal:
+            self._append({
+                'type': 'header',
+                'created_at': datetime.now().isoformat(),
+                'years': self.years,
+                'car_types': self.car_types
+            })
+
+    @staticmethod
+    def make_key(year, car_type, local_cd):
+        """저널 키 생성"""
+        return f"{year}_{car_type}_{local_cd}"
+
+    def load(self):
+        """기존 저널 로드 (오래됐거나 손상된 저널은 삭제 후 새로 시작)"""
+        if not os.path.exists(self.path):
+            return {}
+
+        if time.time() - os.path.getmtime(self.path) > self.max_age_seconds:
+            print(f"🧹 오래된 체크포인트 삭제: {self.path}")
+            os.remove(self.path)
+            return {}
+
+        entries = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 중 종료되어 잘린 마지막 줄은 무시
+                    continue
+                if record.get('type') == 'region' and record['status'] in RESUMABLE_STATUSES:
+                    record['vehicles'] = [VehicleRecord.from_dict(vehicle) for vehicle in record['vehicles']]
+                    entries[self.make_key(record['year'], record['car_type'], record['code'])] = record
+
+        if entries:
+            print(f"♻️ 이전 실행 체크포인트: {len(entries)}개 지역 작업 복원 ({self.path})")
+        return entries
+
+    def _append(self, record):
+        """한 줄 추가 후 즉시 디스크로 내보냄"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def get(self, year, car_type, region):
+        """이전 실행에서 끝난 지역 작업 기록 (없으면 None)"""
+        return self.entries.get(self.make_key(year, car_type, region['code']))
+
+    def record(self, year, car_type, region, status, content_hash, vehicles):
+        """지역 작업 결과 기록"""
+        if status not in RESUMABLE_STATUSES:
+            return
+
+        entry = {
+            'type': 'region',
+            'year': str(year),
+            'car_type': str(car_type),
+            'code': region['code'],
+            'name': region['name'],
+            'status': status,
+            'hash': content_hash,
+            'vehicles': vehicles
+        }
+        with self._lock:
+            self.entries[self.make_key(year, car_type, region['code'])] = entry
+            self._append({**entry, 'vehicles': [vehicle.to_dict() for vehicle in vehicles]})
+
+    def complete(self):
+        """전체 실행 완료 - 저널 삭제"""
+        with self._lock:
+            self._file.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def close(self):
+        """실행 중단 시 저널 유지 (다음 실행에서 이어받음)"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
@@ -1,25 +1,54 @@
-import requests
-from bs4 import BeautifulSoup
-import json
-import time
 import os
-import pandas as pd
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 from datetime import datetime
 
-
-class RequestsEVCrawler:
-    def __init__(self, target_year=None):
-        self.base_url = "https://ev.or.kr"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+from crawl_checkpoint import CrawlCheckpoint
+from ev_crawler_core import EVCrawlerCore, JSONResultSink
+from region_history import DEFAULT_PROBE_INTERVAL_DAYS, RegionHistory
+from region_state import RegionStateStore
+from columnar_snapshot import snapshot_path, write_snapshot
+from region_spool import RegionSpool
+from compact_json import SUMMARY_COLUMNS, compact_header, dump_json_stream, pack_rows, schema_header
+from response_cache import ResponseCache
+from site_shards import write_site_shards
+from static_artifacts import MANIFEST_FILE, publish_static_files
+from streaming_csv_writer import CSV_COLUMNS, CSV_HEADERS, CSVStats, StreamingCSVWriter, region_sort_key
+
+
+class RequestsEVCrawler(EVCrawlerCore):
+    def __init__(self, target_year=None, max_workers=8, max_requests_per_second=4.0,
+                 use_cache=True, cache_ttl_hours=6, replay_from_cache=False, parser_backend=None,
+                 resume=True, compact_json=False, sinks=(), refresh_regions=False,
+                 skip_empty=True, probe_interval_days=DEFAULT_PROBE_INTERVAL_DAYS):
+        # 응답 캐시 (재생 모드는 네트워크 없이 캐시만 사용)
+        response_cache = None
+        if use_cache or replay_from_cache:
+            response_cache = ResponseCache(ttl_seconds=cache_ttl_hours * 3600)
+
+        super().__init__(max_workers, max_requests_per_second, response_cache,
+                         replay_from_cache, parser_backend, refresh_regions=refresh_regions)
+
+        # 지역별 변경 추적 상태 ((연도, 차종)별)
+        self.region_states = {}
+        self._state_lock = threading.Lock()
+
+        # 지역별 수집 이력 - 데이터가 계속 없는 지역은 probe_interval_days마다만 요청 (skip_empty=False면 매번 전체)
+        self.region_histories = {}
+        self.skip_empty = skip_empty
+        self.probe_interval_days = probe_interval_days
+
+        # 중단된 실행 이어받기 (run_matrix 실행 중에만 체크포인트 저널 사용)
+        self.resume = resume
+        self.checkpoint = None
+
+        # 운영용 압축 JSON (공백 없는 구분자, 스키마 헤더 + 값 배열, 금액은 숫자)
+        self.compact_json = compact_json
+
+        # 추가 출력 싱크 (Sheets, 결과 JSON 등 - 같은 수집 결과를 받음)
+        self.sinks = list(sinks)
 
         # 크롤링 대상 연도 설정 (기본값은 현재 연도)
         self.target_year = target_year if target_year else datetime.now().year
@@ -30,696 +59,609 @@ class RequestsEVCrawler:
             os.makedirs(self.csv_folder)
             print(f"📁 '{self.csv_folder}' 폴더를 생성했습니다.")
 
-        # 기존 파일 정리
-        self.cleanup_old_files()
-
     def cleanup_old_files(self):
-        """기존 대상 연도 파일들 삭제"""
+        """이전 실행이 중단되며 남긴 임시 파일 정리 (기존 연도 파일은 완료 후 교체되므로 유지)"""
         try:
-            # 대상 연도 파일명 패턴
-            target_csv_pattern = f"{self.target_year}.csv"
-            target_json_pattern = f"{self.target_year}.json"
-
-            print(f"🧹 기존 {self.target_year}년 파일 정리 중...")
-
             deleted_files = []
 
-            # csv 폴더 내 파일들 확인
+            # csv 폴더 내 임시 파일 확인 (예: 2025.csv.tmp, 2025.arrow.tmp)
             for filename in os.listdir(self.csv_folder):
-                filepath = os.path.join(self.csv_folder, filename)
-
-                # 대상 연도 CSV 파일 삭제
-                if filename == target_csv_pattern:
-                    os.remove(filepath)
-                    deleted_files.append(filename)
-                    print(f"   🗑️ 삭제: {filename}")
-
-                # 대상 연도 JSON 파일 삭제
-                elif filename == target_json_pattern:
-                    os.remove(filepath)
+                if filename.endswith('.tmp'):
+                    os.remove(os.path.join(self.csv_folder, filename))
                     deleted_files.append(filename)
                     print(f"   🗑️ 삭제: {filename}")
 
             if deleted_files:
-                print(f"   ✅ 총 {len(deleted_files)}개 파일 정리 완료")
-            else:
-                print(f"   ℹ️ 삭제할 기존 {self.target_year}년 파일이 없습니다")
+                print(f"🧹 중단된 실행의 임시 파일 {len(deleted_files)}개 정리 완료")
 
         except Exception as e:
             print(f"⚠️ 파일 정리 중 오류: {e}")
 
-    def get_target_filename(self, file_type="csv"):
-        """대상 연도 기준 파일명 생성"""
-        if file_type == "csv":
-            return f"{self.target_year}.csv"
-        elif file_type == "json":
-            return f"{self.target_year}.json"
-        else:
-            return f"{self.target_year}.csv"
-
-    def get_session_cookies(self):
-        """세션 쿠키 얻기"""
-        try:
-            # 1. 메인 페이지 접속
-            print("📍 메인 페이지 접속 중...")
-            main_response = self.session.get(f"{self.base_url}/nportal/main.do")
-            print(f"   상태 코드: {main_response.status_code}")
-
-            # 2. 구매보조금 지급현황 페이지 접속
-            print("📍 구매보조금 지급현황 페이지 접속 중...")
-            subsidy_url = f"{self.base_url}/nportal/buySupprt/initSubsidyPaymentCheckAction.do"
-            subsidy_response = self.session.get(subsidy_url)
-            print(f"   상태 코드: {subsidy_response.status_code}")
-
-            return True
-
-        except Exception as e:
-            print(f"❌ 세션 초기화 실패: {e}")
-            return False
-
-    def get_all_regions(self):
-        """전국 모든 지역 정보를 체계적으로 반환"""
-        regions = []
-
-        # 1. 서울특별시
-        regions.extend([
-            {'code': '1100', 'name': '서울특별시', 'category': '특별시'}
-        ])
-
-        # 2. 수도권 (경기도)
-        gyeonggi_regions = [
-            {'code': '4111', 'name': '수원시', 'category': '경기도'},
-            {'code': '4113', 'name': '성남시', 'category': '경기도'},
-            {'code': '4115', 'name': '의정부시', 'category': '경기도'},
-            {'code': '4117', 'name': '안양시', 'category': '경기도'},
-            {'code': '4119', 'name': '부천시', 'category': '경기도'},
-            {'code': '4121', 'name': '광명시', 'category': '경기도'},
-            {'code': '4122', 'name': '평택시', 'category': '경기도'},
-            {'code': '4125', 'name': '동두천시', 'category': '경기도'},
-            {'code': '4127', 'name': '안산시', 'category': '경기도'},
-            {'code': '4128', 'name': '고양시', 'category': '경기도'},
-            {'code': '4129', 'name': '과천시', 'category': '경기도'},
-            {'code': '4131', 'name': '구리시', 'category': '경기도'},
-            {'code': '4136', 'name': '남양주시', 'category': '경기도'},
-            {'code': '4137', 'name': '오산시', 'category': '경기도'},
-            {'code': '4139', 'name': '시흥시', 'category': '경기도'},
-            {'code': '4141', 'name': '군포시', 'category': '경기도'},
-            {'code': '4143', 'name': '의왕시', 'category': '경기도'},
-            {'code': '4145', 'name': '하남시', 'category': '경기도'},
-            {'code': '4146', 'name': '용인시', 'category': '경기도'},
-            {'code': '4148', 'name': '파주시', 'category': '경기도'},
-            {'code': '4150', 'name': '이천시', 'category': '경기도'},
-            {'code': '4155', 'name': '안성시', 'category': '경기도'},
-            {'code': '4157', 'name': '김포시', 'category': '경기도'},
-            {'code': '4159', 'name': '화성시', 'category': '경기도'},
-            {'code': '4161', 'name': '광주시', 'category': '경기도'},
-            {'code': '4163', 'name': '양주시', 'category': '경기도'},
-            {'code': '4165', 'name': '포천시', 'category': '경기도'},
-            {'code': '4167', 'name': '여주시', 'category': '경기도'},
-            {'code': '4180', 'name': '연천군', 'category': '경기도'},
-            {'code': '4182', 'name': '가평군', 'category': '경기도'},
-            {'code': '4183', 'name': '양평군', 'category': '경기도'}
-        ]
-        regions.extend(gyeonggi_regions)
-
-        # 3. 인천광역시
-        regions.extend([
-            {'code': '2800', 'name': '인천광역시', 'category': '광역시'}
-        ])
-
-        # 4. 광역시들
-        metro_cities = [
-            {'code': '2600', 'name': '부산광역시', 'category': '광역시'},
-            {'code': '2700', 'name': '대구광역시', 'category': '광역시'},
-            {'code': '2900', 'name': '광주광역시', 'category': '광역시'},
-            {'code': '3000', 'name': '대전광역시', 'category': '광역시'},
-            {'code': '3100', 'name': '울산광역시', 'category': '광역시'}
-        ]
-        regions.extend(metro_cities)
-
-        # 5. 세종특별자치시
-        regions.extend([
-            {'code': '3611', 'name': '세종특별자치시', 'category': '특별자치시'}
-        ])
-
-        # 6. 강원도
-        gangwon_regions = [
-            {'code': '4211', 'name': '춘천시', 'category': '강원도'},
-            {'code': '4213', 'name': '원주시', 'category': '강원도'},
-            {'code': '4215', 'name': '강릉시', 'category': '강원도'},
-            {'code': '4217', 'name': '동해시', 'category': '강원도'},
-            {'code': '4219', 'name': '태백시', 'category': '강원도'},
-            {'code': '4221', 'name': '속초시', 'category': '강원도'},
-            {'code': '4223', 'name': '삼척시', 'category': '강원도'},
-            {'code': '4272', 'name': '홍천군', 'category': '강원도'},
-            {'code': '4273', 'name': '횡성군', 'category': '강원도'},
-            {'code': '4275', 'name': '영월군', 'category': '강원도'},
-            {'code': '4276', 'name': '평창군', 'category': '강원도'},
-            {'code': '4277', 'name': '정선군', 'category': '강원도'},
-            {'code': '4278', 'name': '철원군', 'category': '강원도'},
-            {'code': '4279', 'name': '화천군', 'category': '강원도'},
-            {'code': '4280', 'name': '양구군', 'category': '강원도'},
-            {'code': '4281', 'name': '인제군', 'category': '강원도'},
-            {'code': '4282', 'name': '고성군', 'category': '강원도'},
-            {'code': '4283', 'name': '양양군', 'category': '강원도'}
-        ]
-        regions.extend(gangwon_regions)
-
-        # 7. 충청북도
-        chungbuk_regions = [
-            {'code': '4311', 'name': '청주시', 'category': '충청북도'},
-            {'code': '4313', 'name': '충주시', 'category': '충청북도'},
-            {'code': '4315', 'name': '제천시', 'category': '충청북도'},
-            {'code': '4372', 'name': '보은군', 'category': '충청북도'},
-            {'code': '4373', 'name': '옥천군', 'category': '충청북도'},
-            {'code': '43745', 'name': '증평군', 'category': '충청북도'},
-            {'code': '4374', 'name': '영동군', 'category': '충청북도'},
-            {'code': '4375', 'name': '진천군', 'category': '충청북도'},
-            {'code': '4376', 'name': '괴산군', 'category': '충청북도'},
-            {'code': '4377', 'name': '음성군', 'category': '충청북도'},
-            {'code': '4380', 'name': '단양군', 'category': '충청북도'}
-        ]
-        regions.extend(chungbuk_regions)
-
-        # 8. 충청남도
-        chungnam_regions = [
-            {'code': '4413', 'name': '천안시', 'category': '충청남도'},
-            {'code': '4415', 'name': '공주시', 'category': '충청남도'},
-            {'code': '4418', 'name': '보령시', 'category': '충청남도'},
-            {'code': '4420', 'name': '아산시', 'category': '충청남도'},
-            {'code': '4421', 'name': '서산시', 'category': '충청남도'},
-            {'code': '4423', 'name': '논산시', 'category': '충청남도'},
-            {'code': '4425', 'name': '계룡시', 'category': '충청남도'},
-            {'code': '4427', 'name': '당진시', 'category': '충청남도'},
-            {'code': '4471', 'name': '금산군', 'category': '충청남도'},
-            {'code': '4476', 'name': '부여군', 'category': '충청남도'},
-            {'code': '4477', 'name': '서천군', 'category': '충청남도'},
-            {'code': '4479', 'name': '청양군', 'category': '충청남도'},
-            {'code': '4480', 'name': '홍성군', 'category': '충청남도'},
-            {'code': '4481', 'name': '예산군', 'category': '충청남도'},
-            {'code': '44825', 'name': '태안군', 'category': '충청남도'}
-        ]
-        regions.extend(chungnam_regions)
-
-        # 9. 전라북도
-        jeonbuk_regions = [
-            {'code': '4511', 'name': '전주시', 'category': '전라북도'},
-            {'code': '4513', 'name': '군산시', 'category': '전라북도'},
-            {'code': '4514', 'name': '익산시', 'category': '전라북도'},
-            {'code': '4518', 'name': '정읍시', 'category': '전라북도'},
-            {'code': '4519', 'name': '남원시', 'category': '전라북도'},
-            {'code': '4521', 'name': '김제시', 'category': '전라북도'},
-            {'code': '4571', 'name': '완주군', 'category': '전라북도'},
-            {'code': '4572', 'name': '진안군', 'category': '전라북도'},
-            {'code': '4573', 'name': '무주군', 'category': '전라북도'},
-            {'code': '4574', 'name': '장수군', 'category': '전라북도'},
-            {'code': '4575', 'name': '임실군', 'category': '전라북도'},
-            {'code': '4577', 'name': '순창군', 'category': '전라북도'},
-            {'code': '4579', 'name': '고창군', 'category': '전라북도'},
-            {'code': '4580', 'name': '부안군', 'category': '전라북도'}
-        ]
-        regions.extend(jeonbuk_regions)
-
-        # 10. 전라남도
-        jeonnam_regions = [
-            {'code': '4611', 'name': '목포시', 'category': '전라남도'},
-            {'code': '4613', 'name': '여수시', 'category': '전라남도'},
-            {'code': '4615', 'name': '순천시', 'category': '전라남도'},
-            {'code': '4617', 'name': '나주시', 'category': '전라남도'},
-            {'code': '4623', 'name': '광양시', 'category': '전라남도'},
-            {'code': '4671', 'name': '담양군', 'category': '전라남도'},
-            {'code': '4672', 'name': '곡성군', 'category': '전라남도'},
-            {'code': '4673', 'name': '구례군', 'category': '전라남도'},
-            {'code': '4677', 'name': '고흥군', 'category': '전라남도'},
-            {'code': '4678', 'name': '보성군', 'category': '전라남도'},
-            {'code': '4679', 'name': '화순군', 'category': '전라남도'},
-            {'code': '4680', 'name': '장흥군', 'category': '전라남도'},
-            {'code': '4681', 'name': '강진군', 'category': '전라남도'},
-            {'code': '4682', 'name': '해남군', 'category': '전라남도'},
-            {'code': '4683', 'name': '영암군', 'category': '전라남도'},
-            {'code': '4684', 'name': '무안군', 'category': '전라남도'},
-            {'code': '4686', 'name': '함평군', 'category': '전라남도'},
-            {'code': '4687', 'name': '영광군', 'category': '전라남도'},
-            {'code': '4688', 'name': '장성군', 'category': '전라남도'},
-            {'code': '4689', 'name': '완도군', 'category': '전라남도'},
-            {'code': '4690', 'name': '진도군', 'category': '전라남도'},
-            {'code': '4691', 'name': '신안군', 'category': '전라남도'}
-        ]
-        regions.extend(jeonnam_regions)
-
-        # 11. 경상북도
-        gyeongbuk_regions = [
-            {'code': '4711', 'name': '포항시', 'category': '경상북도'},
-            {'code': '4713', 'name': '경주시', 'category': '경상북도'},
-            {'code': '4715', 'name': '김천시', 'category': '경상북도'},
-            {'code': '4717', 'name': '안동시', 'category': '경상북도'},
-            {'code': '4719', 'name': '구미시', 'category': '경상북도'},
-            {'code': '4721', 'name': '영주시', 'category': '경상북도'},
-            {'code': '4723', 'name': '영천시', 'category': '경상북도'},
-            {'code': '4725', 'name': '상주시', 'category': '경상북도'},
-            {'code': '4728', 'name': '문경시', 'category': '경상북도'},
-            {'code': '4729', 'name': '경산시', 'category': '경상북도'},
-            {'code': '4773', 'name': '의성군', 'category': '경상북도'},
-            {'code': '4775', 'name': '청송군', 'category': '경상북도'},
-            {'code': '4776', 'name': '영양군', 'category': '경상북도'},
-            {'code': '4777', 'name': '영덕군', 'category': '경상북도'},
-            {'code': '4782', 'name': '청도군', 'category': '경상북도'},
-            {'code': '4783', 'name': '고령군', 'category': '경상북도'},
-            {'code': '4784', 'name': '성주군', 'category': '경상북도'},
-            {'code': '4785', 'name': '칠곡군', 'category': '경상북도'},
-            {'code': '4790', 'name': '예천군', 'category': '경상북도'},
-            {'code': '4792', 'name': '봉화군', 'category': '경상북도'},
-            {'code': '4793', 'name': '울진군', 'category': '경상북도'},
-            {'code': '4794', 'name': '울릉군', 'category': '경상북도'}
-        ]
-        regions.extend(gyeongbuk_regions)
-
-        # 12. 경상남도
-        gyeongnam_regions = [
-            {'code': '4812', 'name': '창원시', 'category': '경상남도'},
-            {'code': '4817', 'name': '진주시', 'category': '경상남도'},
-            {'code': '4822', 'name': '통영시', 'category': '경상남도'},
-            {'code': '4824', 'name': '사천시', 'category': '경상남도'},
-            {'code': '4825', 'name': '김해시', 'category': '경상남도'},
-            {'code': '4827', 'name': '밀양시', 'category': '경상남도'},
-            {'code': '4831', 'name': '거제시', 'category': '경상남도'},
-            {'code': '4833', 'name': '양산시', 'category': '경상남도'},
-            {'code': '4872', 'name': '의령군', 'category': '경상남도'},
-            {'code': '4873', 'name': '함안군', 'category': '경상남도'},
-            {'code': '4874', 'name': '창녕군', 'category': '경상남도'},
-            {'code': '4882', 'name': '고성군', 'category': '경상남도'},
-            {'code': '4884', 'name': '남해군', 'category': '경상남도'},
-            {'code': '4885', 'name': '하동군', 'category': '경상남도'},
-            {'code': '4886', 'name': '산청군', 'category': '경상남도'},
-            {'code': '4887', 'name': '함양군', 'category': '경상남도'},
-            {'code': '4888', 'name': '거창군', 'category': '경상남도'},
-            {'code': '4889', 'name': '합천군', 'category': '경상남도'}
-        ]
-        regions.extend(gyeongnam_regions)
-
-        # 13. 제주특별자치도
-        regions.extend([
-            {'code': '5000', 'name': '제주특별자치도', 'category': '특별자치도'}
-        ])
-
-        # 14. 기타
-        regions.extend([
-            {'code': '9999', 'name': '한국환경공단', 'category': '기타'}
-        ])
-
-        return regions
-
-    def get_local_car_detail(self, year="2025", local_cd="1100", car_type="11", local_nm="서울특별시"):
-        """특정 지역의 차량별 보조금 상세 정보 가져오기"""
-        try:
-            # psPopupLocalCarModelPrice.do로 POST 요청
-            url = f"{self.base_url}/nportal/buySupprt/psPopupLocalCarModelPrice.do"
-
-            data = {
-                'year': year,
-                'local_cd': local_cd,
-                'car_type': car_type,
-                'local_nm': local_nm
-            }
-
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Referer': f"{self.base_url}/nportal/buySupprt/psPopupLocalCarPirce.do",
-                'Origin': self.base_url,
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-
-            response = self.session.post(url, data=data, headers=headers)
+    def get_target_filename(self, file_type="csv", year=None, car_type=None):
+        """연도 기준 파일명 생성 (기본: 대상 연도, 차종을 지정하면 {연도}_{차종})"""
+        base_name = str(year if year else self.target_year)
+        if car_type:
+            base_name = f"{base_name}_{car_type}"
 
-            if response.status_code == 200:
-                return response.text
-            else:
-                print(f"   ❌ 상세 페이지 응답 실패: {response.status_code}")
-                return None
+        if file_type == "json":
+            return f"{base_name}.json"
+        else:
+            return f"{base_name}.csv"
 
-        except Exception as e:
-            print(f"   ❌ 상세 페이지 요청 실패: {e}")
-            return None
+    def get_all_regions(self, year=None, car_type="11"):
+        """연도별 전국 지역 목록 (기본: 대상 연도) - 광역시도 순서대로 정렬됨"""
+        return super().get_all_regions(year if year else self.target_year, car_type)
 
-    def parse_vehicle_data(self, html_content):
-        """HTML에서 차량 데이터 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        vehicles = []
-
-        # 테이블 찾기
-        table = soup.find('table', class_='table01')
-        if not table:
-            table = soup.find('table')
-
-        if table:
-            # 헤더 분석
-            headers = []
-            thead = table.find('thead')
-            if thead:
-                header_row = thead.find('tr')
-                if header_row:
-                    for th in header_row.find_all(['th', 'td']):
-                        headers.append(th.get_text(strip=True))
-
-            # 데이터 행 처리
-            tbody = table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 3:
-                        row_data = [cell.get_text(strip=True) for cell in cells]
-
-                        # 빈 데이터나 "자료가 없습니다" 제외
-                        if row_data[0] and '자료가 없습니다' not in ''.join(row_data):
-                            vehicle = self.map_vehicle_data(headers, row_data)
-                            if vehicle.get('manufacturer') and vehicle.get('model'):
-                                vehicles.append(vehicle)
-
-        return vehicles
-
-    def map_vehicle_data(self, headers, row_data):
-        """헤더와 행 데이터를 매핑하여 차량 정보 생성"""
-        vehicle = {}
-
-        # 인덱스 찾기
-        manufacturer_idx = 0
-        model_idx = 1
-        detail_idx = 2
-
-        for i, h in enumerate(headers):
-            if '제조사' in h:
-                manufacturer_idx = i
-            elif '차종' in h and '모델명' not in h:
-                model_idx = i
-            elif '모델명' in h:
-                detail_idx = i
-
-        # 데이터 매핑
-        if manufacturer_idx < len(row_data):
-            vehicle['manufacturer'] = row_data[manufacturer_idx]
-        if model_idx < len(row_data):
-            vehicle['model'] = row_data[model_idx]
-        if detail_idx < len(row_data) and detail_idx != model_idx:
-            vehicle['model_detail'] = row_data[detail_idx]
-
-        # 보조금 정보
-        for i, h in enumerate(headers):
-            if i < len(row_data):
-                if '국비' in h and '만원' in h:
-                    vehicle['national_subsidy'] = row_data[i]
-                elif '지방비' in h and '만원' in h:
-                    vehicle['local_subsidy'] = row_data[i]
-                elif ('보조금' in h or '합계' in h) and '만원' in h and '국비' not in h and '지방비' not in h:
-                    vehicle['total_subsidy'] = row_data[i]
-
-        return vehicle
+    def open_csv_writer(self, filename=None, year=None, parts=1):
+        """지역 순서대로 바로 기록하는 스트리밍 CSV 저장기 생성
 
-    def save_all_data_to_csv(self, all_data, filename=None):
-        """모든 지역 데이터를 하나의 CSV 파일로 저장"""
-        if not all_data:
-            print("❌ 저장할 데이터가 없습니다.")
-            return
+        parts: 한 파일에 합칠 (연도, 차종) 조합 수 - 지역마다 모든 조합이 끝나야 기록
+        """
+        if year is None:
+            year = self.target_year
 
-        # 파일명이 지정되지 않으면 대상 연도로 생성
+        # 파일명이 지정되지 않으면 연도로 생성
         if filename is None:
-            filename = self.get_target_filename("csv")
+            filename = self.get_target_filename("csv", year)
 
         filepath = os.path.join(self.csv_folder, filename)
-        all_vehicles = []
+        return StreamingCSVWriter(filepath, self.get_all_regions(year), int(year), parts=parts)
 
+    def finish_csv(self, writer, region_total):
+        """스트리밍 CSV 마무리 (임시 파일 → 대상 파일 교체) 및 결과 출력"""
         try:
-            # 지역 정보와 카테고리 매핑
-            region_category_map = {}
-            for region in self.get_all_regions():
-                region_category_map[region['name']] = region['category']
-
-            # 모든 지역의 데이터를 하나로 합치기
-            for region_name, vehicles in all_data.items():
-                for vehicle in vehicles:
-                    # 각 차량 데이터에 지역 정보와 광역시도 정보 추가
-                    vehicle_with_region = vehicle.copy()
-                    vehicle_with_region['region'] = region_name
-                    vehicle_with_region['category'] = region_category_map.get(region_name, '기타')
-                    all_vehicles.append(vehicle_with_region)
-
-            if not all_vehicles:
+            filepath = writer.commit()
+            if not filepath:
                 print("❌ 통합할 차량 데이터가 없습니다.")
-                return
-
-            # DataFrame 생성
-            df = pd.DataFrame(all_vehicles)
-
-            # 크롤링 시점 정보 추가
-            crawl_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df['crawl_date'] = crawl_datetime
-            df['data_year'] = self.target_year
-
-            # 컬럼 순서 정리
-            column_order = ['data_year', 'region', 'category', 'manufacturer', 'model', 'model_detail',
-                            'national_subsidy', 'local_subsidy', 'total_subsidy', 'crawl_date']
-            existing_columns = [col for col in column_order if col in df.columns]
-            other_columns = [col for col in df.columns if col not in column_order]
-            final_columns = existing_columns + other_columns
-
-            df = df[final_columns]
-
-            # 컬럼명 한국어로 변경
-            column_mapping = {
-                'data_year': '데이터연도',
-                'region': '지역',
-                'category': '광역시도',
-                'manufacturer': '제조사',
-                'model': '차종',
-                'model_detail': '모델명',
-                'national_subsidy': '국비보조금(만원)',
-                'local_subsidy': '지방비보조금(만원)',
-                'total_subsidy': '총보조금(만원)',
-                'crawl_date': '수집일시'
-            }
-
-            df = df.rename(columns=column_mapping)
-
-            # 의도한 순서로 정렬하기 위한 순서 매핑
-            category_order = {
-                '특별시': 1,
-                '경기도': 2,
-                '광역시': 3,
-                '특별자치시': 4,
-                '강원도': 5,
-                '충청북도': 6,
-                '충청남도': 7,
-                '전라북도': 8,
-                '전라남도': 9,
-                '경상북도': 10,
-                '경상남도': 11,
-                '특별자치도': 12,
-                '기타': 13
-            }
-
-            # 정렬용 컬럼 추가
-            df['category_order'] = df['광역시도'].map(category_order).fillna(999)
-
-            # 의도한 순서대로 정렬: 광역시도 순서 > 지역 > 제조사 > 차종
-            df = df.sort_values(['category_order', '지역', '제조사', '차종'], na_position='last')
-
-            # 정렬용 컬럼 제거
-            df = df.drop('category_order', axis=1)
+                return None
 
-            # CSV 저장
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
-            print(f"\n📊 통합 CSV 저장 완료: {filename}")
-            print(f"   - 데이터 연도: {self.target_year}년")
-            print(f"   - 총 {len(all_data)}개 지역, {len(all_vehicles)}개 차량 데이터")
-            print(f"   - 수집 시점: {crawl_datetime}")
+            print(f"\n📊 통합 CSV 저장 완료: {os.path.basename(filepath)}")
+            print(f"   - 데이터 연도: {writer.data_year}년")
+            print(f"   - 총 {region_total}개 지역, {writer.stats.row_count}개 차량 데이터")
+            print(f"   - 수집 시점: {writer.crawl_date}")
             print(f"   - 파일 위치: {filepath}")
             print(f"   - 정렬 순서: 서울 → 경기도 → 광역시 → 기타 순")
 
             return filepath
 
         except Exception as e:
+            writer.discard()
             print(f"❌ 통합 CSV 저장 실패: {e}")
             return None
 
-    def crawl_all_regions(self, year=None, car_type="11"):
-        """모든 지역의 보조금 데이터 크롤링"""
-        # 연도가 지정되지 않으면 대상 연도 사용
-        if year is None:
-            year = str(self.target_year)
+    def save_all_data_to_csv(self, all_data, filename=None):
+        """모든 지역 데이터를 하나의 CSV 파일로 저장 (이미 수집된 결과용)"""
+        if not all_data:
+            print("❌ 저장할 데이터가 없습니다.")
+            return
 
-        print(f"🚀 {year}년 전국 전기차 보조금 크롤링 시작...")
+        writer = self.open_csv_writer(filename)
 
-        # 1. 세션 초기화
-        if not self.get_session_cookies():
+        # 결과는 지역명 기준이므로 같은 이름의 지역(예: 고성군)은 목록상 마지막 지역으로 한 번만 기록
+        regions = self.get_all_regions()
+        regions_by_name = {region['name']: region for region in regions}
+        for region in regions:
+            if regions_by_name[region['name']] is region:
+                writer.add_region(region, all_data.get(region['name'], []))
+            else:
+                writer.add_region(region, [])
+
+        return self.finish_csv(writer, len(all_data))
+
+    def get_region_state(self, year, car_type):
+        """(연도, 차종)별 지역 변경 추적 상태"""
+        with self._state_lock:
+            key = (str(year), car_type)
+            if key not in self.region_states:
+                self.region_states[key] = RegionStateStore('csv', str(year), car_type)
+            return self.region_states[key]
+
+    def get_region_history(self, year, car_type):
+        """(연도, 차종)별 지역 수집 이력"""
+        with self._state_lock:
+            key = (str(year), car_type)
+            if key not in self.region_histories:
+                self.region_histories[key] = RegionHistory(str(year), car_type,
+                                                           probe_interval_days=self.probe_interval_days)
+            return self.region_histories[key]
+
+    def skip_region(self, year, car_type, region):
+        """데이터가 계속 없고 확인 주기가 아닌 지역이면 True (캐시 재생 모드는 항상 전체 파싱)"""
+        if not self.skip_empty or self.replay_from_cache:
+            return False
+        return not self.get_region_history(year, car_type).should_crawl(region)
+
+    def record_outcome(self, year, car_type, region, status):
+        """지역 수집 결과를 이력에 기록 (캐시 재생 모드 제외)"""
+        if not self.replay_from_cache:
+            self.get_region_history(year, car_type).record(region, status)
+
+    def save_region_states(self):
+        """지역 상태/수집 이력 저장 및 변경 리포트 출력"""
+        for state in self.region_states.values():
+            state.save_state()
+            state.save_report()
+        for history in self.region_histories.values():
+            history.save()
+            history.print_summary()
+
+    def parse_region_html(self, year, car_type, region, detail_html):
+        """응답이 이전 실행과 같으면 이전 파싱 결과를 재사용하고, 다르면 새로 파싱
+
+        반환값: (상태, 차량 리스트) - 상태는 'success', 'no_data', 'failed' 중 하나
+        """
+        if not detail_html:
+            self.record_outcome(year, car_type, region, 'failed')
+            return 'failed', []
+
+        state = self.get_region_state(year, car_type)
+        content_hash = state.content_hash(detail_html)
+
+        # 캐시 재생 모드는 파서 확인용이므로 항상 다시 파싱
+        vehicles = None if self.replay_from_cache else state.get_unchanged(region, content_hash)
+        if vehicles is None:
+            vehicles = self.parse_vehicle_data(detail_html)
+            state.record(region, content_hash, vehicles)
+
+        status = 'success' if vehicles else 'no_data'
+        self.record_outcome(year, car_type, region, status)
+        if self.checkpoint:
+            self.checkpoint.record(year, car_type, region, status, content_hash, vehicles)
+
+        return status, vehicles
+
+    def resume_region(self, year, car_type, region):
+        """중단된 이전 실행에서 끝난 지역이면 저널의 결과 반환, 아니면 None"""
+        if not self.checkpoint:
             return None
 
-        # 2. 전체 지역 목록 가져오기 (내장된 지역 리스트 사용)
-        regions = self.get_all_regions()
-        print(f"\n📍 총 {len(regions)}개 지역 크롤링 시도 예정")
+        entry = self.checkpoint.get(year, car_type, region)
+        if not entry:
+            return None
 
-        # 지역 카테고리별 개수 출력
-        category_counts = {}
-        for region in regions:
-            category = region['category']
-            category_counts[category] = category_counts.get(category, 0) + 1
+        # 변경 추적 상태와 수집 이력도 이전 실행의 결과로 갱신 (변경 여부 판단 유지)
+        self.get_region_state(year, car_type).record(region, entry['hash'], entry['vehicles'])
+        self.record_outcome(year, car_type, region, entry['status'])
+        return entry['status'], entry['vehicles']
+
+    def crawl_region(self, year, car_type, region):
+        """단일 지역 수집 (워커 스레드에서 실행)"""
+        resumed = self.resume_region(year, car_type, region)
+        if resumed:
+            return resumed
+
+        if self.skip_region(year, car_type, region):
+            return 'skipped', []
+
+        detail_html = self.get_local_car_detail(year, region['code'], car_type, region['name'])
+        return self.parse_region_html(year, car_type, region, detail_html)
+
+    def crawl_combinations(self, combinations, regions=None, on_region=None):
+        """(연도, 차종) 조합 × 지역 작업 전체를 하나의 워커 풀로 수집 (세션 초기화는 한 번)
+
+        regions를 주지 않으면 조합마다 해당 연도의 지역 목록(지역 레지스트리)을 사용
+        on_region(연도, 차종, 지역, 차량 리스트)를 넘기면 지역이 끝날 때마다 (완료 순서대로) 호출
+        차량 리스트는 on_region 호출이 끝나면 버리므로, 차량이 필요한 출력은 on_region에서 기록해야 함
+        반환값: {(연도, 차종): {지역명: 차량 수}} (데이터가 있는 지역만) - 세션 초기화 실패 시 None
+        """
+        # 1. 세션 초기화 (캐시 재생 모드에서는 네트워크 미사용)
+        if self.replay_from_cache:
+            print("💾 캐시 재생 모드: 저장된 응답만 다시 파싱합니다")
+        elif not self.ensure_session():
+            return None
 
-        print("\n📊 지역별 분포:")
-        for category, count in category_counts.items():
-            print(f"   {category}: {count}개 지역")
+        regions_by_combination = {
+            (year, car_type): regions if regions is not None else self.get_all_regions(year, car_type)
+            for year, car_type in combinations
+        }
 
-        all_data = {}
-        success_count = 0
-        fail_count = 0
-        no_data_count = 0
+        print(f"\n⚙️ 동시 요청: 워커 {self.max_workers}개, 최대 초당 {self.max_requests_per_second}건")
 
-        # 3. 각 지역별 데이터 수집
-        for i, region in enumerate(regions):
-            local_cd = region['code']
-            local_nm = region['name']
-            category = region['category']
+        tasks = [(year, car_type, i) for year, car_type in combinations
+                 for i in range(len(regions_by_combination[(year, car_type)]))]
+        vehicle_counts = {combination: [0] * len(regions_by_combination[combination]) for combination in combinations}
+        counts = {combination: {'success': 0, 'no_data': 0, 'failed': 0, 'skipped': 0} for combination in combinations}
+        show_combination = len(combinations) > 1
+
+        # 2. 모든 (연도, 차종, 지역) 작업을 공유 워커 풀에서 병렬 처리
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.crawl_region, year, car_type, regions_by_combination[(year, car_type)][i]):
+                    (year, car_type, i)
+                for year, car_type, i in tasks
+            }
 
-            print(f"\n🔍 [{i + 1}/{len(regions)}] {category} > {local_nm} ({local_cd}) 크롤링 중...")
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                year, car_type, i = futures[future]
+                region = regions_by_combination[(year, car_type)][i]
+                status, vehicles = future.result()
+                vehicle_counts[(year, car_type)][i] = len(vehicles)
+                counts[(year, car_type)][status] += 1
+                if on_region:
+                    on_region(year, car_type, region, vehicles)
 
-            # 상세 데이터 가져오기
-            detail_html = self.get_local_car_detail(year, local_cd, car_type, local_nm)
+                # 건너뛴 지역은 마지막 요약에서만 출력
+                if status == 'skipped':
+                    continue
 
-            if detail_html:
-                # 데이터 파싱
-                vehicles = self.parse_vehicle_data(detail_html)
+                label = f"{year}년 차종 {car_type} | " if show_combination else ""
+                print(f"\n🔍 [{done_count}/{len(tasks)}] {label}{region['category']} > {region['name']} ({region['code']})")
 
-                if vehicles:
-                    all_data[local_nm] = vehicles
-                    success_count += 1
+                if status == 'success':
                     print(f"   ✅ {len(vehicles)}개 차량 데이터 수집 완료")
 
                     # 샘플 출력 (처음 2개만)
                     for j, v in enumerate(vehicles[:2]):
                         manufacturer = v.get('manufacturer', 'N/A')
                         model = v.get('model_detail', v.get('model', 'N/A'))
-                        subsidy = v.get('total_subsidy', 'N/A')
+                        subsidy = v.amount_text('total_subsidy') or 'N/A'
                         print(f"      [{j + 1}] {manufacturer} {model}: {subsidy}만원")
-                else:
+                elif status == 'no_data':
                     print(f"   ⚠️ 데이터 없음 (해당 지역 보조금 정보 없음)")
-                    no_data_count += 1
-            else:
-                print(f"   ❌ 페이지 로드 실패 (지역 존재하지 않거나 접근 불가)")
-                fail_count += 1
+                else:
+                    print(f"   ❌ 페이지 로드 실패 (지역 존재하지 않거나 접근 불가)")
 
-            # 요청 간격 (서버 부하 방지)
-            time.sleep(0.5)
+                # 진행상황 중간 보고 (매 50개 작업마다)
+                if done_count % 50 == 0:
+                    print(f"\n📈 진행상황: {done_count}/{len(tasks)} 시도 완료")
+                    print(f"   ✅ 데이터 수집 성공: {sum(c['success'] for c in counts.values())}개 지역")
+                    print(f"   ⚠️ 데이터 없음: {sum(c['no_data'] for c in counts.values())}개 지역")
+                    print(f"   ❌ 접근 실패: {sum(c['failed'] for c in counts.values())}개 지역")
 
-            # 진행상황 중간 보고 (매 50개 지역마다)
-            if (i + 1) % 50 == 0:
-                print(f"\n📈 진행상황: {i + 1}/{len(regions)} 시도 완료")
-                print(f"   ✅ 데이터 수집 성공: {success_count}개 지역")
-                print(f"   ⚠️ 데이터 없음: {no_data_count}개 지역")
-                print(f"   ❌ 접근 실패: {fail_count}개 지역")
+        if self.response_cache:
+            self.response_cache.print_stats()
+
+        # 지역 목록 순서대로 결과 정리 (완료 순서와 무관)
+        results = {}
+        for (year, car_type), region_counts in vehicle_counts.items():
+            regions = regions_by_combination[(year, car_type)]
+            results[(year, car_type)] = count_by_region_name(regions, region_counts)
+
+            self.print_crawl_summary(year, car_type, len(regions), counts[(year, car_type)])
+
+        return results
+
+    def print_crawl_summary(self, year, car_type, region_total, counts):
+        """(연도, 차종)별 크롤링 결과 요약 출력"""
+        success_count = counts['success']
 
         print(f"\n{'=' * 80}")
-        print(f"🎯 크롤링 완료 요약")
+        print(f"🎯 크롤링 완료 요약 ({year}년, 차종 {car_type})")
         print(f"{'=' * 80}")
-        print(f"📊 총 시도: {len(regions)}개 지역")
+        print(f"📊 총 시도: {region_total}개 지역")
         print(f"✅ 데이터 수집 성공: {success_count}개 지역")
-        print(f"⚠️ 데이터 없음: {no_data_count}개 지역")
-        print(f"❌ 접근 실패: {fail_count}개 지역")
+        print(f"⚠️ 데이터 없음: {counts['no_data']}개 지역")
+        print(f"❌ 접근 실패: {counts['failed']}개 지역")
+        if counts.get('skipped'):
+            print(f"⏭️ 요청 생략 (계속 데이터 없음): {counts['skipped']}개 지역")
         if success_count > 0:
             print(f"📈 실제 데이터 보유 지역: {success_count}개")
-            print(f"📊 평균 성공률: {success_count / (success_count + no_data_count + fail_count) * 100:.1f}%")
+            print(f"📊 평균 성공률: {success_count / region_total * 100:.1f}%")
+
+    def crawl_all_regions(self, year=None, car_type="11", on_region=None):
+        """모든 지역의 보조금 데이터 크롤링 (단일 연도/차종)
+
+        on_region(region, vehicles)를 넘기면 지역이 끝날 때마다 (완료 순서대로) 호출
+        반환값: {지역명: 차량 수} (데이터가 있는 지역만)
+        """
+        # 연도가 지정되지 않으면 대상 연도 사용
+        if year is None:
+            year = str(self.target_year)
+
+        print(f"🚀 {year}년 전국 전기차 보조금 크롤링 시작...")
+
+        # 전체 지역 목록 가져오기 (목록 페이지에서 찾은 지역, 캐시 유효 기간 내에는 재조회 안 함)
+        regions = self.get_all_regions(year, car_type)
+        print(f"\n📍 총 {len(regions)}개 지역 크롤링 시도 예정")
+
+        # 지역 카테고리별 개수 출력
+        category_counts = {}
+        for region in regions:
+            category = region['category']
+            category_counts[category] = category_counts.get(category, 0) + 1
+
+        print("\n📊 지역별 분포:")
+        for category, count in category_counts.items():
+            print(f"   {category}: {count}개 지역")
+
+        region_callback = (lambda _year, _car_type, region, vehicles: on_region(region, vehicles)) if on_region else None
 
-        return all_data
+        results = self.crawl_combinations([(year, car_type)], regions, region_callback)
+        if results is None:
+            return None
+
+        return results[(year, car_type)]
+
+    def save_summary_json(self, summary, filename=None, year=None):
+        """전체 요약 JSON 파일 저장 (summary: 지역명 → 차량 dict 목록 RegionSpool, 한 지역씩 이어 씀)"""
+        if year is None:
+            year = self.target_year
 
-    def save_summary_json(self, data, filename=None):
-        """전체 요약 JSON 파일 저장"""
         if filename is None:
-            filename = self.get_target_filename("json")
+            filename = self.get_target_filename("json", year)
 
         filepath = os.path.join(self.csv_folder, filename)
 
         # 메타데이터 추가
-        summary_data = {
+        summary_info = {
             "crawl_info": {
                 "crawl_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "data_year": self.target_year,
-                "total_regions": len(data),
-                "total_vehicles": sum(len(vehicles) for vehicles in data.values())
-            },
-            "data": data
+                "data_year": int(year),
+                "total_regions": len(summary),
+                "total_vehicles": summary.record_count
+            }
         }
+        entries = summary.items()
+
+        # 압축 형식: compact_summary와 같은 구조 (스키마 헤더 + 지역별 값 배열)
+        if self.compact_json:
+            summary_info = {**compact_header(), **summary_info, 'columns': schema_header(SUMMARY_COLUMNS)}
+            entries = ((region, pack_rows(vehicles, SUMMARY_COLUMNS)) for region, vehicles in entries)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
-        print(f"📁 전체 요약 JSON 저장 완료: {filename}")
+        # 임시 파일에 쓴 뒤 교체 (중간에 종료되어도 기존 파일 유지)
+        dump_json_stream(summary_info, entries, filepath, "data", compact=self.compact_json)
+        print(f"📁 전체 요약 JSON 저장 완료: {filename}" + (" (압축 형식)" if self.compact_json else ""))
 
     def run(self):
-        """실행"""
-        print("=" * 70)
-        print(f"🚗 {self.target_year}년 전국 전기차 보조금 크롤링 시작")
-        print("=" * 70)
+        """실행 (대상 연도, 승용차) - 반환값: {지역명: 차량 수}"""
+        results = self.run_matrix([self.target_year])
+        if results is None:
+            return None
 
-        data = self.crawl_all_regions()
+        return results[(str(self.target_year), "11")] or None
 
-        if data:
-            total_count = sum(len(vehicles) for vehicles in data.values())
-            print(f"\n🎉 데이터 수집 완료!")
-            print(f"📊 실제 수집: {len(data)}개 지역, {total_count}개 차량 데이터")
+    def run_matrix(self, years, car_types=("11",), split_car_types=False):
+        """여러 연도 × 차종을 한 번에 수집해 연도별 csv/{연도}.csv로 저장
 
-            # 통합 CSV 파일로 저장
-            csv_file = self.save_all_data_to_csv(data)
+        split_car_types=True이면 csv/{연도}_{차종}.csv로 차종별 파일을 따로 저장
+        차량 목록은 지역이 끝날 때마다 CSV/요약 JSON 임시 파일/싱크로 넘기고 메모리에 모아 두지 않음
+        반환값: {(연도, 차종): {지역명: 차량 수}}
+        """
+        years = [str(year) for year in years]
+        car_types = [str(car_type) for car_type in car_types]
 
-            # 요약 JSON도 함께 저장
-            self.save_summary_json(data)
+        print("=" * 70)
+        print(f"🚗 {', '.join(years)}년 전국 전기차 보조금 크롤링 시작 (차종: {', '.join(car_types)})")
+        print("=" * 70)
 
-            # 결과 미리보기
-            if csv_file:
-                self.preview_csv_data(csv_file)
+        # 중단된 이전 실행의 임시 파일 정리 후 체크포인트 저널 열기 (끝난 지역은 이어받음)
+        self.cleanup_old_files()
+        if not self.replay_from_cache:
+            self.checkpoint = CrawlCheckpoint(years, car_types, resume=self.resume)
+
+        # 출력 파일 단위: 연도별 (차종 분리 시 연도×차종별)
+        outputs = {}
+        for year in years:
+            if split_car_types:
+                for car_type in car_types:
+                    outputs[(year, car_type)] = [(year, car_type)]
+            else:
+                outputs[(year, None)] = [(year, car_type) for car_type in car_types]
 
-            return data
+        # 지역이 끝나는 대로 CSV에 기록 (전체 결과를 DataFrame으로 다시 만들지 않음)
+        writers = {
+            (year, car_type): self.open_csv_writer(self.get_target_filename("csv", year, car_type),
+                                                   year, parts=len(combinations))
+            for (year, car_type), combinations in outputs.items()
+        }
+        # 요약 JSON에 들어갈 지역별 차량 (임시 파일에 두고 저장할 때 한 지역씩 읽음)
+        summaries = {output: RegionSpool() for output in outputs}
+
+        def on_region(year, car_type, region, vehicles):
+            output = (year, car_type if split_car_types else None)
+            writers[output].add_region(region, vehicles)
+            if vehicles:
+                summaries[output].add(region['name'], [vehicle.to_dict() for vehicle in vehicles],
+                                      region_sort_key(region))
+            for sink in self.sinks:
+                sink.write_region(year, car_type, region, vehicles)
+
+        combinations = [(year, car_type) for year in years for car_type in car_types]
+        if len(combinations) == 1:
+            results = {}
+            year, car_type = combinations[0]
+            data = self.crawl_all_regions(year, car_type,
+                                          lambda region, vehicles: on_region(year, car_type, region, vehicles))
+            if data is not None:
+                results[(year, car_type)] = data
         else:
+            print(f"🚀 {len(combinations)}개 (연도, 차종) 조합 크롤링 시작...")
+            results = self.crawl_combinations(combinations, on_region=on_region)
+
+        if not results or not any(results.values()):
+            for writer in writers.values():
+                writer.discard()
+            for summary in summaries.values():
+                summary.close()
+            if self.checkpoint:
+                self.checkpoint.close()
+                self.checkpoint = None
             print("\n❌ 수집된 데이터가 없습니다.")
             return None
 
-    def preview_csv_data(self, csv_file):
-        """CSV 파일 미리보기"""
+        for (year, car_type), combinations in outputs.items():
+            self.save_output(writers[(year, car_type)], summaries[(year, car_type)], year, car_type, combinations)
+            summaries[(year, car_type)].close()
+
+        # 추가 싱크 마무리 (같은 수집 결과로 Sheets 업로드/결과 JSON 저장 - 사이트 재요청 없음)
+        for sink in self.sinks:
+            sink.close(results)
+
+        # 모든 파일을 교체한 뒤에만 변경 추적 상태를 저장하고 저널 삭제
+        self.save_region_states()
+        if self.checkpoint:
+            self.checkpoint.complete()
+            self.checkpoint = None
+
+        return results
+
+    def save_output(self, writer, summary, year, car_type, combinations):
+        """출력 파일 하나(연도 또는 연도×차종) 마무리 - CSV, 요약 JSON, 컬럼형 스냅샷, 사이트 샤드/압축본
+
+        summary: on_region에서 모은 지역명 → 차량 dict 목록 (여러 차종을 한 파일에 저장하면 지역별로 합쳐짐)
+        """
+        label = f"{year}년" + (f" 차종 {car_type}" if car_type else "")
+
+        if not len(summary):
+            writer.discard()
+            print(f"\n❌ {label} 수집된 데이터가 없습니다.")
+            return None
+
+        print(f"\n🎉 {label} 데이터 수집 완료!")
+        print(f"📊 실제 수집: {len(summary)}개 지역, {summary.record_count}개 차량 데이터")
+
+        # 변경된 지역이 없고 기존 파일이 있으면 다시 쓰지 않음
+        changed = any(self.get_region_state(*combination).has_changes() for combination in combinations)
+        if not changed and os.path.exists(writer.filepath):
+            writer.discard()
+            print(f"ℹ️ 변경된 지역이 없어 {writer.filepath} 파일을 그대로 유지합니다.")
+            if not os.path.exists(snapshot_path(writer.filepath)):
+                write_snapshot(writer.filepath)
+            if not car_type and not os.path.exists(MANIFEST_FILE):
+                self.publish_site_data(writer.filepath, year)
+            return writer.filepath
+
+        csv_file = self.finish_csv(writer, len(summary))
+
+        # 요약 JSON과 컬럼형 스냅샷(csv/{연도}.arrow)도 함께 저장
+        self.save_summary_json(summary, self.get_target_filename("json", year, car_type), year)
+        if csv_file:
+            write_snapshot(csv_file)
+
+            # 연도 파일은 사이트용 샤드와 압축본(data/)도 갱신
+            if not car_type:
+                self.publish_site_data(csv_file, year)
+
+            # 결과 미리보기 (저장하면서 집계한 통계 사용)
+            self.preview_csv_data(csv_file, writer.stats)
+
+        return csv_file
+
+    def publish_site_data(self, csv_file, year):
+        """사이트용 지역/제조사별 샤드와 연도 CSV/JSON의 해시 이름 압축본(data/) 생성"""
+        write_site_shards([csv_file])
+        publish_static_files([csv_file, os.path.join(self.csv_folder, self.get_target_filename("json", year))])
+
+    def preview_csv_data(self, csv_file, stats=None):
+        """CSV 파일 미리보기 (통계가 없으면 파일을 한 줄씩 읽어 집계)"""
         try:
             print(f"\n{'=' * 60}")
             print("📄 생성된 CSV 파일 미리보기")
             print(f"{'=' * 60}")
 
-            df = pd.read_csv(csv_file)
+            if stats is None:
+                stats = CSVStats.from_csv(csv_file)
 
-            print(f"📋 총 행 수: {len(df)}")
-            print(f"📋 총 열 수: {len(df.columns)}")
-            print(f"📋 컬럼: {', '.join(df.columns.tolist())}")
+            print(f"📋 총 행 수: {stats.row_count}")
+            print(f"📋 총 열 수: {len(CSV_COLUMNS)}")
+            print(f"📋 컬럼: {', '.join(CSV_HEADERS[column] for column in CSV_COLUMNS)}")
 
             print(f"\n🏛️ 광역시도별 지역 수:")
-            category_counts = df['광역시도'].value_counts()
-            for category, count in category_counts.items():
+            for category, count in stats.category_counts.most_common():
                 print(f"   {category}: {count}개 데이터")
 
             print(f"\n🏙️ 상위 10개 지역별 차량 수:")
-            region_counts = df['지역'].value_counts()
-            for region, count in region_counts.head(10).items():
+            for region, count in stats.region_counts.most_common(10):
                 print(f"   {region}: {count}대")
-            if len(region_counts) > 10:
-                print(f"   ... 외 {len(region_counts) - 10}개 지역")
+            if len(stats.region_counts) > 10:
+                print(f"   ... 외 {len(stats.region_counts) - 10}개 지역")
 
             print(f"\n🚙 제조사별 차량 수:")
-            if '제조사' in df.columns:
-                manufacturer_counts = df['제조사'].value_counts()
-                for manufacturer, count in manufacturer_counts.head(5).items():
-                    print(f"   {manufacturer}: {count}대")
+            for manufacturer, count in stats.manufacturer_counts.most_common(5):
+                print(f"   {manufacturer}: {count}대")
 
             print(f"\n📋 상위 5개 데이터 샘플:")
-            print(df.head().to_string(index=False))
+            for row in stats.sample_rows:
+                print("   " + " | ".join(row.values()))
 
             print(f"\n✅ CSV 파일 경로: {csv_file}")
-            print(f"💡 서버에서 {self.get_current_filename('csv')} 파일을 사용하세요!")
+            print(f"💡 서버에서 {os.path.basename(csv_file)} 파일을 사용하세요!")
             print(f"📅 파일은 매일 실행 시 자동으로 갱신됩니다.")
 
         except Exception as e:
             print(f"❌ CSV 미리보기 실패: {e}")
 
 
+def count_by_region_name(regions, region_counts):
+    """지역 목록과 지역별 차량 수 → {지역명: 차량 수} (데이터가 있는 지역만, 이름이 같은 지역은 합침)"""
+    counts = {}
+    for region, count in zip(regions, region_counts):
+        if count:
+            counts[region['name']] = counts.get(region['name'], 0) + count
+    return counts
+
+
+def parse_matrix_options(argv):
+    """크롤링 범위 옵션: --years 2024,2025 --car-types 11,12 --split-car-types"""
+    matrix = {}
+    for i, arg in enumerate(argv):
+        if arg == '--years' and i + 1 < len(argv):
+            matrix['years'] = [year.strip() for year in argv[i + 1].split(',') if year.strip()]
+        elif arg == '--car-types' and i + 1 < len(argv):
+            matrix['car_types'] = [car_type.strip() for car_type in argv[i + 1].split(',') if car_type.strip()]
+    matrix['split_car_types'] = '--split-car-types' in argv
+    return matrix
+
+
+def parse_crawler_options(argv, options=None):
+    """크롤러 공통 옵션 (동기/비동기 크롤러 공용, 동시 요청 수 옵션은 각 CLI에서 처리)
+
+    --rps N, --cache-ttl 시간, --no-cache, --replay, --parser lxml|bs4, --no-resume, --compact,
+    --refresh-regions, --probe-all, --probe-days N
+    """
+    options = dict(options or {})
+    for i, arg in enumerate(argv):
+        if arg == '--rps' and i + 1 < len(argv):
+            options['max_requests_per_second'] = float(argv[i + 1])
+        elif arg == '--cache-ttl' and i + 1 < len(argv):
+            options['cache_ttl_hours'] = float(argv[i + 1])
+        elif arg == '--parser' and i + 1 < len(argv):
+            options['parser_backend'] = argv[i + 1]
+        elif arg == '--probe-days' and i + 1 < len(argv):
+            options['probe_interval_days'] = int(argv[i + 1])
+    options['use_cache'] = '--no-cache' not in argv
+    options['replay_from_cache'] = '--replay' in argv
+    options['resume'] = '--no-resume' not in argv
+    options['compact_json'] = '--compact' in argv
+    options['refresh_regions'] = '--refresh-regions' in argv
+    options['skip_empty'] = '--probe-all' not in argv
+    return options
+
+
+def parse_sink_options(argv):
+    """추가 싱크 옵션: --results-json 파일, --sheets (시트 연결 실패 시 종료)"""
+    sinks = []
+    for i, arg in enumerate(argv):
+        if arg == '--results-json' and i + 1 < len(argv):
+            sinks.append(JSONResultSink(argv[i + 1]))
+    if '--sheets' in argv:
+        # Google API 패키지는 시트 업로드할 때만 필요
+        from ev_subsidy_crawler_full import EVSubsidyCrawler
+
+        sheets_sink = EVSubsidyCrawler().open_sheets_sink()
+        if sheets_sink is None:
+            sys.exit(1)
+        sinks.append(sheets_sink)
+    return sinks
+
+
 if __name__ == "__main__":
-    crawler = RequestsEVCrawler()
-    crawler.run()
\ No newline at end of file
+    # 동시 요청 옵션: --workers N, --rps N (예: --workers 8 --rps 4)
+    # 캐시 옵션: --no-cache, --cache-ttl 시간, --replay (네트워크 없이 캐시만 재파싱)
+    # 파서 옵션: --parser lxml|bs4 (기본: 설치된 가장 빠른 백엔드)
+    # 범위 옵션: --years 2023,2024,2025 --car-types 11,12 --split-car-types (기본: 현재 연도 승용차)
+    # 체크포인트 옵션: --no-resume (중단된 이전 실행을 이어받지 않고 처음부터 수집)
+    # 출력 옵션: --compact (요약 JSON을 운영용 압축 형식으로 저장)
+    # 지역 옵션: --refresh-regions (지역 목록 캐시를 무시하고 목록 페이지에서 다시 조회)
+    # 건너뛰기 옵션: --probe-all (데이터가 계속 없는 지역도 모두 요청), --probe-days N (해당 지역 확인 간격, 기본 7일)
+    # 추가 싱크: --sheets (같은 수집 결과로 지역 시트 업로드), --results-json 파일 ({지역명: [차량]} 결과 JSON)
+    options = parse_crawler_options(sys.argv, {'max_workers': 8, 'max_requests_per_second': 4.0})
+    for i, arg in enumerate(sys.argv):
+        if arg == '--workers' and i + 1 < len(sys.argv):
+            options['max_workers'] = int(sys.argv[i + 1])
+
+    crawler = RequestsEVCrawler(sinks=parse_sink_options(sys.argv), **options)
+    matrix = parse_matrix_options(sys.argv)
+    crawler.run_matrix(matrix.get('years', [crawler.target_year]),
+                       matrix.get('car_types', ["11"]),
+                       matrix['split_car_types'])
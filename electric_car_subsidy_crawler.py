@@ -5,16 +5,22 @@
 requests-html, Playwright, Pyppeteer 등 다양한 방법 지원
 """
 
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import json
 import os
 from datetime import datetime
 import hashlib
-import time
 import asyncio
 import sys
+import threading
+
+from browser_pool import (PLAYWRIGHT_AVAILABLE, PYPPETEER_AVAILABLE, REQUESTS_HTML_AVAILABLE, shared_browser_pool,
+                          shared_playwright_thread, wait_playwright)
+from subsidy_page import MIN_NATIONAL_ROWS, fetch_subsidy_page, subsidy_tables_soup
+
+from rate_limiter import DEFAULT_SHEETS_REQUESTS_PER_SECOND, SHEETS_LIMITER, call_with_retry, shared_limiter
+from sheets_delta import cell_text, column_letter, compute_delta, delete_row_requests, plan_writes, sheet_cell
 
 # Google Sheets 관련 imports (선택적)
 try:
@@ -26,30 +32,12 @@ except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
     print("⚠️  구글 시트 기능을 사용하려면 설치하세요: /opt/anaconda3/bin/pip install gspread google-auth")
 
-# 선택적 imports (설치된 라이브러리에 따라)
-try:
-    from requests_html import HTMLSession, AsyncHTMLSession
-
-    REQUESTS_HTML_AVAILABLE = True
-except ImportError:
-    REQUESTS_HTML_AVAILABLE = False
+# 선택적 라이브러리 설치 여부 (browser_pool에서 확인)
+if not REQUESTS_HTML_AVAILABLE:
     print("⚠️  requests-html이 설치되지 않음. pip install requests-html")
-
-try:
-    from playwright.sync_api import sync_playwright
-    from playwright.async_api import async_playwright
-
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     print("⚠️  playwright가 설치되지 않음. pip install playwright && playwright install")
-
-try:
-    import pyppeteer
-
-    PYPPETEER_AVAILABLE = True
-except ImportError:
-    PYPPETEER_AVAILABLE = False
+if not PYPPETEER_AVAILABLE:
     print("⚠️  pyppeteer가 설치되지 않음. pip install pyppeteer")
 
 
@@ -60,6 +48,9 @@ class GoogleSheetsManager:
         if not GOOGLE_SHEETS_AVAILABLE:
             raise ImportError("구글 시트 라이브러리가 설치되지 않음. /opt/anaconda3/bin/pip install gspread google-auth")
 
+        # API 요청 속도 제한 (Sheets를 쓰는 모든 모듈과 공유, 429/5xx 시 백오프 후 재시도)
+        self.limiter = shared_limiter(SHEETS_LIMITER, DEFAULT_SHEETS_REQUESTS_PER_SECOND)
+
         self.scope = [
             "https://www.googleapis.com/auth/spreadsheets",
             "https://www.googleapis.com/auth/drive"
@@ -71,89 +62,94 @@ class GoogleSheetsManager:
                 scopes=self.scope
             )
             self.gc = gspread.authorize(self.credentials)
-            self.spreadsheet = self.gc.open_by_key(spreadsheet_id)
+            self.spreadsheet = self.api_call(self.gc.open_by_key, spreadsheet_id)
             print(f"✅ 구글 시트 연결 성공: {self.spreadsheet.title}")
         except Exception as e:
             print(f"❌ 구글 시트 연결 실패: {e}")
             raise
 
-    def upload_national_subsidy(self, df):
-        """국고 보조금 데이터 업로드"""
+    def api_call(self, func, *args, **kwargs):
+        """gspread API 호출 (공유 제한기 적용)"""
+        return call_with_retry(lambda: func(*args, **kwargs), self.limiter,
+                               description=getattr(func, '__name__', 'Sheets API'))
+
+    def get_or_create_worksheet(self, title):
+        """시트 가져오기 또는 생성 - (워크시트, 새로 만들었는지 여부)"""
         try:
-            print(f"📊 국고보조금 데이터 업로드 시작: {len(df)}개 항목")
-            print(f"🔍 DataFrame 정보: 컬럼={list(df.columns)}, 타입={type(df)}")
+            worksheet = self.api_call(self.spreadsheet.worksheet, title)
+            print(f"✅ 기존 '{title}' 시트 발견")
+            return worksheet, False
+        except gspread.WorksheetNotFound:
+            worksheet = self.api_call(self.spreadsheet.add_worksheet, title=title, rows=1000, cols=10)
+            print(f"✅ 새 '{title}' 시트 생성")
+            return worksheet, True
+
+    def sync_rows(self, worksheet, headers, rows, key_width):
+        """시트를 한 번 읽어 키 기준으로 바뀐 행만 반영 - 변경이 있었으면 True
+
+        헤더가 다르면(새 시트, 컬럼 변경) 전체를 다시 씁니다.
+        """
+        width = len(headers)
+        rows = [[sheet_cell(value) for value in row] for row in rows]
+        values = self.api_call(worksheet.get_all_values)
+
+        if not values or [cell_text(cell) for cell in values[0][:width]] != [cell_text(h) for h in headers]:
+            print("🧹 헤더가 달라 전체 데이터 다시 입력")
+            self.api_call(worksheet.clear)
+            if len(rows) + 1 > worksheet.row_count:
+                self.api_call(worksheet.add_rows, len(rows) + 1 - worksheet.row_count)
+            self.api_call(worksheet.update, values=[headers] + rows,
+                          range_name=f'A1:{column_letter(width)}{len(rows) + 1}')
+            print(f"✅ 데이터 {len(rows)}개 행 입력 완료")
+            return True
 
-            # '국고보조금' 시트 가져오기 또는 생성
-            try:
-                worksheet = self.spreadsheet.worksheet('국고보조금')
-                print("✅ 기존 '국고보조금' 시트 발견")
-            except gspread.WorksheetNotFound:
-                worksheet = self.spreadsheet.add_worksheet(title='국고보조금', rows=1000, cols=10)
-                print("✅ 새 '국고보조금' 시트 생성")
-
-            # 기존 데이터 지우기
-            worksheet.clear()
-            print("🧹 기존 데이터 삭제 완료")
-
-            # 헤더와 데이터 준비
-            headers = list(df.columns)
-            print(f"📋 헤더: {headers}")
-
-            # DataFrame을 리스트로 변환
-            data_list = df.values.tolist()
-            print(f"📊 데이터 {len(data_list)}개 행 준비 완료")
-            if data_list:
-                print(f"🔍 첫 번째 데이터 샘플: {data_list[0]}")
-                print(f"🔍 데이터 타입 확인: {[type(item) for item in data_list[0]]}")
-
-            # 업데이트 시간 추가
-            update_time = f"업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        delta = compute_delta(values, rows, key_width, compare_width=width)
+        print(f"🔄 변경분: {delta.summary()}")
+        if delta.is_empty():
+            return False
 
-            # 헤더 입력
-            try:
-                worksheet.update(values=[headers], range_name='A1:D1')
-                print("✅ 헤더 입력 완료")
-            except Exception as e:
-                print(f"❌ 헤더 입력 실패: {e}")
-                # 대안 방법 시도
-                worksheet.update(range_name='A1:D1', values=[headers])
-                print("✅ 헤더 입력 완료 (대안 방법)")
-
-            # 데이터 입력
-            if data_list:
-                # 데이터 범위 계산
-                end_row = len(data_list) + 1
-                range_notation = f'A2:D{end_row}'
-                print(f"📍 데이터 입력 범위: {range_notation}")
+        data, deletes, last_row = plan_writes(delta, len(values), width)
+        if last_row > worksheet.row_count:
+            self.api_call(worksheet.add_rows, last_row - worksheet.row_count)
+        if data:
+            self.api_call(worksheet.batch_update, data)
+        if deletes:
+            self.api_call(self.spreadsheet.batch_update, {'requests': delete_row_requests(worksheet.id, deletes)})
+        return True
 
-                try:
-                    worksheet.update(values=data_list, range_name=range_notation)
-                    print("✅ 데이터 입력 완료")
-                except Exception as e:
-                    print(f"❌ 데이터 입력 실패: {e}")
-                    # 대안 방법 시도
-                    worksheet.update(range_name=range_notation, values=data_list)
-                    print("✅ 데이터 입력 완료 (대안 방법)")
-            else:
-                print("⚠️ 입력할 데이터가 없습니다")
+    def upload_subsidy_sheet(self, df, title, key_width, update_cell, header_color):
+        """보조금 시트 업로드 (변경된 행만 반영, 변경이 있을 때만 업데이트 시간 기록)"""
+        headers = list(df.columns)
+        print(f"📋 헤더: {headers}")
 
-            # 업데이트 시간 입력
+        worksheet, created = self.get_or_create_worksheet(title)
+        changed = self.sync_rows(worksheet, headers, df.values.tolist(), key_width)
+
+        if changed:
+            update_time = f"업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             try:
-                worksheet.update(values=[[update_time]], range_name='F1')
+                self.api_call(worksheet.update, values=[[update_time]], range_name=update_cell)
                 print("✅ 업데이트 시간 입력 완료")
             except Exception as e:
                 print(f"⚠️ 업데이트 시간 입력 실패: {e}")
 
-            # 헤더 서식 설정
+        # 헤더 서식 설정 (새 시트일 때만)
+        if created:
             try:
-                worksheet.format('A1:D1', {
-                    "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 1.0},
+                self.api_call(worksheet.format, f'A1:{column_letter(len(headers))}1', {
+                    "backgroundColor": header_color,
                     "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
                 })
                 print("✅ 헤더 서식 설정 완료")
             except Exception as e:
                 print(f"⚠️ 헤더 서식 설정 실패: {e}")
 
+    def upload_national_subsidy(self, df):
+        """국고 보조금 데이터 업로드 (키: 차량구분+제조사+모델명)"""
+        try:
+            print(f"📊 국고보조금 데이터 업로드 시작: {len(df)}개 항목")
+            self.upload_subsidy_sheet(df, '국고보조금', key_width=3, update_cell='F1',
+                                      header_color={"red": 0.2, "green": 0.6, "blue": 1.0})
             print(f"📊 구글 시트 국고보조금 {len(df)}개 업로드 완료")
 
         except Exception as e:
@@ -162,82 +158,11 @@ class GoogleSheetsManager:
             traceback.print_exc()
 
     def upload_local_subsidy(self, df):
-        """지자체 보조금 데이터 업로드"""
+        """지자체 보조금 데이터 업로드 (키: 지역)"""
         try:
             print(f"🏢 지자체보조금 데이터 업로드 시작: {len(df)}개 항목")
-            print(f"🔍 DataFrame 정보: 컬럼={list(df.columns)}, 타입={type(df)}")
-
-            # '지자체보조금' 시트 가져오기 또는 생성
-            try:
-                worksheet = self.spreadsheet.worksheet('지자체보조금')
-                print("✅ 기존 '지자체보조금' 시트 발견")
-            except gspread.WorksheetNotFound:
-                worksheet = self.spreadsheet.add_worksheet(title='지자체보조금', rows=1000, cols=10)
-                print("✅ 새 '지자체보조금' 시트 생성")
-
-            # 기존 데이터 지우기
-            worksheet.clear()
-            print("🧹 기존 데이터 삭제 완료")
-
-            # 헤더와 데이터 준비
-            headers = list(df.columns)
-            print(f"📋 헤더: {headers}")
-
-            # DataFrame을 리스트로 변환
-            data_list = df.values.tolist()
-            print(f"📊 데이터 {len(data_list)}개 행 준비 완료")
-            if data_list:
-                print(f"🔍 첫 번째 데이터 샘플: {data_list[0]}")
-                print(f"🔍 데이터 타입 확인: {[type(item) for item in data_list[0]]}")
-
-            # 업데이트 시간 추가
-            update_time = f"업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-
-            # 헤더 입력
-            try:
-                worksheet.update(values=[headers], range_name='A1:B1')
-                print("✅ 헤더 입력 완료")
-            except Exception as e:
-                print(f"❌ 헤더 입력 실패: {e}")
-                # 대안 방법 시도
-                worksheet.update(range_name='A1:B1', values=[headers])
-                print("✅ 헤더 입력 완료 (대안 방법)")
-
-            # 데이터 입력
-            if data_list:
-                # 데이터 범위 계산
-                end_row = len(data_list) + 1
-                range_notation = f'A2:B{end_row}'
-                print(f"📍 데이터 입력 범위: {range_notation}")
-
-                try:
-                    worksheet.update(values=data_list, range_name=range_notation)
-                    print("✅ 데이터 입력 완료")
-                except Exception as e:
-                    print(f"❌ 데이터 입력 실패: {e}")
-                    # 대안 방법 시도
-                    worksheet.update(range_name=range_notation, values=data_list)
-                    print("✅ 데이터 입력 완료 (대안 방법)")
-            else:
-                print("⚠️ 입력할 데이터가 없습니다")
-
-            # 업데이트 시간 입력
-            try:
-                worksheet.update(values=[[update_time]], range_name='D1')
-                print("✅ 업데이트 시간 입력 완료")
-            except Exception as e:
-                print(f"⚠️ 업데이트 시간 입력 실패: {e}")
-
-            # 헤더 서식 설정
-            try:
-                worksheet.format('A1:B1', {
-                    "backgroundColor": {"red": 1.0, "green": 0.6, "blue": 0.2},
-                    "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
-                })
-                print("✅ 헤더 서식 설정 완료")
-            except Exception as e:
-                print(f"⚠️ 헤더 서식 설정 실패: {e}")
-
+            self.upload_subsidy_sheet(df, '지자체보조금', key_width=1, update_cell='D1',
+                                      header_color={"red": 1.0, "green": 0.6, "blue": 0.2})
             print(f"🏢 구글 시트 지자체보조금 {len(df)}개 업로드 완료")
 
         except Exception as e:
@@ -255,9 +180,15 @@ class EVSubsidyManager:
         self.local_file = os.path.join(data_dir, 'local_subsidy.csv')
         self.metadata_file = os.path.join(data_dir, 'metadata.json')
 
-        # 크롤링 방법 선택 (auto, requests, requests-html, playwright, pyppeteer)
+        # 크롤링 방법 선택 (auto, direct, requests, requests-html, playwright, pyppeteer)
         self.method = method
 
+        # JavaScript 렌더링용 브라우저 풀 (처음 쓸 때 한 번만 시작, 재시도 방법끼리 공유)
+        self.browser_pool = shared_browser_pool()
+
+        # 테이블 파싱은 제조사 rowspan 상태(_last_manufacturer)를 쓰므로 방법 경쟁 중에도 한 번에 하나씩
+        self._parse_lock = threading.RLock()
+
         # 구글 시트 설정
         self.use_google_sheets = use_google_sheets
         if use_google_sheets and credentials_file and spreadsheet_id and GOOGLE_SHEETS_AVAILABLE:
@@ -284,7 +215,8 @@ class EVSubsidyManager:
 
     def _check_available_methods(self):
         """사용 가능한 크롤링 방법 확인"""
-        methods = ['requests']  # 기본적으로 requests는 항상 사용 가능
+        # direct/requests는 항상 사용 가능 (direct가 가장 가벼우므로 브라우저 방법보다 앞)
+        methods = ['direct', 'requests']
 
         if REQUESTS_HTML_AVAILABLE:
             methods.append('requests-html')
@@ -300,9 +232,12 @@ class EVSubsidyManager:
         if self.method != 'auto':
             return self.method
 
-        # 우선순위: requests-html > playwright > pyppeteer > requests
-        # JavaScript 렌더링 가능한 방법을 우선 선택
-        if 'requests-html' in self.available_methods:
+        # 우선순위: direct > requests-html > playwright > pyppeteer > requests
+        # 보조금 테이블은 서버가 내려주는 HTML에 있으므로 브라우저 없이 직접 요청을 우선 선택
+        # (실패하면 run에서 JavaScript 렌더링 방법으로 재시도)
+        if 'direct' in self.available_methods:
+            return 'direct'
+        elif 'requests-html' in self.available_methods:
             return 'requests-html'
         elif 'playwright' in self.available_methods:
             return 'playwright'
@@ -336,26 +271,32 @@ class EVSubsidyManager:
         data_str = json.dumps(data, sort_keys=True, ensure_ascii=False)
         return hashlib.md5(data_str.encode()).hexdigest()
 
-    # 방법 1: 기본 requests + BeautifulSoup
+    # 방법 0: 직접 요청 (브라우저 없이 보조금 테이블 조각만 파싱)
+    def crawl_direct(self):
+        """보조금 페이지를 한 번 요청해 table.table01.fz15 조각만 파싱 (전체 DOM 파싱/브라우저 미사용)"""
+        try:
+            print("⚡ direct 방법으로 크롤링 시작...")
+            return self._parse_direct(fetch_subsidy_page(self.url))
+
+        except Exception as e:
+            print(f"❌ direct 크롤링 실패: {e}")
+            return None, None
+
+    def _parse_direct(self, html):
+        """direct 응답 HTML에서 보조금 테이블 조각만 파싱"""
+        soup = subsidy_tables_soup(html)
+        if soup is None:
+            print("❌ 응답에 보조금 테이블이 없습니다 (JavaScript 렌더링 필요)")
+            return None, None
+
+        return self.extract_both_tables(soup, "direct")
+
+    # 방법 1: 기본 requests + BeautifulSoup (전체 페이지 파싱)
     def crawl_with_requests(self):
         """기본 requests를 사용한 크롤링"""
         try:
             print("📡 requests 방법으로 크롤링 시작...")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.6,en;q=0.4',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-
-            session = requests.Session()
-            response = session.get(self.url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(fetch_subsidy_page(self.url), 'html.parser')
             return self.extract_both_tables(soup, "requests")
 
         except Exception as e:
@@ -371,7 +312,7 @@ class EVSubsidyManager:
 
         try:
             print("🌐 requests-html 방법으로 크롤링 시작...")
-            session = HTMLSession()
+            session = self.browser_pool.html_session()
 
             # 요청
             r = session.get(self.url)
@@ -380,12 +321,9 @@ class EVSubsidyManager:
             print("⏳ JavaScript 렌더링 중... (최대 10초)")
             r.html.render(wait=3, timeout=10)
 
-            # BeautifulSoup으로 파싱
+            # BeautifulSoup으로 파싱 (세션과 브라우저는 풀에서 재사용)
             soup = BeautifulSoup(r.html.html, 'html.parser')
 
-            # 세션 정리
-            session.close()
-
             return self.extract_both_tables(soup, "requests-html")
 
         except Exception as e:
@@ -402,38 +340,42 @@ class EVSubsidyManager:
         try:
             print("🎭 Playwright 방법으로 크롤링 시작...")
 
-            with sync_playwright() as p:
-                # 브라우저 시작 (headless 모드)
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            # 풀의 브라우저 페이지 재사용 (User-Agent, 이미지/폰트/CSS 차단은 풀에서 설정)
+            with self.browser_pool.playwright_page() as page:
+                html_content = self._playwright_html(page)
 
-                # User-Agent 설정
-                page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
+            # BeautifulSoup으로 파싱
+            soup = BeautifulSoup(html_content, 'html.parser')
+            return self.extract_both_tables(soup, "playwright")
 
-                # 페이지 로드
-                print("📄 페이지 로딩 중...")
-                page.goto(self.url, wait_until='networkidle', timeout=30000)
+        except Exception as e:
+            print(f"❌ Playwright 크롤링 실패: {e}")
+            return None, None
 
-                # 테이블이 로드될 때까지 대기
-                try:
-                    page.wait_for_selector('table.table01.fz15', timeout=10000)
-                    print("✅ 테이블 로드 완료")
-                except:
-                    print("⚠️  테이블 로드 대기 시간 초과")
+    def _playwright_html(self, page, stop=None):
+        """Playwright 페이지로 보조금 페이지를 열어 렌더링된 HTML 반환
 
-                # HTML 추출
-                html_content = page.content()
-                browser.close()
+        stop(threading.Event)을 주면 로딩/테이블 대기 중에도 짧은 간격으로 확인해, 설정되면 바로 None 반환
+        """
+        stop = stop or threading.Event()
 
-                # BeautifulSoup으로 파싱
-                soup = BeautifulSoup(html_content, 'html.parser')
-                return self.extract_both_tables(soup, "playwright")
+        # 페이지 로드 (응답이 시작되면 돌아와서 네트워크가 잠잠해질 때까지 나눠서 대기)
+        print("📄 페이지 로딩 중...")
+        page.goto(self.url, wait_until='commit', timeout=30000)
+        if not wait_playwright(lambda timeout: page.wait_for_load_state('networkidle', timeout=timeout), stop, 30000):
+            return None
 
-        except Exception as e:
-            print(f"❌ Playwright 크롤링 실패: {e}")
-            return None, None
+        # 테이블이 로드될 때까지 대기
+        try:
+            if not wait_playwright(lambda timeout: page.wait_for_selector('table.table01.fz15', timeout=timeout),
+                                   stop, 10000):
+                return None
+            print("✅ 테이블 로드 완료")
+        except:
+            print("⚠️  테이블 로드 대기 시간 초과")
+
+        # HTML 추출
+        return page.content()
 
     # 방법 4: Pyppeteer (비동기 처리)
     def crawl_with_pyppeteer(self):
@@ -445,34 +387,15 @@ class EVSubsidyManager:
         try:
             print("🐍 Pyppeteer 방법으로 크롤링 시작...")
 
-            # 비동기 함수 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._pyppeteer_crawl())
-            loop.close()
-
-            return result
+            # 풀의 이벤트 루프에서 재사용 페이지로 실행
+            return self.browser_pool.run_pyppeteer(self._pyppeteer_crawl)
 
         except Exception as e:
             print(f"❌ Pyppeteer 크롤링 실패: {e}")
             return None, None
 
-    async def _pyppeteer_crawl(self):
-        """Pyppeteer 비동기 크롤링 함수"""
-        browser = await pyppeteer.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu'
-            ]
-        )
-        page = await browser.newPage()
-
-        # User-Agent 설정
-        await page.setUserAgent('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
+    async def _pyppeteer_crawl(self, page):
+        """Pyppeteer 비동기 크롤링 함수 (page: 풀의 재사용 페이지)"""
         # 페이지 로드
         print("📄 페이지 로딩 중...")
         response = await page.goto(self.url, {'waitUntil': 'networkidle0', 'timeout': 30000})
@@ -575,13 +498,125 @@ class EVSubsidyManager:
             f.write(html_content)
         print(f"📁 페이지 소스 저장: {debug_html_file}")
 
-        await browser.close()
-
         # BeautifulSoup으로 파싱
         soup = BeautifulSoup(html_content, 'html.parser')
         return self.extract_both_tables(soup, "pyppeteer")
 
+    def _crawl_by_method(self, method):
+        """방법 이름으로 크롤링 실행 - (국고, 지자체)"""
+        crawl = {
+            'direct': self.crawl_direct,
+            'requests': self.crawl_with_requests,
+            'requests-html': self.crawl_with_requests_html,
+            'playwright': self.crawl_with_playwright,
+            'pyppeteer': self.crawl_with_pyppeteer
+        }[method]
+        return crawl()
+
+    def _hedge_methods(self):
+        """방법 경쟁에 쓸 방법 [direct, 브라우저 렌더링 방법]"""
+        rendered = [m for m in ('pyppeteer', 'playwright') if m in self.available_methods]
+        return ['direct'] + rendered[:1]
+
+    # 방법 경쟁: direct와 브라우저 렌더링을 동시에 시작해 먼저 기준을 넘긴 결과 사용
+    def crawl_hedged(self, min_national_rows=MIN_NATIONAL_ROWS):
+        """direct와 브라우저 렌더링을 함께 실행 - (채택한 방법, 국고, 지자체)
+
+        국고 보조금이 min_national_rows개 이상인 결과가 먼저 나오면 나머지는 취소하고,
+        모두 기준에 못 미치면 국고 보조금 행이 가장 많은 결과를 씁니다.
+        브라우저 렌더링 방법이 없으면 direct만 실행합니다.
+        """
+        methods = self._hedge_methods()
+        if len(methods) < 2:
+            print("⚠️ 방법 경쟁 불가: pyppeteer/Playwright가 설치되지 않아 direct만 실행")
+            national_data, local_data = self.crawl_direct()
+            return ('direct' if national_data or local_data else None), national_data, local_data
+
+        print(f"🏁 direct와 {methods[1]} 동시 실행 (국고 보조금 {min_national_rows}개 이상이면 채택)")
+        return self.browser_pool.run_async(self._race_methods(methods[1], min_national_rows))
+
+    def _fetch_and_parse_direct(self):
+        """보조금 페이지 요청 + 테이블 조각 파싱 (방법 경쟁에서 작업 스레드로 실행)"""
+        return self._parse_direct(fetch_subsidy_page(self.url))
+
+    async def _direct_leg(self):
+        """방법 경쟁의 direct 쪽 (요청과 파싱 모두 스레드에서 실행해 이벤트 루프를 막지 않음)"""
+        print("⚡ direct 방법으로 크롤링 시작...")
+        return await asyncio.get_running_loop().run_in_executor(None, self._fetch_and_parse_direct)
+
+    def _playwright_thread_html(self, pool, stop):
+        """Playwright 전용 스레드에서 그 스레드의 풀로 HTML 가져오기 (중단 요청 시 None)
+
+        중단되면 로딩 중인 페이지를 이 스레드에서 닫아 렌더링을 멈춥니다 (브라우저는 다음 실행에 재사용).
+        """
+        with pool.playwright_page() as page:
+            html_content = None if stop.is_set() else self._playwright_html(page, stop)
+            if stop.is_set():
+                page.close()
+                return None
+        return html_content
+
+    async def _playwright_leg(self, stop):
+        """방법 경쟁의 Playwright 쪽 (렌더링은 Playwright 전용 스레드, 파싱은 작업 스레드)"""
+        print("🎭 Playwright 방법으로 크롤링 시작...")
+        html_content = await asyncio.wrap_future(shared_playwright_thread().submit(self._playwright_thread_html, stop))
+        if html_content is None:
+            return None, None
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.extract_both_tables(BeautifulSoup(html_content, 'html.parser'), "playwright"))
+
+    async def _race_methods(self, rendered_method, min_national_rows):
+        """direct와 브라우저 렌더링 방법 중 기준을 먼저 넘긴 결과 반환, 남은 쪽은 취소
+
+        pyppeteer는 풀의 이벤트 루프에서 실행하고 취소하면 바로 멈춥니다.
+        Playwright는 브라우저를 계속 띄워 두는 전용 스레드에서 실행하며, 취소하면 그 스레드가
+        대기 중에 중단 요청을 확인해 페이지를 닫습니다.
+        """
+        stop = threading.Event()
+        if rendered_method == 'pyppeteer':
+            print("🐍 Pyppeteer 방법으로 크롤링 시작...")
+            rendered = self.browser_pool.with_pyppeteer_page(self._pyppeteer_crawl)
+        else:
+            rendered = self._playwright_leg(stop)
+
+        legs = {
+            asyncio.ensure_future(self._direct_leg()): 'direct',
+            asyncio.ensure_future(rendered): rendered_method
+        }
+        best = (None, None, None)
+        pending = set(legs)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for leg in done:
+                    method = legs[leg]
+                    try:
+                        national_data, local_data = leg.result()
+                    except Exception as e:
+                        print(f"❌ {method} 크롤링 실패: {e}")
+                        continue
+
+                    national_count = len(national_data or [])
+                    print(f"🏁 {method} 완료: 국고 보조금 {national_count}개, 지자체 보조금 {len(local_data or [])}개")
+                    if national_count >= min_national_rows:
+                        return method, national_data, local_data
+                    if (national_data or local_data) and national_count >= len(best[1] or []):
+                        best = (method, national_data, local_data)
+        finally:
+            stop.set()
+            for leg in pending:
+                leg.cancel()
+                print(f"⏹️ {legs[leg]} 취소")
+            if pending:
+                await asyncio.wait(pending)
+        return best
+
     def extract_both_tables(self, soup, method_name):
+        """국고 보조금과 지자체 보조금 테이블 추출 (한 번에 하나씩)"""
+        with self._parse_lock:
+            return self._extract_both_tables(soup, method_name)
+
+    def _extract_both_tables(self, soup, method_name):
         """국고 보조금과 지자체 보조금 테이블 추출"""
         print(f"🔍 {method_name} 방법으로 테이블 데이터 추출 중...")
 
@@ -629,7 +664,7 @@ class EVSubsidyManager:
             national_data = self.extract_table_from_div(national_div, "국고 보조금")
 
             # 데이터가 부족한 경우 대안 파서 시도
-            if len(national_data) < 90:
+            if len(national_data) < MIN_NATIONAL_ROWS:
                 print(f"🔄 수집된 데이터가 적음 ({len(national_data)}개), 대안 파서 시도...")
                 alternative_data = self.use_alternative_html_parser(soup)
                 if alternative_data and len(alternative_data) > len(national_data):
@@ -1368,9 +1403,9 @@ class EVSubsidyManager:
             print(f"📋 지자체 보조금 컬럼: {', '.join(report['local_subsidy']['columns'])}")
 
         # JavaScript 필요 경고
-        if method_used == 'requests' and (
+        if method_used in ('direct', 'requests') and (
                 report['national_subsidy']['count'] < 50 or report['local_subsidy']['count'] == 0):
-            print("\n⚠️  경고: requests 방법으로는 JavaScript가 필요한 데이터를 수집할 수 없습니다.")
+            print(f"\n⚠️  경고: {method_used} 방법으로는 JavaScript가 필요한 데이터를 수집할 수 없습니다.")
             print("💡 더 많은 데이터를 위해 다음 라이브러리 설치를 권장합니다:")
             print("   /opt/anaconda3/bin/pip install requests-html")
             print("   또는")
@@ -1380,8 +1415,8 @@ class EVSubsidyManager:
         print("=" * 60 + "\n")
         return report
 
-    def run(self, method=None, debug_mode=False, verbose_missing=False):
-        """전체 프로세스 실행"""
+    def run(self, method=None, debug_mode=False, verbose_missing=False, hedged=False):
+        """전체 프로세스 실행 (hedged: direct와 브라우저 렌더링을 동시에 시작해 먼저 기준을 넘긴 결과 사용)"""
         # verbose_missing 설정을 인스턴스 변수로 저장
         self.verbose_missing = verbose_missing
 
@@ -1393,7 +1428,10 @@ class EVSubsidyManager:
             print(f"사용 가능한 방법: {', '.join(self.available_methods)}")
             return None, None
 
-        print(f"🚀 전기차 보조금 데이터 수집 시작 (방법: {selected_method})")
+        if hedged:
+            print(f"🚀 전기차 보조금 데이터 수집 시작 (방법 경쟁: {' + '.join(self._hedge_methods())})")
+        else:
+            print(f"🚀 전기차 보조금 데이터 수집 시작 (방법: {selected_method})")
         print(f"📈 실행 횟수: {self.metadata['total_runs'] + 1}")
         if debug_mode:
             print("🐛 디버그 모드 활성화")
@@ -1407,8 +1445,15 @@ class EVSubsidyManager:
         # 선택된 방법으로 크롤링 실행
         national_data, local_data = None, None
         soup = None  # 디버깅용
-
-        if selected_method == 'requests':
+        tried = [selected_method]
+
+        if hedged:
+            tried = self._hedge_methods()
+            winner, national_data, local_data = self.crawl_hedged()
+            selected_method = winner or tried[0]
+        elif selected_method == 'direct':
+            national_data, local_data = self.crawl_direct()
+        elif selected_method == 'requests':
             national_data, local_data = self.crawl_with_requests()
         elif selected_method == 'requests-html':
             result = self.crawl_with_requests_html()
@@ -1429,16 +1474,10 @@ class EVSubsidyManager:
         if (not national_data and not local_data) and selected_method != 'requests':
             print(f"⚠️  {selected_method} 실패, 다른 방법으로 재시도...")
 
-            for fallback_method in ['requests-html', 'playwright', 'requests']:
-                if fallback_method != selected_method and fallback_method in self.available_methods:
+            for fallback_method in ['direct', 'requests-html', 'playwright', 'requests']:
+                if fallback_method not in tried and fallback_method in self.available_methods:
                     print(f"🔄 {fallback_method} 방법으로 재시도...")
-
-                    if fallback_method == 'requests':
-                        national_data, local_data = self.crawl_with_requests()
-                    elif fallback_method == 'requests-html':
-                        national_data, local_data = self.crawl_with_requests_html()
-                    elif fallback_method == 'playwright':
-                        national_data, local_data = self.crawl_with_playwright()
+                    national_data, local_data = self._crawl_by_method(fallback_method)
 
                     if national_data or local_data:
                         selected_method = fallback_method
@@ -1494,23 +1533,31 @@ if __name__ == "__main__":
             print(f"📄 사용자 지정 스프레드시트 ID: {SPREADSHEET_ID}")
             break
 
+    # 크롤링 방법 지정 (기본 auto: direct 우선, 실패 시 브라우저 렌더링)
+    METHOD = 'auto'
+    for i, arg in enumerate(sys.argv):
+        if arg == '--method' and i + 1 < len(sys.argv):
+            METHOD = sys.argv[i + 1]
+            print(f"🔧 크롤링 방법 지정: {METHOD}")
+            break
+
     # 매니저 인스턴스 생성
     if USE_GOOGLE_SHEETS and SPREADSHEET_ID:
         print("📊 구글 시트 연동 모드 (기본)")
         print(f"📄 스프레드시트: https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/")
         try:
             manager = EVSubsidyManager(
-                method='auto',
+                method=METHOD,
                 use_google_sheets=True,
                 credentials_file=CREDENTIALS_FILE,
                 spreadsheet_id=SPREADSHEET_ID
             )
         except Exception as e:
             print(f"⚠️ 구글 시트 연동 실패, CSV만 저장: {e}")
-            manager = EVSubsidyManager(method='auto')
+            manager = EVSubsidyManager(method=METHOD)
     else:
         print("📁 CSV 전용 모드")
-        manager = EVSubsidyManager(method='auto')
+        manager = EVSubsidyManager(method=METHOD)
 
     # 사용 가능한 방법 출력
     print(f"🔧 사용 가능한 방법: {', '.join(manager.available_methods)}")
@@ -1518,18 +1565,15 @@ if __name__ == "__main__":
     # JavaScript 렌더링 가능 여부 확인
     js_methods = [m for m in manager.available_methods if m in ['requests-html', 'playwright', 'pyppeteer']]
     if not js_methods:
-        print("⚠️  JavaScript 렌더링 라이브러리가 설치되지 않았습니다.")
-        print("💡 더 많은 데이터 수집을 위해 다음 중 하나를 설치하세요:")
+        print("💡 JavaScript 렌더링 라이브러리가 없어 direct/requests 방법만 사용합니다.")
+        print("   페이지 구조가 바뀌어 direct 수집이 실패할 때를 대비하려면 다음 중 하나를 설치하세요:")
         print("   /opt/anaconda3/bin/pip install requests-html     (가장 간단)")
         print(
             "   /opt/anaconda3/bin/pip install playwright && /opt/anaconda3/bin/python -m playwright install chromium  (고성능)")
         print("")
 
-        # 사용자 선택
-        user_choice = input("그래도 계속 진행하시겠습니까? (y/n): ").strip().lower()
-        if user_choice not in ['y', 'yes', '네', 'ㅇ']:
-            print("설치 후 다시 실행해주세요.")
-            sys.exit(0)
+    # 방법 경쟁 옵션 (direct와 브라우저 렌더링 동시 실행)
+    hedged = '--hedged' in sys.argv
 
     # 디버그 모드 옵션
     debug_mode = '--debug' in sys.argv or '-d' in sys.argv
@@ -1542,7 +1586,7 @@ if __name__ == "__main__":
         print("🔍 누락 데이터 상세 분석 모드로 실행 중...")
 
     # 실행
-    national_df, local_df = manager.run(debug_mode=debug_mode, verbose_missing=verbose_missing)
+    national_df, local_df = manager.run(debug_mode=debug_mode, verbose_missing=verbose_missing, hedged=hedged)
 
     # 결과 확인
     if national_df is not None and not national_df.empty:
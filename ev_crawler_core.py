@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+ev.or.kr 크롤러 공통 코어
+세션 초기화, 지역 목록(region_registry), 지역 상세 페이지 요청(응답 캐시/조건부 요청), 차량 테이블 파싱을 한 곳에 두고
+electric_car_csv_crawler / ev_subsidy_crawler_full / requests_electric_crawler가 상속해서 씁니다.
+
+수집 결과는 싱크(VehicleSink)로 내보냅니다. 한 번 수집/파싱한 결과를 여러 싱크(CSV, JSON, Sheets, 컬럼형)가
+함께 받으므로, 출력마다 크롤러를 따로 돌려 같은 지역을 여러 번 요청할 필요가 없습니다.
+"""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from compact_json import dump_json, dump_json_stream
+from rate_limiter import EV_SITE_LIMITER, request_with_retry, shared_limiter
+from region_registry import DEFAULT_TTL_HOURS, RegionRegistry
+from region_spool import RegionSpool
+from streaming_csv_writer import region_sort_key
+from vehicle_record import parse_vehicle_rows
+from vehicle_table_parser import extract_vehicle_table
+
+BASE_URL = "https://ev.or.kr"
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 페이지 경로
+MAIN_PAGE = "/nportal/main.do"
+SUBSIDY_PAGE = "/nportal/buySupprt/initSubsidyPaymentCheckAction.do"
+LIST_PAGE = "/nportal/buySupprt/psPopupLocalCarPirce.do"
+DETAIL_PAGE = "/nportal/buySupprt/psPopupLocalCarModelPrice.do"
+
+
+class EVCrawlerCore:
+    """ev.or.kr 세션/상세 페이지 요청/차량 테이블 파싱 공통 부분"""
+
+    def __init__(self, max_workers=1, max_requests_per_second=4.0, response_cache=None,
+                 replay_from_cache=False, parser_backend=None, request_timeout=30,
+                 region_ttl_hours=DEFAULT_TTL_HOURS, refresh_regions=False):
+        self.base_url = BASE_URL
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        # 동시 요청 설정 (워커 수만큼 커넥션 풀 확보)
+        self.max_workers = max(1, int(max_workers))
+        self.max_requests_per_second = max_requests_per_second
+        self.request_timeout = request_timeout
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 전체 요청 속도 제한 (모든 워커와 같은 사이트를 쓰는 크롤러가 공유, 429/5xx 시 백오프)
+        self.rate_limiter = shared_limiter(EV_SITE_LIMITER, max_requests_per_second)
+
+        # 응답 캐시 (없으면 매번 요청, 재생 모드는 네트워크 없이 캐시만 사용)
+        self.response_cache = response_cache
+        self.replay_from_cache = replay_from_cache
+
+        # 차량 테이블 파서 백엔드 (None이면 lxml > bs4 자동 선택)
+        self.parser_backend = parser_backend
+
+        # 연도별 지역 목록 (목록 페이지에서 찾아 TTL 동안 캐시, refresh_regions면 항상 다시 조회)
+        self.region_ttl_hours = region_ttl_hours
+        self.refresh_regions = refresh_regions
+        self.region_lists = {}
+
+        self.session_ready = False
+
+    def ensure_session(self):
+        """세션이 초기화되지 않았으면 초기화 (한 실행에서 한 번만)"""
+        if not self.session_ready:
+            self.session_ready = self.get_session_cookies()
+        return self.session_ready
+
+    def get_session_cookies(self):
+        """세션 쿠키 얻기"""
+        try:
+            # 1. 메인 페이지 접속
+            print("📍 메인 페이지 접속 중...")
+            main_response = request_with_retry(
+                lambda: self.session.get(f"{self.base_url}{MAIN_PAGE}", timeout=self.request_timeout),
+                self.rate_limiter, description="메인 페이지")
+            print(f"   상태 코드: {main_response.status_code}")
+
+            # 2. 구매보조금 지급현황 페이지 접속
+            print("📍 구매보조금 지급현황 페이지 접속 중...")
+            subsidy_response = request_with_retry(
+                lambda: self.session.get(f"{self.base_url}{SUBSIDY_PAGE}", timeout=self.request_timeout),
+                self.rate_limiter, description="보조금 페이지")
+            print(f"   상태 코드: {subsidy_response.status_code}")
+
+            return True
+
+        except Exception as e:
+            print(f"❌ 세션 초기화 실패: {e}")
+            return False
+
+    def list_page_request(self, year="2025", car_type="11"):
+        """지자체 차종별 보조금 목록 페이지 요청 - (URL, 폼 데이터, 헤더) (동기/비동기 공용)"""
+        url = f"{self.base_url}{LIST_PAGE}"
+        data = {
+            'year1': year,
+            'car_type': car_type
+        }
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Referer': f"{self.base_url}{SUBSIDY_PAGE}",
+            'Origin': self.base_url
+        }
+        return url, data, headers
+
+    def list_page_from_response(self, year, response):
+        """목록 페이지 응답 → HTML (실패 시 None)"""
+        if response.status_code == 200:
+            return response.text
+
+        print(f"   ❌ {year}년 목록 페이지 응답 실패: {response.status_code}")
+        return None
+
+    def get_local_car_price_list(self, year="2025", car_type="11"):
+        """지자체 차종별 보조금 목록 페이지 가져오기 (지역 코드 조회용)"""
+        try:
+            url, data, headers = self.list_page_request(year, car_type)
+            response = request_with_retry(
+                lambda: self.session.post(url, data=data, headers=headers, timeout=self.request_timeout),
+                self.rate_limiter, description=f"{year}년 목록 페이지")
+            return self.list_page_from_response(year, response)
+
+        except Exception as e:
+            print(f"   ❌ {year}년 목록 페이지 요청 실패: {e}")
+            return None
+
+    def fetch_region_list(self, year, car_type="11"):
+        """지역 레지스트리용 목록 페이지 조회 (세션이 없으면 먼저 초기화)"""
+        if not self.ensure_session():
+            return None
+        return self.get_local_car_price_list(year, car_type)
+
+    def get_all_regions(self, year="2025", car_type="11"):
+        """연도별 전국 지역 목록 [{'code', 'name', 'category'}] (실행 중에는 연도마다 한 번만 조회)
+
+        캐시 재생 모드에서는 네트워크 없이 저장된 목록이나 내장 목록을 씁니다.
+        """
+        year = str(year)
+        if year not in self.region_lists:
+            registry = RegionRegistry(year, car_type, self.region_ttl_hours)
+            fetch_list = None if self.replay_from_cache else self.fetch_region_list
+            self.region_lists[year] = registry.get_regions(fetch_list, self.refresh_regions)
+        return self.region_lists[year]
+
+    def cached_detail(self, year, local_cd, car_type, local_nm):
+        """상세 페이지 요청 전 캐시 확인 - (요청 없이 끝났는지, 본문 또는 재검증할 캐시 항목)
+
+        재생 모드는 캐시만 쓰고(없으면 None), TTL 이내 캐시는 요청 없이 바로 씁니다.
+        """
+        cached = self.response_cache.get(year, local_cd, car_type) if self.response_cache else None
+
+        if self.replay_from_cache:
+            if cached:
+                self.response_cache.count('hit')
+                return True, cached['content']
+            print(f"   ⚠️ {local_nm} 캐시 없음 (재생 모드)")
+            return True, None
+
+        if self.response_cache and self.response_cache.is_fresh(cached):
+            self.response_cache.count('hit')
+            return True, cached['content']
+
+        return False, cached
+
+    def detail_page_request(self, year, local_cd, car_type, local_nm, cached=None):
+        """지역 상세 페이지 요청 - (URL, 폼 데이터, 헤더) (캐시가 있으면 조건부 요청 헤더 포함)"""
+        url = f"{self.base_url}{DETAIL_PAGE}"
+        data = {
+            'year': year,
+            'local_cd': local_cd,
+            'car_type': car_type,
+            'local_nm': local_nm
+        }
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Referer': f"{self.base_url}{LIST_PAGE}",
+            'Origin': self.base_url,
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+        if self.response_cache:
+            headers.update(self.response_cache.conditional_headers(cached))
+        return url, data, headers
+
+    def detail_from_response(self, year, local_cd, car_type, local_nm, response, cached=None):
+        """상세 페이지 응답 → HTML (304면 캐시 본문 재사용, 200이면 캐시 저장, 실패 시 None)"""
+        # 변경 없음 - 캐시된 본문 재사용
+        if response.status_code == 304 and cached:
+            self.response_cache.touch(year, local_cd, car_type)
+            self.response_cache.count('not_modified')
+            return cached['content']
+
+        if response.status_code == 200:
+            if self.response_cache:
+                self.response_cache.count('miss')
+                self.response_cache.put(year, local_cd, car_type, response.text,
+                                        etag=response.headers.get('ETag'),
+                                        last_modified=response.headers.get('Last-Modified'))
+            return response.text
+
+        print(f"   ❌ {local_nm} 상세 페이지 응답 실패: {response.status_code}")
+        return None
+
+    def get_local_car_detail(self, year="2025", local_cd="1100", car_type="11", local_nm="서울특별시"):
+        """특정 지역의 차량별 보조금 상세 정보 가져오기 (세션 초기화 후 목록 페이지 재요청 없이 바로 POST)"""
+        done, cached = self.cached_detail(year, local_cd, car_type, local_nm)
+        if done:
+            return cached
+
+        try:
+            url, data, headers = self.detail_page_request(year, local_cd, car_type, local_nm, cached)
+            response = request_with_retry(
+                lambda: self.session.post(url, data=data, headers=headers, timeout=self.request_timeout),
+                self.rate_limiter, description=f"{local_nm} 상세 페이지")
+            return self.detail_from_response(year, local_cd, car_type, local_nm, response, cached)
+
+        except Exception as e:
+            print(f"   ❌ {local_nm} 상세 페이지 요청 실패: {e}")
+            return None
+
+    def parse_vehicle_data(self, html_content):
+        """HTML에서 차량 데이터 파싱 (table.table01의 thead/tbody 텍스트만 추출) - VehicleRecord 목록"""
+        headers, rows = extract_vehicle_table(html_content, self.parser_backend)
+        return parse_vehicle_rows(headers, rows)
+
+
+class VehicleSink:
+    """수집 결과 출력 싱크
+
+    write_region(연도, 차종, 지역, 차량 목록)은 지역이 끝날 때마다 (완료 순서대로) 호출되고,
+    close(결과)는 전체 수집이 성공한 뒤 {(연도, 차종): {지역명: 차량 수}}로 한 번 호출됩니다.
+    차량 목록이 필요한 싱크는 write_region에서 받은 지역을 직접 기록/보관해야 합니다.
+    """
+
+    def write_region(self, year, car_type, region, vehicles):
+        pass
+
+    def close(self, results):
+        pass
+
+
+class JSONResultSink(VehicleSink):
+    """{지역명: [차량, ...]} 결과 JSON 저장 (google_sheets_daily_updater 입력 형식, 금액은 숫자)
+
+    write_region으로 받은 지역은 임시 파일에 두었다가 close()에서 지역 순서대로 이어 씁니다.
+    write_region 없이 close({키: {지역명: [VehicleRecord]}})로 결과를 한 번에 넘겨도 됩니다.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.spool = None
+
+    def write_region(self, year, car_type, region, vehicles):
+        if self.spool is None:
+            self.spool = RegionSpool()
+        if vehicles:
+            self.spool.add(region['name'], [vehicle.to_dict() for vehicle in vehicles], region_sort_key(region))
+
+    def close(self, results=None):
+        os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+        if self.spool is not None:
+            dump_json_stream(None, self.spool.items(), self.filename)
+            self.spool.close()
+            self.spool = None
+        else:
+            data = {}
+            for region_data in results.values():
+                for region_name, vehicles in region_data.items():
+                    data.setdefault(region_name, []).extend(vehicle.to_dict() for vehicle in vehicles)
+            dump_json(data, self.filename)
+        print(f"\n📁 결과 저장 완료: {self.filename}")
+        return self.filename
@@ -4,9 +4,11 @@ Google Sheets 데이터를 JSON으로 내보내기
 API 할당량 문제를 해결하기 위한 로컬 데이터 생성
 """
 
-import json
+import sys
 from datetime import datetime
 
+from compact_json import NUMBER, TEXT, compact_header, dump_json, pack_table
+
 # Google Sheets에서 수동으로 복사한 데이터
 # (API 제한으로 인해 하드코딩)
 VEHICLE_DATA = {
@@ -65,8 +67,21 @@ REGION_SUBSIDIES = [
     {"region": "제주특별자치도", "avgSubsidy": 600, "maxSubsidy": 600}
 ]
 
-def export_to_json():
-    """데이터를 JSON 파일로 내보내기"""
+# 압축 형식(--compact)의 표 컬럼 (짧은 키, 이름, 타입)
+VEHICLE_COLUMNS = [
+    ('m', 'manufacturer', TEXT),
+    ('c', 'model', TEXT),
+    ('n', 'nationalSubsidy', NUMBER),
+    ('l', 'localSubsidy', NUMBER)
+]
+REGION_COLUMNS = [
+    ('r', 'region', TEXT),
+    ('a', 'avgSubsidy', NUMBER),
+    ('x', 'maxSubsidy', NUMBER)
+]
+
+def export_to_json(compact=False):
+    """데이터를 JSON 파일로 내보내기 (compact: 공백 없는 운영용 압축 형식)"""
     
     # 전체 데이터 구조
     data = {
@@ -82,8 +97,15 @@ def export_to_json():
     
     # JSON 파일로 저장
     filename = f"ev_subsidy_data_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if compact:
+        dump_json({
+            **compact_header(),
+            **data,
+            "vehicles": pack_table(data["vehicles"], VEHICLE_COLUMNS),
+            "regions": pack_table(data["regions"], REGION_COLUMNS)
+        }, filename, compact=True)
+    else:
+        dump_json(data, filename)
     
     print(f"✅ 데이터를 {filename} 파일로 내보냈습니다.")
     print(f"   - 차량 수: {len(data['vehicles'])}개")
@@ -98,4 +120,5 @@ def export_to_json():
     print(f"   - 평균 국고보조금: {sum(subsidies) // len(subsidies)}만원")
 
 if __name__ == "__main__":
-    export_to_json()
\ No newline at end of file
+    # --compact: 운영용 압축 JSON
+    export_to_json(compact='--compact' in sys.argv)
\ No newline at end of file
@@ -6,6 +6,7 @@ const FinalDataLoader = {
     config: {
         lightDataFile: 'ev_data_final_20250713.json',
         fullDataFile: 'ev_complete_data_20250713.json',
+        matrixDataFile: 'ev_subsidy_matrix_20250713.json',
         cacheKey: 'ev_final_data',
         cacheDuration: 3600000 // 1시간
     },
@@ -14,7 +15,8 @@ const FinalDataLoader = {
     data: {
         light: null,    // 기본 데이터
         full: null,     // 전체 데이터 (차량-지역별 보조금 포함)
-        vehicleSubsidyMap: null  // 차량-지역별 보조금 매핑
+        vehicleSubsidyMap: null,  // 차량-지역별 보조금 매핑 (전체 데이터 사용 시)
+        subsidyMatrix: null       // 지역 × 차량 보조금 행렬
     },
 
     // 초기화
@@ -55,7 +57,7 @@ const FinalDataLoader = {
             throw new Error(`경량 데이터 로드 실패: ${response.status}`);
         }
         
-        const data = await response.json();
+        const data = this.expandCompact(await response.json());
         console.log(`✅ 데이터 로드 완료:`);
         console.log(`   - 차량: ${data.vehicles.length}개`);
         console.log(`   - 지역: ${data.regions.length}개 (광역시/특별시 ${data.metadata.majorCities}개 포함)`);
@@ -64,12 +66,23 @@ const FinalDataLoader = {
         return data;
     },
 
-    // 전체 데이터 백그라운드 로드
+    // 차량별 지자체 보조금 백그라운드 로드 (행렬 파일 우선, 실패 시 전체 데이터)
     async loadFullDataInBackground() {
+        try {
+            const response = await fetch(this.config.matrixDataFile);
+            if (response.ok) {
+                this.data.subsidyMatrix = this.decodeSubsidyMatrix(await response.json());
+                console.log('✅ 차량별 지자체 보조금 행렬 로드 완료');
+                return;
+            }
+        } catch (error) {
+            console.warn('보조금 행렬 로드 실패 (전체 데이터 사용):', error);
+        }
+
         try {
             const response = await fetch(this.config.fullDataFile);
             if (response.ok) {
-                this.data.full = await response.json();
+                this.data.full = this.expandCompact(await response.json());
                 this.data.vehicleSubsidyMap = this.data.full.vehicleSubsidyByRegion;
                 console.log('✅ 차량별 지자체 보조금 데이터 로드 완료');
             }
@@ -78,6 +91,65 @@ const FinalDataLoader = {
         }
     },
 
+    // 압축 형식(compact_json) → 기존 형식 (vehicles/regions 표를 객체 배열로 펼침)
+    expandCompact(data) {
+        if (data.format !== 'ev-compact') {
+            return data;
+        }
+
+        const expand = (table) => {
+            const names = table.columns.map(column => column.name);
+            return table.rows.map(row => {
+                const record = {};
+                names.forEach((name, i) => {
+                    if (row[i] !== null) {
+                        record[name] = row[i];
+                    }
+                });
+                return record;
+            });
+        };
+
+        return { ...data, vehicles: expand(data.vehicles), regions: expand(data.regions) };
+    },
+
+    // 행렬 파일 디코딩 (base64 → int16 배열, 값 = 만원 × scale)
+    decodeSubsidyMatrix(matrix) {
+        const binary = atob(matrix.data);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+
+        const view = new DataView(bytes.buffer);
+        const values = new Int16Array(bytes.length / 2);
+        for (let i = 0; i < values.length; i++) {
+            values[i] = view.getInt16(i * 2, true);  // 리틀 엔디언
+        }
+
+        return {
+            scale: matrix.scale,
+            missing: matrix.missing,
+            width: matrix.shape[1],
+            values: values,
+            regionIndex: new Map(matrix.regions.map((name, i) => [name, i])),
+            vehicleIndex: new Map(matrix.vehicles.map((id, i) => [id, i]))
+        };
+    },
+
+    // 행렬에서 보조금 조회 (없으면 null)
+    lookupSubsidyMatrix(vehicleId, regionName) {
+        const matrix = this.data.subsidyMatrix;
+        const regionIdx = matrix.regionIndex.get(regionName);
+        const vehicleIdx = matrix.vehicleIndex.get(vehicleId);
+        if (regionIdx === undefined || vehicleIdx === undefined) {
+            return null;
+        }
+
+        const raw = matrix.values[regionIdx * matrix.width + vehicleIdx];
+        return raw === matrix.missing ? null : raw / matrix.scale;
+    },
+
     // 차량 목록 가져오기
     getVehicles() {
         return this.data.light?.vehicles || [];
@@ -95,8 +167,13 @@ const FinalDataLoader = {
 
     // 특정 차량의 지역별 보조금 가져오기
     getVehicleSubsidyByRegion(vehicleId, regionName) {
-        // 1. 차량-지역별 상세 데이터가 있는 경우
-        if (this.data.vehicleSubsidyMap && 
+        // 1. 차량-지역별 상세 데이터가 있는 경우 (행렬 또는 전체 데이터)
+        if (this.data.subsidyMatrix) {
+            const subsidy = this.lookupSubsidyMatrix(vehicleId, regionName);
+            if (subsidy) {
+                return subsidy;
+            }
+        } else if (this.data.vehicleSubsidyMap && 
             this.data.vehicleSubsidyMap[regionName] && 
             this.data.vehicleSubsidyMap[regionName][vehicleId]) {
             return this.data.vehicleSubsidyMap[regionName][vehicleId];
@@ -194,7 +271,7 @@ const FinalDataLoader = {
 
     clearCache() {
         localStorage.removeItem(this.config.cacheKey);
-        this.data = { light: null, full: null, vehicleSubsidyMap: null };
+        this.data = { light: null, full: null, vehicleSubsidyMap: null, subsidyMatrix: null };
     }
 };
 
@@ -2,10 +2,17 @@
 """
 Google Sheets 일일 업데이트 스크립트
 API 할당량을 고려한 효율적인 데이터 수집
+
+분당/일일 요청 한도 안에서 실행마다 가장 오래 갱신되지 않은 지역부터 업데이트하고,
+지역별 마지막 갱신 시각은 .update_progress.json에 기록합니다.
+데이터가 바뀌지 않은 지역은 API 호출 없이 최신 상태로 처리합니다.
 """
 
 import os
+import glob
+import hashlib
 import json
+import math
 import time
 import logging
 from datetime import datetime, timedelta
@@ -15,6 +22,9 @@ from google.oauth2.service_account import Credentials
 from collections import defaultdict
 import schedule
 
+from rate_limiter import SHEETS_LIMITER, call_with_retry, shared_limiter
+from vehicle_record import VehicleRecord
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -28,16 +38,34 @@ logging.basicConfig(
     ]
 )
 
+# 진행 상황 파일 (지역별 마지막 갱신 시각, 오늘 사용한 요청 수)
+PROGRESS_FILE = '.update_progress.json'
+
+# 크롤러 결과 파일 패턴 (ev_subsidy_crawler_full.py 저장 형식: {지역명: [차량, ...]})
+CRAWLED_DATA_PATTERN = 'ev_subsidy_all_regions_*.json'
+
+# 지역 시트 한 개 갱신 비용 (resize + update), 시트가 없으면 생성 1회 추가
+REGION_UPDATE_COST = 2
+SHEET_CREATE_COST = 1
+
+# 실행마다 고정으로 드는 호출 (시트 목록 조회)
+RUN_OVERHEAD_COST = 1
+
+
 class GoogleSheetsOptimizedUpdater:
     def __init__(self):
         self.spreadsheet_id = os.getenv('GOOGLE_SPREADSHEET_ID')
         self.service_account_file = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE')
         self.max_requests_per_minute = int(os.getenv('MAX_REQUESTS_PER_MINUTE', 60))
-        self.request_delay_ms = int(os.getenv('REQUEST_DELAY_MS', 1000))
         
-        # API 요청 카운터
+        # 할당량 예산: 하루 최대 요청 수, 한 번 실행에 쓸 최대 시간(분)
+        self.max_requests_per_day = int(os.getenv('MAX_REQUESTS_PER_DAY', 3000))
+        self.max_run_minutes = int(os.getenv('MAX_RUN_MINUTES', 30))
+        self.data_file = os.getenv('CRAWLED_DATA_FILE')
         self.request_count = 0
-        self.request_start_time = time.time()
+        
+        # API 요청 속도 제한 (Sheets를 쓰는 모든 모듈과 공유하는 토큰 버킷)
+        self.limiter = shared_limiter(SHEETS_LIMITER, self.max_requests_per_minute / 60)
         
         # 인증 설정
         self.setup_authentication()
@@ -56,7 +84,7 @@ class GoogleSheetsOptimizedUpdater:
             )
             
             self.gc = gspread.authorize(credentials)
-            self.spreadsheet = self.gc.open_by_key(self.spreadsheet_id)
+            self.spreadsheet = self.api_call(self.gc.open_by_key, self.spreadsheet_id)
             
             logging.info(f"✅ 스프레드시트 연결 성공: {self.spreadsheet.title}")
             
@@ -64,39 +92,25 @@ class GoogleSheetsOptimizedUpdater:
             logging.error(f"❌ 인증 실패: {e}")
             raise
     
-    def rate_limit(self):
-        """API 요청 속도 제한"""
-        self.request_count += 1
-        
-        # 1분이 지났으면 카운터 리셋
-        current_time = time.time()
-        if current_time - self.request_start_time >= 60:
-            self.request_count = 1
-            self.request_start_time = current_time
+    def api_call(self, func, *args, **kwargs):
+        """API 요청 실행 (분당 요청 수 제한, 429/5xx 시 Retry-After/지수 백오프 후 재시도)"""
+        def call():
+            # 재시도도 할당량을 쓰므로 실제 호출마다 집계
+            self.request_count += 1
+            return func(*args, **kwargs)
         
-        # 분당 요청 제한 확인
-        if self.request_count >= self.max_requests_per_minute:
-            sleep_time = 60 - (current_time - self.request_start_time)
-            if sleep_time > 0:
-                logging.info(f"⏳ API 제한 대기: {sleep_time:.1f}초")
-                time.sleep(sleep_time)
-                self.request_count = 1
-                self.request_start_time = time.time()
-        
-        # 요청 간 지연
-        time.sleep(self.request_delay_ms / 1000)
+        return call_with_retry(call, self.limiter, description=getattr(func, '__name__', 'Sheets API'))
     
     def get_all_sheets(self):
         """모든 시트 목록 가져오기"""
-        self.rate_limit()
-        sheets = self.spreadsheet.worksheets()
+        sheets = self.api_call(self.spreadsheet.worksheets)
         return [sheet.title for sheet in sheets if sheet.title.startswith('2025')]
     
-    def update_vehicle_data_batch(self, sheet_name, vehicles_data):
-        """차량 데이터 일괄 업데이트 (API 호출 최소화)"""
+    def update_vehicle_data_batch(self, sheet_name, vehicles_data, worksheet=None):
+        """차량 데이터 일괄 업데이트 (API 호출 최소화) - 성공 여부 반환"""
         try:
-            self.rate_limit()
-            worksheet = self.spreadsheet.worksheet(sheet_name)
+            if worksheet is None:
+                worksheet = self.api_call(self.spreadsheet.worksheet, sheet_name)
             
             # 헤더 확인
             headers = ['제조사', '차종', '차량명', '국고보조금', '지방비', '보조금계', '차량종류']
@@ -105,133 +119,249 @@ class GoogleSheetsOptimizedUpdater:
             rows = [headers]
             for vehicle in vehicles_data:
                 row = [
-                    vehicle.get('manufacturer', ''),
-                    vehicle.get('model', ''),
-                    vehicle.get('model_detail', ''),
-                    str(vehicle.get('national_subsidy', 0)),
-                    str(vehicle.get('local_subsidy', 0)),
-                    str(vehicle.get('total_subsidy', 0)),
-                    vehicle.get('category', '')
+                    vehicle.manufacturer or '',
+                    vehicle.model or '',
+                    vehicle.model_detail or '',
+                    vehicle.amount_text('national_subsidy'),
+                    vehicle.amount_text('local_subsidy'),
+                    vehicle.amount_text('total_subsidy'),
+                    ''
                 ]
                 rows.append(row)
             
             # 시트 크기 조정
-            worksheet.resize(rows=len(rows), cols=len(headers))
+            self.api_call(worksheet.resize, rows=len(rows), cols=len(headers))
             
             # 일괄 업데이트 (단일 API 호출)
-            self.rate_limit()
-            worksheet.update(f'A1:G{len(rows)}', rows, value_input_option='RAW')
+            self.api_call(worksheet.update, f'A1:G{len(rows)}', rows, value_input_option='RAW')
             
             logging.info(f"✅ {sheet_name}: {len(vehicles_data)}개 차량 데이터 업데이트 완료")
+            return True
             
         except Exception as e:
             logging.error(f"❌ {sheet_name} 업데이트 실패: {e}")
+            return False
+    
+    @staticmethod
+    def format_amount(value):
+        """요약 시트에 쓸 금액 (정수면 정수로)"""
+        return int(value) if float(value).is_integer() else round(value, 1)
     
-    def create_summary_sheet(self):
-        """요약 시트 생성/업데이트"""
+    def build_summary_rows(self, crawled_data):
+        """크롤링 결과(지역명 → 차량 목록)에서 지역별 통계를 한 번에 계산 (시트 읽기 없음)"""
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M')
+        summary_data = [['지역', '차량수', '평균 국고보조금', '평균 지방비', '최대 지방비', '최소 지방비', '업데이트 시간']]
+        
+        for region, vehicles in crawled_data.items():
+            if not vehicles:
+                continue
+            
+            national_subsidies = []
+            local_subsidies = []
+            for vehicle in vehicles:
+                if vehicle.national_subsidy is not None:
+                    national_subsidies.append(vehicle.national_subsidy)
+                if vehicle.local_subsidy is not None:
+                    local_subsidies.append(vehicle.local_subsidy)
+            
+            summary_data.append([
+                region,
+                len(vehicles),
+                int(sum(national_subsidies) // len(national_subsidies)) if national_subsidies else 0,
+                int(sum(local_subsidies) // len(local_subsidies)) if local_subsidies else 0,
+                self.format_amount(max(local_subsidies)) if local_subsidies else 0,
+                self.format_amount(min(local_subsidies)) if local_subsidies else 0,
+                updated_at
+            ])
+        
+        return summary_data
+    
+    def create_summary_sheet(self, crawled_data, sheets=None):
+        """요약 시트 생성/업데이트 (전체 지역, 범위 한 번 쓰기)
+        
+        sheets는 이미 조회한 {시트명: 워크시트} 목록으로, 있으면 시트 조회 호출을 생략합니다.
+        """
         try:
             # 요약 시트 확인/생성
-            try:
-                summary = self.spreadsheet.worksheet('요약')
-            except:
-                self.rate_limit()
-                summary = self.spreadsheet.add_worksheet(title='요약', rows=200, cols=10)
+            summary = sheets.get('요약') if sheets is not None else None
+            if summary is None:
+                try:
+                    summary = self.api_call(self.spreadsheet.worksheet, '요약')
+                except Exception:
+                    summary = self.api_call(self.spreadsheet.add_worksheet, title='요약', rows=200, cols=10)
+                if sheets is not None:
+                    sheets['요약'] = summary
             
-            # 지역별 통계 계산
-            all_regions = self.get_all_sheets()
-            summary_data = [['지역', '차량수', '평균 국고보조금', '평균 지방비', '최대 지방비', '최소 지방비', '업데이트 시간']]
+            # 지역별 통계 계산 (메모리의 크롤링 결과 사용)
+            summary_data = self.build_summary_rows(crawled_data)
             
-            for region in all_regions[:10]:  # API 제한을 위해 처음 10개만
-                try:
-                    self.rate_limit()
-                    worksheet = self.spreadsheet.worksheet(region)
-                    values = worksheet.get_all_values()[1:]  # 헤더 제외
-                    
-                    if values:
-                        national_subsidies = [int(row[3]) for row in values if row[3].isdigit()]
-                        local_subsidies = [int(row[4]) for row in values if row[4].isdigit()]
-                        
-                        summary_row = [
-                            region.replace('2025 ', ''),
-                            len(values),
-                            sum(national_subsidies) // len(national_subsidies) if national_subsidies else 0,
-                            sum(local_subsidies) // len(local_subsidies) if local_subsidies else 0,
-                            max(local_subsidies) if local_subsidies else 0,
-                            min(local_subsidies) if local_subsidies else 0,
-                            datetime.now().strftime('%Y-%m-%d %H:%M')
-                        ]
-                        summary_data.append(summary_row)
-                    
-                except Exception as e:
-                    logging.warning(f"⚠️ {region} 통계 수집 실패: {e}")
+            # 시트가 모자라면 행 추가
+            if len(summary_data) > summary.row_count:
+                self.api_call(summary.add_rows, len(summary_data) - summary.row_count)
             
-            # 요약 데이터 업데이트
-            self.rate_limit()
-            summary.clear()
-            summary.update('A1:G' + str(len(summary_data)), summary_data)
+            # 남은 예전 행은 빈 값으로 덮어써서 clear 없이 한 번에 갱신
+            blank_row = [''] * len(summary_data[0])
+            values = summary_data + [blank_row] * (summary.row_count - len(summary_data))
+            self.api_call(summary.update, 'A1:G' + str(len(values)), values)
             
-            logging.info("✅ 요약 시트 업데이트 완료")
+            logging.info(f"✅ 요약 시트 업데이트 완료 ({len(summary_data) - 1}개 지역)")
             
         except Exception as e:
             logging.error(f"❌ 요약 시트 생성 실패: {e}")
     
+    def summary_request_cost(self):
+        """요약 시트 갱신 예상 비용 (시트 생성 + 행 추가 + update)"""
+        return 3
+    
+    def find_data_file(self):
+        """업로드할 크롤링 결과 파일 (CRAWLED_DATA_FILE 또는 가장 최근 결과)"""
+        if self.data_file:
+            return self.data_file
+        candidates = sorted(glob.glob(CRAWLED_DATA_PATTERN))
+        return candidates[-1] if candidates else None
+    
+    @staticmethod
+    def region_data_hash(vehicles):
+        """지역 데이터 해시 (지난 업로드 이후 변경 여부 판단)"""
+        payload = json.dumps([vehicle.to_dict() for vehicle in vehicles], ensure_ascii=False, sort_keys=True)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+    
+    def request_budget(self, progress):
+        """이번 실행에 쓸 수 있는 요청 수 (오늘 남은 일일 한도와 실행 시간 한도 중 작은 값)"""
+        remaining_today = self.max_requests_per_day - progress['requests_today']
+        per_run = self.max_requests_per_minute * self.max_run_minutes
+        return max(0, min(remaining_today, per_run))
+    
+    def plan_regions(self, regions, progress, budget, existing_sheets):
+        """오래 갱신되지 않은 지역부터 예산 안에서 갱신할 지역 선택 (한 번도 갱신하지 않은 지역 우선)"""
+        def staleness(region):
+            updated_at = progress['regions'].get(region, {}).get('updated_at')
+            return (updated_at is not None, updated_at or '')
+        
+        planned = []
+        for region in sorted(regions, key=staleness):
+            cost = REGION_UPDATE_COST + (0 if f'2025 {region}' in existing_sheets else SHEET_CREATE_COST)
+            if cost > budget:
+                break
+            planned.append(region)
+            budget -= cost
+        return planned
+    
     def daily_update(self):
-        """일일 업데이트 작업"""
+        """일일 업데이트 작업 (할당량 안에서 오래된 지역부터 순환 갱신)"""
         logging.info("🔄 일일 업데이트 시작...")
         start_time = time.time()
         
+        progress = self.load_progress()
+        requests_before = progress['requests_today']
+        self.request_count = 0
+        
         try:
             # 1. 기존 크롤링 데이터 로드
-            with open('ev_subsidy_all_regions_20250712_191009.json', 'r', encoding='utf-8') as f:
-                crawled_data = json.load(f)
+            data_file = self.find_data_file()
+            if not data_file:
+                logging.error(f"❌ 크롤링 결과 파일이 없습니다 ({CRAWLED_DATA_PATTERN})")
+                return
+            with open(data_file, 'r', encoding='utf-8') as f:
+                # 금액은 여기서 한 번만 숫자로 변환 (이전 형식의 문자열 금액도 읽음)
+                crawled_data = {
+                    region: [VehicleRecord.from_dict(vehicle) for vehicle in vehicles]
+                    for region, vehicles in json.load(f).items()
+                }
+            logging.info(f"📂 데이터 파일: {data_file} ({len(crawled_data)}개 지역)")
+            
+            # 2. 시트 목록은 한 번만 조회
+            sheets = {sheet.title: sheet for sheet in self.api_call(self.spreadsheet.worksheets)}
             
-            # 2. 지역별로 순차적으로 업데이트 (API 제한 고려)
-            regions_to_update = list(crawled_data.keys())[:5]  # 하루에 5개 지역씩
+            # 3. 지난 업로드 이후 데이터가 같은 지역은 호출 없이 최신 상태로 처리
+            now = datetime.now().isoformat()
+            pending = []
+            for region, vehicles in crawled_data.items():
+                if not vehicles:
+                    continue
+                state = progress['regions'].get(region, {})
+                if f'2025 {region}' in sheets and state.get('hash') == self.region_data_hash(vehicles):
+                    state['updated_at'] = now
+                    progress['regions'][region] = state
+                else:
+                    pending.append(region)
+            
+            # 4. 예산 안에서 오래된 지역부터 갱신
+            budget = (self.request_budget(progress) - RUN_OVERHEAD_COST
+                      - self.summary_request_cost())
+            regions_to_update = self.plan_regions(pending, progress, budget, sheets)
+            logging.info(f"📋 갱신 대상 {len(pending)}개 지역 중 {len(regions_to_update)}개 갱신 "
+                         f"(예산 {max(budget, 0)}회, 데이터 변경 없음 {len(crawled_data) - len(pending)}개)")
             
             for region in regions_to_update:
-                if region in crawled_data and crawled_data[region]:
-                    sheet_name = f'2025 {region}'
-                    
-                    # 시트 존재 확인
-                    try:
-                        self.spreadsheet.worksheet(sheet_name)
-                    except:
-                        # 시트 생성
-                        self.rate_limit()
-                        self.spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=10)
+                sheet_name = f'2025 {region}'
+                
+                # 시트 생성
+                worksheet = sheets.get(sheet_name)
+                if worksheet is None:
+                    worksheet = self.api_call(self.spreadsheet.add_worksheet, title=sheet_name, rows=1000, cols=10)
+                    sheets[sheet_name] = worksheet
+                
+                # 데이터 업데이트
+                if self.update_vehicle_data_batch(sheet_name, crawled_data[region], worksheet=worksheet):
+                    progress['regions'][region] = {
+                        'updated_at': datetime.now().isoformat(),
+                        'hash': self.region_data_hash(crawled_data[region])
+                    }
+                    progress['last_region'] = region
                     
-                    # 데이터 업데이트
-                    self.update_vehicle_data_batch(sheet_name, crawled_data[region])
-                    
-                    # 진행 상황 저장
-                    self.save_progress(region)
+                    # 진행 상황 저장 (중간에 종료돼도 다음 실행에서 이어서 순환)
+                    progress['requests_today'] = requests_before + self.request_count
+                    self.save_progress(progress)
+            
+            # 5. 요약 시트 업데이트 (갱신한 지역이 있을 때만, 예산에 미리 반영됨)
+            if regions_to_update:
+                self.create_summary_sheet(crawled_data, sheets)
+            else:
+                logging.info("⏭️ 갱신한 지역이 없어 요약 시트 업데이트 생략")
             
-            # 3. 요약 시트 업데이트
-            self.create_summary_sheet()
+            # 6. 최대 갱신 지연 예상 (일일 한도로 모든 지역을 한 번씩 갱신하는 데 걸리는 일수)
+            full_cycle_cost = len(crawled_data) * REGION_UPDATE_COST
+            daily_capacity = max(1, self.max_requests_per_day - RUN_OVERHEAD_COST
+                                 - self.summary_request_cost())
+            remaining = len(pending) - len(regions_to_update)
+            logging.info(f"📅 남은 갱신 대상 {remaining}개 지역, "
+                         f"모든 지역 최대 갱신 지연: 약 {math.ceil(full_cycle_cost / daily_capacity)}일")
             
             elapsed_time = time.time() - start_time
-            logging.info(f"✅ 일일 업데이트 완료 (소요시간: {elapsed_time:.1f}초)")
+            logging.info(f"✅ 일일 업데이트 완료 (소요시간: {elapsed_time:.1f}초, API 요청 {self.request_count}회)")
             
         except Exception as e:
             logging.error(f"❌ 일일 업데이트 실패: {e}")
+        
+        finally:
+            progress['requests_today'] = requests_before + self.request_count
+            self.save_progress(progress)
     
-    def save_progress(self, last_updated_region):
-        """진행 상황 저장"""
-        progress = {
-            'last_updated': datetime.now().isoformat(),
-            'last_region': last_updated_region
-        }
+    def save_progress(self, progress):
+        """진행 상황 저장 (임시 파일에 쓴 뒤 교체)"""
+        progress['last_updated'] = datetime.now().isoformat()
         
-        with open('.update_progress.json', 'w') as f:
-            json.dump(progress, f)
+        temp_file = PROGRESS_FILE + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(progress, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, PROGRESS_FILE)
     
     def load_progress(self):
-        """진행 상황 로드"""
+        """진행 상황 로드 (날짜가 바뀌면 오늘 요청 수 초기화, 이전 형식 파일도 읽음)"""
         try:
-            with open('.update_progress.json', 'r') as f:
-                return json.load(f)
-        except:
-            return None
+            with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            progress = {}
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        if progress.get('quota_day') != today:
+            progress['quota_day'] = today
+            progress['requests_today'] = 0
+        progress.setdefault('requests_today', 0)
+        progress.setdefault('regions', {})
+        return progress
 
 def main():
     """메인 실행 함수"""
@@ -0,0 +1,125 @@
+// 지역/제조사별 데이터 샤드 로더
+// data/manifest.json에서 샤드 경로를 찾아 필요한 지역(또는 제조사) 파일만 받습니다.
+// 샤드 파일명에는 내용 해시가 들어 있어 브라우저/CDN이 오래 캐시해도 됩니다.
+// 서버가 미리 압축된 파일을 직접 내려주지 않으므로, 브라우저가 지원하면 .gz 압축본을 받아 직접 풉니다.
+const DataShards = {
+    manifestUrl: '/data/manifest.json',
+    manifest: null,
+
+    // 매니페스트 로드 (항상 최신 확인, 페이지당 한 번)
+    async loadManifest() {
+        if (!this.manifest) {
+            const response = await fetch(this.manifestUrl, { cache: 'no-cache' });
+            if (!response.ok) {
+                throw new Error(`매니페스트 로드 실패: ${response.status}`);
+            }
+            this.manifest = await response.json();
+        }
+        return this.manifest;
+    },
+
+    // 연도 항목 (연도 미지정 시 최신 연도)
+    async getYear(year) {
+        const manifest = await this.loadManifest();
+        const entry = manifest.years[String(year || manifest.latestYear)];
+        if (!entry) {
+            throw new Error(`${year || manifest.latestYear}년 데이터가 없습니다`);
+        }
+        return entry;
+    },
+
+    // gzip 압축본을 받아 풀 수 있는지 (DecompressionStream 지원 브라우저)
+    canInflate() {
+        return typeof DecompressionStream !== 'undefined';
+    },
+
+    // 파일 본문 텍스트 (gzip 압축본이면 풀어서)
+    async fetchBody(file, gzipped) {
+        const response = await fetch(gzipped ? `${file}.gz` : file);
+        if (!response.ok) {
+            throw new Error(`파일 로드 실패: ${file} (${response.status})`);
+        }
+        if (!gzipped) {
+            return response.text();
+        }
+        const stream = response.body.pipeThrough(new DecompressionStream('gzip'));
+        return new Response(stream).text();
+    },
+
+    // 스키마 헤더 + 값 배열 → 객체 배열 (키는 컬럼의 원래 이름)
+    expandRows(columns, rows) {
+        const names = columns.map(column => column.name);
+        return rows.map(row => {
+            const record = {};
+            names.forEach((name, i) => { record[name] = row[i]; });
+            return record;
+        });
+    },
+
+    // 표({columns, rows}) → 객체 배열 (이미 객체 배열이면 그대로)
+    expandTable(table) {
+        return Array.isArray(table) ? table : this.expandRows(table.columns, table.rows);
+    },
+
+    // 샤드 파일 로드 (값 배열 행은 객체로 펼침)
+    async loadShard(file, year) {
+        const entry = await this.getYear(year);
+        const gzipped = this.canInflate() && (entry.variants || []).includes('gzip');
+        const shard = JSON.parse(await this.fetchBody(file, gzipped));
+        if (shard.columns) {
+            shard.rows = this.expandRows(shard.columns, shard.rows);
+        }
+        return shard;
+    },
+
+    // 데이터 파일(예: 'csv/2025.csv') 텍스트 - 매니페스트의 해시 이름 압축본 우선, 없으면 원래 경로
+    async fetchText(path) {
+        const key = path.replace(/^\//, '');
+        try {
+            const item = ((await this.loadManifest()).files || {})[key];
+            if (item) {
+                return await this.fetchBody(item.file, Boolean(item.gzip) && this.canInflate());
+            }
+        } catch (error) {
+            console.warn(`압축본 로드 실패, 원본 사용: ${path}`, error);
+        }
+
+        const response = await fetch(path);
+        if (!response.ok) {
+            throw new Error(`파일 로드 실패: ${path} (${response.status})`);
+        }
+        return response.text();
+    },
+
+    // 지역 한 곳의 차량별 보조금 행 (CSV 행과 같은 한국어 키, 금액은 숫자)
+    async loadRegion(region, year) {
+        const entry = await this.getYear(year);
+        const item = entry.regions[region];
+        if (!item) {
+            throw new Error(`${region} 샤드가 없습니다`);
+        }
+        return (await this.loadShard(item.file, year)).rows;
+    },
+
+    // 제조사 한 곳의 지역별 보조금 행
+    async loadManufacturer(manufacturer, year) {
+        const entry = await this.getYear(year);
+        const item = entry.manufacturers[manufacturer];
+        if (!item) {
+            throw new Error(`${manufacturer} 샤드가 없습니다`);
+        }
+        return (await this.loadShard(item.file, year)).rows;
+    },
+
+    // 지역/제조사 목록과 요약
+    async loadIndex(year) {
+        const entry = await this.getYear(year);
+        const index = await this.loadShard(entry.index, year);
+        index.regions = this.expandTable(index.regions);
+        index.manufacturers = this.expandTable(index.manufacturers);
+        return index;
+    }
+};
+
+// 전역 객체
+window.DataShards = DataShards;
@@ -9,8 +9,7 @@ class RegionSubsidyManager {
     // 데이터 초기화
     async initialize() {
         try {
-            const response = await fetch(`/csv/${this.year}.csv`);
-            const csvText = await response.text();
+            const csvText = await DataShards.fetchText(`/csv/${this.year}.csv`);
             this.parseCSV(csvText);
             return true;
         } catch (error) {
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+공유 요청 속도 제한기
+토큰 버킷으로 초당 요청 수를 제한하고, 429/5xx/타임아웃 시 지수 백오프(지터 포함)로 재시도합니다.
+Retry-After 헤더가 있으면 그 시간을 따르고, 서버가 제한을 걸면 속도를 낮췄다가 성공이 이어지면 다시 올립니다.
+
+같은 대상(ev.or.kr, Google Sheets)은 shared_limiter(이름)로 프로세스 전체에서 하나의 버킷을 공유합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# 재시도 대상 네트워크 예외 (설치된 HTTP 라이브러리만)
+RETRYABLE_EXCEPTIONS = (TimeoutError, ConnectionError)
+
+try:
+    import requests
+
+    RETRYABLE_EXCEPTIONS += (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+except ImportError:
+    pass
+
+try:
+    import httpx
+
+    RETRYABLE_EXCEPTIONS += (httpx.TimeoutException, httpx.TransportError)
+except ImportError:
+    pass
+
+# 공유 제한기 이름
+EV_SITE_LIMITER = 'ev.or.kr'
+SHEETS_LIMITER = 'google_sheets'
+
+# Google Sheets API 기본 속도 (사용자당 분당 60회 쓰기 할당량)
+DEFAULT_SHEETS_REQUESTS_PER_SECOND = 1.0
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 서버가 속도 제한을 알리는 상태 코드 (속도 낮춤)
+THROTTLE_STATUSES = (429, 503)
+
+
+class RateLimiter:
+    """스레드/이벤트 루프 공용 토큰 버킷 (제한 응답 시 속도 절반, 성공 시 조금씩 회복)
+
+    rate_per_second가 0 또는 None이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate_per_second, burst=1, min_rate=None, max_rate=None, name='default'):
+        self.name = name
+        self.burst = max(1, burst)
+        self.max_rate = max_rate or rate_per_second
+        self.min_rate = min_rate or (rate_per_second / 8 if rate_per_second else None)
+        self.rate = rate_per_second
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def set_rate(self, rate_per_second, max_rate=None):
+        """설정 속도 변경 (최대 속도도 함께 변경)"""
+        with self._lock:
+            self.rate = rate_per_second
+            self.max_rate = max_rate or rate_per_second
+            self.min_rate = rate_per_second / 8 if rate_per_second else None
+
+    def reserve(self):
+        """토큰 하나를 예약하고 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            if not self.rate:
+                return max(0.0, self._paused_until - now)
+
+            # 경과 시간만큼 토큰 충전 (최대 burst개)
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            # 토큰이 모자라면 음수로 예약해 다음 요청이 그만큼 뒤로 밀리도록 함
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def acquire(self):
+        """요청 전 호출 - 필요한 만큼 대기"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """이벤트 루프용 acquire"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self):
+        """성공 응답 - 설정된 최대 속도까지 조금씩 회복"""
+        if not self.rate or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttle(self, retry_after=None):
+        """제한 응답 - 속도를 절반으로 낮추고 Retry-After 동안 모든 요청 정지"""
+        with self._lock:
+            if self.rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+
+_shared_limiters = {}
+_shared_lock = threading.Lock()
+
+
+def shared_limiter(name, rate_per_second=None, burst=1):
+    """이름별 공유 제한기 (처음 호출 시 생성, 이후 속도를 지정하면 변경)"""
+    with _shared_lock:
+        limiter = _shared_limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(rate_per_second, burst=burst, name=name)
+            _shared_limiters[name] = limiter
+        elif rate_per_second is not None and rate_per_second != limiter.max_rate:
+            limiter.set_rate(rate_per_second)
+        return limiter
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """지수 백오프 + 전체 지터 (attempt는 0부터)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _headers_retry_after(headers):
+    """응답 헤더에서 Retry-After 추출 (requests/httpx/httplib2 헤더 모두 지원)"""
+    if not headers:
+        return None
+    return parse_retry_after(headers.get('Retry-After') or headers.get('retry-after'))
+
+
+def _retry_plan(limiter, status, retry_after, attempt, description):
+    """재시도 전 대기 시간 결정 및 제한기 속도 조정"""
+    if status in THROTTLE_STATUSES or retry_after:
+        limiter.on_throttle(retry_after)
+    delay = max(retry_after or 0, backoff_delay(attempt))
+    print(f"   ⏳ {description} 재시도 {attempt + 1}회 ({status or '네트워크 오류'}) - {delay:.1f}초 대기")
+    return delay
+
+
+def request_with_retry(send, limiter, max_retries=4, description='요청'):
+    """HTTP 요청 실행 (send()는 status_code/headers가 있는 응답 반환)
+
+    재시도 대상 상태 코드가 계속되면 마지막 응답을 그대로 반환하고,
+    네트워크 예외가 계속되면 마지막 예외를 다시 발생시킵니다.
+    """
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = send()
+        except RETRYABLE_EXCEPTIONS:
+            if attempt == max_retries:
+                raise
+            time.sleep(_retry_plan(limiter, None, None, attempt, description))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            limiter.on_success()
+            return response
+        if attempt == max_retries:
+            return response
+
+        retry_after = _headers_retry_after(response.headers)
+        time.sleep(_retry_plan(limiter, response.status_code, retry_after, attempt, description))
+
+
+async def request_with_retry_async(send, limiter, max_retries=4, description='요청'):
+    """request_with_retry의 비동기 버전 (send()는 응답을 돌려주는 코루틴 반환)"""
+    for attempt in range(max_retries + 1):
+        await limiter.acquire_async()
+        try:
+            response = await send()
+        except RETRYABLE_EXCEPTIONS:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(_retry_plan(limiter, None, None, attempt, description))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            limiter.on_success()
+            return response
+        if attempt == max_retries:
+            return response
+
+        retry_after = _headers_retry_after(response.headers)
+        await asyncio.sleep(_retry_plan(limiter, response.status_code, retry_after, attempt, description))
+
+
+def api_error_status(error):
+    """Google API 예외에서 (상태 코드, Retry-After 초) 추출
+
+    googleapiclient HttpError(e.resp)와 gspread APIError(e.response)를 모두 처리합니다.
+    """
+    resp = getattr(error, 'resp', None)
+    if resp is not None:
+        return getattr(resp, 'status', None), _headers_retry_after(resp)
+
+    response = getattr(error, 'response', None)
+    if response is not None:
+        return getattr(response, 'status_code', None), _headers_retry_after(getattr(response, 'headers', None))
+
+    return None, None
+
+
+def call_with_retry(call, limiter, max_retries=5, description='API 호출'):
+    """예외로 실패를 알리는 API 호출 실행 (예: Sheets .execute(), gspread 메서드)"""
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            result = call()
+        except Exception as e:
+            status, retry_after = api_error_status(e)
+            retryable = status in RETRY_STATUSES or isinstance(e, RETRYABLE_EXCEPTIONS)
+            if not retryable or attempt == max_retries:
+                raise
+            time.sleep(_retry_plan(limiter, status, retry_after, attempt, description))
+            continue
+
+        limiter.on_success()
+        return result
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+지역별 수집 이력과 건너뛰기 정책
+지역마다 최근 수집 결과(success / no_data / failed)와 마지막으로 데이터가 있었던 날짜를 남겨 두고,
+계속 데이터가 없는 지역은 매 실행이 아니라 주기적으로(기본 7일마다) 한 번씩만 확인합니다.
+데이터가 있는 지역은 매 실행 수집하고, 확인한 지역에서 데이터가 나오면 바로 매 실행 대상으로 돌아갑니다.
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime
+
+# 지역마다 보관할 최근 결과 수
+DEFAULT_HISTORY_LENGTH = 14
+
+# 이만큼 연속으로 데이터가 없으면 주기 확인 대상
+DEFAULT_EMPTY_STREAK = 7
+
+# 주기 확인 대상 지역을 다시 요청하는 간격 (일)
+DEFAULT_PROBE_INTERVAL_DAYS = 7
+
+EMPTY_STATUSES = ('no_data', 'failed')
+
+
+class RegionHistory:
+    """(연도, 차종)별 지역 수집 이력 (ev_data/region_history_{연도}_{차종}.json)"""
+
+    def __init__(self, year, car_type="11", history_dir='ev_data', history_length=DEFAULT_HISTORY_LENGTH,
+                 empty_streak=DEFAULT_EMPTY_STREAK, probe_interval_days=DEFAULT_PROBE_INTERVAL_DAYS):
+        self.year = str(year)
+        self.car_type = str(car_type)
+        self.history_file = os.path.join(history_dir, f"region_history_{self.year}_{self.car_type}.json")
+        self.history_length = history_length
+        self.empty_streak = empty_streak
+        self.probe_interval_days = max(1, int(probe_interval_days))
+
+        self._lock = threading.Lock()
+        self.skipped = []
+
+        os.makedirs(history_dir, exist_ok=True)
+        self.regions = self.load()
+
+    def load(self):
+        """이전 이력 로드 (없거나 읽을 수 없으면 빈 이력 - 모든 지역 수집)"""
+        if os.path.exists(self.history_file):
+            try:
+                with open(self.history_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('regions', {})
+            except Exception as e:
+                print(f"⚠️ 지역 이력 로드 실패, 전체 수집: {e}")
+        return {}
+
+    def save(self):
+        """이력 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            history = {
+                'updated_at': datetime.now().isoformat(),
+                'year': self.year,
+                'car_type': self.car_type,
+                'empty_streak': self.empty_streak,
+                'probe_interval_days': self.probe_interval_days,
+                'regions': self.regions
+            }
+            temp_file = self.history_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(history, f, ensure_ascii=False, indent=1)
+            os.replace(temp_file, self.history_file)
+
+    def is_cold(self, entry):
+        """최근 empty_streak번 연속으로 데이터가 없었는지"""
+        outcomes = entry.get('outcomes', []) if entry else []
+        recent = outcomes[-self.empty_streak:]
+        return len(recent) >= self.empty_streak and all(status in EMPTY_STATUSES for status in recent)
+
+    def is_probe_due(self, region, entry, today):
+        """주기 확인 대상 지역을 오늘 요청할지
+
+        지역코드로 요일을 나눠 확인 요청이 하루에 몰리지 않게 하고,
+        실행을 건너뛴 날이 있어도 마지막 확인 후 간격이 지나면 확인합니다.
+        """
+        try:
+            days_since = (today - date.fromisoformat(entry['last_checked'])).days
+        except (KeyError, TypeError, ValueError):
+            return True
+
+        if days_since >= self.probe_interval_days:
+            return True
+        slot = int(region['code']) if str(region['code']).isdigit() else 0
+        return days_since >= 1 and (today.toordinal() + slot) % self.probe_interval_days == 0
+
+    def should_crawl(self, region, today=None):
+        """이번 실행에서 요청할 지역인지 (데이터가 계속 없는 지역은 확인 주기가 된 날만)"""
+        today = today or date.today()
+        with self._lock:
+            entry = self.regions.get(region['code'])
+            if not self.is_cold(entry) or self.is_probe_due(region, entry, today):
+                return True
+            self.skipped.append(region['name'])
+            return False
+
+    def record(self, region, status, today=None):
+        """지역 수집 결과 기록 (success / no_data / failed)"""
+        today = (today or date.today()).isoformat()
+        with self._lock:
+            entry = self.regions.setdefault(region['code'], {'name': region['name'], 'outcomes': []})
+            entry['name'] = region['name']
+            entry['outcomes'] = (entry['outcomes'] + [status])[-self.history_length:]
+            entry['last_checked'] = today
+            if status == 'success':
+                entry['last_non_empty'] = today
+
+    def cold_regions(self):
+        """현재 주기 확인 대상 지역 이름 목록"""
+        with self._lock:
+            return [entry['name'] for entry in self.regions.values() if self.is_cold(entry)]
+
+    def print_summary(self):
+        """이번 실행에서 건너뛴 지역 요약 출력"""
+        if self.skipped:
+            print(f"⏭️ {self.year}년 차종 {self.car_type}: 데이터가 계속 없는 지역 {len(self.skipped)}개 건너뜀 "
+                  f"({self.probe_interval_days}일마다 확인)")
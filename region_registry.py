@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+지역 레지스트리
+지자체 차종별 보조금 목록 페이지(psPopupLocalCarPirce.do)에서 지역 코드를 찾아 연도별로 캐시하고,
+모든 크롤러가 같은 지역 목록을 쓰게 합니다. 캐시는 TTL(기본 7일)이 지나면 다시 조회하며,
+이전 목록과 비교해 추가/삭제/이름 변경된 지역을 기록합니다.
+
+목록 페이지를 읽을 수 없으면 마지막으로 저장한 목록(오래되었더라도), 그마저 없으면 내장 목록을 씁니다.
+
+사용법:
+    python region_registry.py                 # 현재 연도 목록 확인 (캐시가 유효하면 재조회 안 함)
+    python region_registry.py 2025 --refresh  # 강제로 다시 조회
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+# 목록 캐시 유효 기간 (지역은 연도 중에 거의 바뀌지 않음)
+DEFAULT_TTL_HOURS = 24 * 7
+
+REGISTRY_DIR = 'ev_data'
+
+# 목록 페이지의 지역 링크: goLocalCarPirce('1100','11','서울특별시')
+REGION_LINK_PATTERN = re.compile(r"goLocalCarPirce\(([^)]*)\)")
+QUOTED_ARGUMENT = re.compile(r"'([^']*)'|\"([^\"]*)\"")
+
+# 지역코드 앞 두 자리 → 광역시도 (CSV의 광역시도 열, 정렬 순서 기준)
+CATEGORY_BY_PREFIX = {
+    '11': '특별시',
+    '41': '경기도',
+    '26': '광역시', '27': '광역시', '28': '광역시', '29': '광역시', '30': '광역시', '31': '광역시',
+    '36': '특별자치시',
+    '42': '강원도', '51': '강원도',
+    '43': '충청북도',
+    '44': '충청남도',
+    '45': '전라북도', '52': '전라북도',
+    '46': '전라남도',
+    '47': '경상북도',
+    '48': '경상남도',
+    '50': '특별자치도'
+}
+
+# 광역시도 순서 (서울 → 경기도 → 광역시 → ... → 기타)
+CATEGORY_ORDER = ['특별시', '경기도', '광역시', '특별자치시', '강원도', '충청북도', '충청남도',
+                  '전라북도', '전라남도', '경상북도', '경상남도', '특별자치도', '기타']
+
+
+def region_category(code):
+    """지역코드 → 광역시도 (모르는 코드는 기타)"""
+    return CATEGORY_BY_PREFIX.get(str(code)[:2], '기타')
+
+
+def parse_region_list(html_content):
+    """목록 페이지 HTML → [{'code', 'name'}] (페이지 순서, 같은 코드는 한 번만)"""
+    regions = []
+    seen = set()
+
+    for match in REGION_LINK_PATTERN.finditer(html_content or ''):
+        arguments = [single or double for single, double in QUOTED_ARGUMENT.findall(match.group(1))]
+        names = [argument.strip() for argument in arguments[1:] if argument.strip() and not argument.isdigit()]
+        if not arguments or not arguments[0].isdigit() or not names or arguments[0] in seen:
+            continue
+
+        seen.add(arguments[0])
+        regions.append({'code': arguments[0], 'name': names[-1]})
+
+    return regions
+
+
+def order_regions(discovered, known=None):
+    """찾은 지역에 광역시도를 붙이고 내장 목록 순서로 정렬 (새 지역은 같은 광역시도의 끝에 추가)"""
+    known = known if known is not None else default_regions()
+    known_index = {region['code']: i for i, region in enumerate(known)}
+    known_category = {region['code']: region['category'] for region in known}
+
+    regions = [
+        {'code': region['code'], 'name': region['name'],
+         'category': known_category.get(region['code']) or region_category(region['code'])}
+        for region in discovered
+    ]
+
+    def sort_key(item):
+        i, region = item
+        rank = CATEGORY_ORDER.index(region['category']) if region['category'] in CATEGORY_ORDER else len(CATEGORY_ORDER)
+        return rank, known_index.get(region['code'], len(known)), i
+
+    return [region for _, region in sorted(enumerate(regions), key=sort_key)]
+
+
+def diff_regions(old_regions, new_regions):
+    """지역 목록 비교 - 추가/삭제/이름 변경"""
+    old_map = {region['code']: region for region in old_regions}
+    new_map = {region['code']: region for region in new_regions}
+
+    return {
+        'added': [f"{region['name']} ({code})" for code, region in new_map.items() if code not in old_map],
+        'removed': [f"{region['name']} ({code})" for code, region in old_map.items() if code not in new_map],
+        'renamed': [
+            {'code': code, 'before': old_map[code]['name'], 'after': region['name']}
+            for code, region in new_map.items()
+            if code in old_map and old_map[code]['name'] != region['name']
+        ]
+    }
+
+
+class RegionRegistry:
+    """연도별 지역 목록 캐시 (ev_data/region_registry_{연도}.json)"""
+
+    def __init__(self, year, car_type="11", ttl_hours=DEFAULT_TTL_HOURS, registry_dir=REGISTRY_DIR):
+        self.year = str(year)
+        self.car_type = str(car_type)
+        self.ttl_seconds = ttl_hours * 3600
+        self.registry_file = os.path.join(registry_dir, f"region_registry_{self.year}.json")
+        os.makedirs(registry_dir, exist_ok=True)
+
+    def load(self):
+        """저장된 목록 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(self.registry_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if entry.get('regions') else None
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry):
+        """TTL 이내에 조회한 목록인지"""
+        if not entry:
+            return False
+        try:
+            fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        except (KeyError, ValueError):
+            return False
+        return (datetime.now() - fetched_at).total_seconds() < self.ttl_seconds
+
+    def save(self, regions, changes):
+        """목록 저장 (임시 파일에 쓴 뒤 교체)"""
+        entry = {
+            'fetched_at': datetime.now().isoformat(),
+            'year': self.year,
+            'car_type': self.car_type,
+            'total_regions': len(regions),
+            'changes': changes,
+            'regions': regions
+        }
+        temp_file = self.registry_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, indent=1)
+        os.replace(temp_file, self.registry_file)
+        return entry
+
+    def refresh(self, fetch_list, previous=None):
+        """목록 페이지를 다시 읽어 저장 - 지역 목록, 실패하면 None
+
+        fetch_list(연도, 차종)은 목록 페이지 HTML(실패 시 None)을 반환하는 함수입니다.
+        """
+        discovered = parse_region_list(fetch_list(self.year, self.car_type))
+        if not discovered:
+            print(f"⚠️ {self.year}년 지역 목록을 찾지 못했습니다.")
+            return None
+
+        regions = order_regions(discovered)
+        changes = diff_regions(previous['regions'] if previous else default_regions(), regions)
+        self.save(regions, changes)
+
+        print(f"🗺️ {self.year}년 지역 목록 갱신: {len(regions)}개 지역 "
+              f"(추가 {len(changes['added'])}, 삭제 {len(changes['removed'])}, 이름 변경 {len(changes['renamed'])})")
+        for label, key in (('➕ 추가', 'added'), ('➖ 삭제', 'removed')):
+            if changes[key]:
+                print(f"   {label}: {', '.join(changes[key])}")
+        for renamed in changes['renamed']:
+            print(f"   📝 이름 변경: {renamed['before']} → {renamed['after']} ({renamed['code']})")
+        return regions
+
+    def get_regions(self, fetch_list=None, force_refresh=False):
+        """지역 목록 (캐시가 유효하면 캐시, 아니면 목록 페이지 조회)
+
+        fetch_list가 없으면(캐시 재생 모드 등) 조회하지 않고 저장된 목록이나 내장 목록을 씁니다.
+        """
+        entry = self.load()
+        if entry and not force_refresh and self.is_fresh(entry):
+            return entry['regions']
+
+        regions = self.refresh(fetch_list, entry) if fetch_list else None
+        if regions:
+            return regions
+
+        if entry:
+            print(f"   ℹ️ 저장된 {self.year}년 지역 목록 사용 ({entry['fetched_at'][:10]} 조회)")
+            return entry['regions']
+
+        print("   ℹ️ 내장 지역 목록 사용")
+        return default_regions()
+
+
+def default_regions():
+    """내장 지역 목록 (목록 페이지를 읽을 수 없을 때 사용, 광역시도 순서대로)"""
+    regions = []
+
+    # 1. 서울특별시
+    regions.extend([
+        {'code': '1100', 'name': '서울특별시', 'category': '특별시'}
+    ])
+
+    # 2. 수도권 (경기도)
+    gyeonggi_regions = [
+        {'code': '4111', 'name': '수원시', 'category': '경기도'},
+        {'code': '4113', 'name': '성남시', 'category': '경기도'},
+        {'code': '4115', 'name': '의정부시', 'category': '경기도'},
+        {'code': '4117', 'name': '안양시', 'category': '경기도'},
+        {'code': '4119', 'name': '부천시', 'category': '경기도'},
+        {'code': '4121', 'name': '광명시', 'category': '경기도'},
+        {'code': '4122', 'name': '평택시', 'category': '경기도'},
+        {'code': '4125', 'name': '동두천시', 'category': '경기도'},
+        {'code': '4127', 'name': '안산시', 'category': '경기도'},
+        {'code': '4128', 'name': '고양시', 'category': '경기도'},
+        {'code': '4129', 'name': '과천시', 'category': '경기도'},
+        {'code': '4131', 'name': '구리시', 'category': '경기도'},
+        {'code': '4136', 'name': '남양주시', 'category': '경기도'},
+        {'code': '4137', 'name': '오산시', 'category': '경기도'},
+        {'code': '4139', 'name': '시흥시', 'category': '경기도'},
+        {'code': '4141', 'name': '군포시', 'category': '경기도'},
+        {'code': '4143', 'name': '의왕시', 'category': '경기도'},
+        {'code': '4145', 'name': '하남시', 'category': '경기도'},
+        {'code': '4146', 'name': '용인시', 'category': '경기도'},
+        {'code': '4148', 'name': '파주시', 'category': '경기도'},
+        {'code': '4150', 'name': '이천시', 'category': '경기도'},
+        {'code': '4155', 'name': '안성시', 'category': '경기도'},
+        {'code': '4157', 'name': '김포시', 'category': '경기도'},
+        {'code': '4159', 'name': '화성시', 'category': '경기도'},
+        {'code': '4161', 'name': '광주시', 'category': '경기도'},
+        {'code': '4163', 'name': '양주시', 'category': '경기도'},
+        {'code': '4165', 'name': '포천시', 'category': '경기도'},
+        {'code': '4167', 'name': '여주시', 'category': '경기도'},
+        {'code': '4180', 'name': '연천군', 'category': '경기도'},
+        {'code': '4182', 'name': '가평군', 'category': '경기도'},
+        {'code': '4183', 'name': '양평군', 'category': '경기도'}
+    ]
+    regions.extend(gyeonggi_regions)
+
+    # 3. 인천광역시
+    regions.extend([
+        {'code': '2800', 'name': '인천광역시', 'category': '광역시'}
+    ])
+
+    # 4. 광역시들
+    metro_cities = [
+        {'code': '2600', 'name': '부산광역시', 'category': '광역시'},
+        {'code': '2700', 'name': '대구광역시', 'category': '광역시'},
+        {'code': '2900', 'name': '광주광역시', 'category': '광역시'},
+        {'code': '3000', 'name': '대전광역시', 'category': '광역시'},
+        {'code': '3100', 'name': '울산광역시', 'category': '광역시'}
+    ]
+    regions.extend(metro_cities)
+
+    # 5. 세종특별자치시
+    regions.extend([
+        {'code': '3611', 'name': '세종특별자치시', 'category': '특별자치시'}
+    ])
+
+    # 6. 강원도
+    gangwon_regions = [
+        {'code': '4211', 'name': '춘천시', 'category': '강원도'},
+        {'code': '4213', 'name': '원주시', 'category': '강원도'},
+        {'code': '4215', 'name': '강릉시', 'category': '강원도'},
+        {'code': '4217', 'name': '동해시', 'category': '강원도'},
+        {'code': '4219', 'name': '태백시', 'category': '강원도'},
+        {'code': '4221', 'name': '속초시', 'category': '강원도'},
+        {'code': '4223', 'name': '삼척시', 'category': '강원도'},
+        {'code': '4272', 'name': '홍천군', 'category': '강원도'},
+        {'code': '4273', 'name': '횡성군', 'category': '강원도'},
+        {'code': '4275', 'name': '영월군', 'category': '강원도'},
+        {'code': '4276', 'name': '평창군', 'category': '강원도'},
+        {'code': '4277', 'name': '정선군', 'category': '강원도'},
+        {'code': '4278', 'name': '철원군', 'category': '강원도'},
+        {'code': '4279', 'name': '화천군', 'category': '강원도'},
+        {'code': '4280', 'name': '양구군', 'category': '강원도'},
+        {'code': '4281', 'name': '인제군', 'category': '강원도'},
+        {'code': '4282', 'name': '고성군', 'category': '강원도'},
+        {'code': '4283', 'name': '양양군', 'category': '강원도'}
+    ]
+    regions.extend(gangwon_regions)
+
+    # 7. 충청북도
+    chungbuk_regions = [
+        {'code': '4311', 'name': '청주시', 'category': '충청북도'},
+        {'code': '4313', 'name': '충주시', 'category': '충청북도'},
+        {'code': '4315', 'name': '제천시', 'category': '충청북도'},
+        {'code': '4372', 'name': '보은군', 'category': '충청북도'},
+        {'code': '4373', 'name': '옥천군', 'category': '충청북도'},
+        {'code': '43745', 'name': '증평군', 'category': '충청북도'},
+        {'code': '4374', 'name': '영동군', 'category': '충청북도'},
+        {'code': '4375', 'name': '진천군', 'category': '충청북도'},
+        {'code': '4376', 'name': '괴산군', 'category': '충청북도'},
+        {'code': '4377', 'name': '음성군', 'category': '충청북도'},
+        {'code': '4380', 'name': '단양군', 'category': '충청북도'}
+    ]
+    regions.extend(chungbuk_regions)
+
+    # 8. 충청남도
+    chungnam_regions = [
+        {'code': '4413', 'name': '천안시', 'category': '충청남도'},
+        {'code': '4415', 'name': '공주시', 'category': '충청남도'},
+        {'code': '4418', 'name': '보령시', 'category': '충청남도'},
+        {'code': '4420', 'name': '아산시', 'category': '충청남도'},
+        {'code': '4421', 'name': '서산시', 'category': '충청남도'},
+        {'code': '4423', 'name': '논산시', 'category': '충청남도'},
+        {'code': '4425', 'name': '계룡시', 'category': '충청남도'},
+        {'code': '4427', 'name': '당진시', 'category': '충청남도'},
+        {'code': '4471', 'name': '금산군', 'category': '충청남도'},
+        {'code': '4476', 'name': '부여군', 'category': '충청남도'},
+        {'code': '4477', 'name': '서천군', 'category': '충청남도'},
+        {'code': '4479', 'name': '청양군', 'category': '충청남도'},
+        {'code': '4480', 'name': '홍성군', 'category': '충청남도'},
+        {'code': '4481', 'name': '예산군', 'category': '충청남도'},
+        {'code': '44825', 'name': '태안군', 'category': '충청남도'}
+    ]
+    regions.extend(chungnam_regions)
+
+    # 9. 전라북도
+    jeonbuk_regions = [
+        {'code': '4511', 'name': '전주시', 'category': '전라북도'},
+        {'code': '4513', 'name': '군산시', 'category': '전라북도'},
+        {'code': '4514', 'name': '익산시', 'category': '전라북도'},
+        {'code': '4518', 'name': '정읍시', 'category': '전라북도'},
+        {'code': '4519', 'name': '남원시', 'category': '전라북도'},
+        {'code': '4521', 'name': '김제시', 'category': '전라북도'},
+        {'code': '4571', 'name': '완주군', 'category': '전라북도'},
+        {'code': '4572', 'name': '진안군', 'category': '전라북도'},
+        {'code': '4573', 'name': '무주군', 'category': '전라북도'},
+        {'code': '4574', 'name': '장수군', 'category': '전라북도'},
+        {'code': '4575', 'name': '임실군', 'category': '전라북도'},
+        {'code': '4577', 'name': '순창군', 'category': '전라북도'},
+        {'code': '4579', 'name': '고창군', 'category': '전라북도'},
+        {'code': '4580', 'name': '부안군', 'category': '전라북도'}
+    ]
+    regions.extend(jeonbuk_regions)
+
+    # 10. 전라남도
+    jeonnam_regions = [
+        {'code': '4611', 'name': '목포시', 'category': '전라남도'},
+        {'code': '4613', 'name': '여수시', 'category': '전라남도'},
+        {'code': '4615', 'name': '순천시', 'category': '전라남도'},
+        {'code': '4617', 'name': '나주시', 'category': '전라남도'},
+        {'code': '4623', 'name': '광양시', 'category': '전라남도'},
+        {'code': '4671', 'name': '담양군', 'category': '전라남도'},
+        {'code': '4672', 'name': '곡성군', 'category': '전라남도'},
+        {'code': '4673', 'name': '구례군', 'category': '전라남도'},
+        {'code': '4677', 'name': '고흥군', 'category': '전라남도'},
+        {'code': '4678', 'name': '보성군', 'category': '전라남도'},
+        {'code': '4679', 'name': '화순군', 'category': '전라남도'},
+        {'code': '4680', 'name': '장흥군', 'category': '전라남도'},
+        {'code': '4681', 'name': '강진군', 'category': '전라남도'},
+        {'code': '4682', 'name': '해남군', 'category': '전라남도'},
+        {'code': '4683', 'name': '영암군', 'category': '전라남도'},
+        {'code': '4684', 'name': '무안군', 'category': '전라남도'},
+        {'code': '4686', 'name': '함평군', 'category': '전라남도'},
+        {'code': '4687', 'name': '영광군', 'category': '전라남도'},
+        {'code': '4688', 'name': '장성군', 'category': '전라남도'},
+        {'code': '4689', 'name': '완도군', 'category': '전라남도'},
+        {'code': '4690', 'name': '진도군', 'category': '전라남도'},
+        {'code': '4691', 'name': '신안군', 'category': '전라남도'}
+    ]
+    regions.extend(jeonnam_regions)
+
+    # 11. 경상북도
+    gyeongbuk_regions = [
+        {'code': '4711', 'name': '포항시', 'category': '경상북도'},
+        {'code': '4713', 'name': '경주시', 'category': '경상북도'},
+        {'code': '4715', 'name': '김천시', 'category': '경상북도'},
+        {'code': '4717', 'name': '안동시', 'category': '경상북도'},
+        {'code': '4719', 'name': '구미시', 'category': '경상북도'},
+        {'code': '4721', 'name': '영주시', 'category': '경상북도'},
+        {'code': '4723', 'name': '영천시', 'category': '경상북도'},
+        {'code': '4725', 'name': '상주시', 'category': '경상북도'},
+        {'code': '4728', 'name': '문경시', 'category': '경상북도'},
+        {'code': '4729', 'name': '경산시', 'category': '경상북도'},
+        {'code': '4773', 'name': '의성군', 'category': '경상북도'},
+        {'code': '4775', 'name': '청송군', 'category': '경상북도'},
+        {'code': '4776', 'name': '영양군', 'category': '경상북도'},
+        {'code': '4777', 'name': '영덕군', 'category': '경상북도'},
+        {'code': '4782', 'name': '청도군', 'category': '경상북도'},
+        {'code': '4783', 'name': '고령군', 'category': '경상북도'},
+        {'code': '4784', 'name': '성주군', 'category': '경상북도'},
+        {'code': '4785', 'name': '칠곡군', 'category': '경상북도'},
+        {'code': '4790', 'name': '예천군', 'category': '경상북도'},
+        {'code': '4792', 'name': '봉화군', 'category': '경상북도'},
+        {'code': '4793', 'name': '울진군', 'category': '경상북도'},
+        {'code': '4794', 'name': '울릉군', 'category': '경상북도'}
+    ]
+    regions.extend(gyeongbuk_regions)
+
+    # 12. 경상남도
+    gyeongnam_regions = [
+        {'code': '4812', 'name': '창원시', 'category': '경상남도'},
+        {'code': '4817', 'name': '진주시', 'category': '경상남도'},
+        {'code': '4822', 'name': '통영시', 'category': '경상남도'},
+        {'code': '4824', 'name': '사천시', 'category': '경상남도'},
+        {'code': '4825', 'name': '김해시', 'category': '경상남도'},
+        {'code': '4827', 'name': '밀양시', 'category': '경상남도'},
+        {'code': '4831', 'name': '거제시', 'category': '경상남도'},
+        {'code': '4833', 'name': '양산시', 'category': '경상남도'},
+        {'code': '4872', 'name': '의령군', 'category': '경상남도'},
+        {'code': '4873', 'name': '함안군', 'category': '경상남도'},
+        {'code': '4874', 'name': '창녕군', 'category': '경상남도'},
+        {'code': '4882', 'name': '고성군', 'category': '경상남도'},
+        {'code': '4884', 'name': '남해군', 'category': '경상남도'},
+        {'code': '4885', 'name': '하동군', 'category': '경상남도'},
+        {'code': '4886', 'name': '산청군', 'category': '경상남도'},
+        {'code': '4887', 'name': '함양군', 'category': '경상남도'},
+        {'code': '4888', 'name': '거창군', 'category': '경상남도'},
+        {'code': '4889', 'name': '합천군', 'category': '경상남도'}
+    ]
+    regions.extend(gyeongnam_regions)
+
+    # 13. 제주특별자치도
+    regions.extend([
+        {'code': '5000', 'name': '제주특별자치도', 'category': '특별자치도'}
+    ])
+
+    # 14. 기타
+    regions.extend([
+        {'code': '9999', 'name': '한국환경공단', 'category': '기타'}
+    ])
+
+    return regions
+
+if __name__ == "__main__":
+    from ev_crawler_core import EVCrawlerCore
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    year = args[0] if args else str(datetime.now().year)
+
+    crawler = EVCrawlerCore()
+    registry = RegionRegistry(year)
+    if not crawler.get_session_cookies():
+        sys.exit(1)
+
+    regions = registry.get_regions(crawler.get_local_car_price_list, force_refresh='--refresh' in sys.argv)
+    print(f"✅ {year}년 지역 {len(regions)}개: {registry.registry_file}")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+지역별 수집 결과 임시 보관
+지역 결과(JSON으로 바꿀 수 있는 레코드 목록)를 임시 파일에 한 줄씩 이어 쓰고,
+메모리에는 키별 파일 위치와 출력 순서만 둡니다. 같은 키로 여러 번 넣은 결과
+(같은 지역의 여러 차종, 이름이 같은 다른 광역시도 지역)는 꺼낼 때 순서대로 합칩니다.
+"""
+
+import json
+import tempfile
+
+
+class RegionSpool:
+    """키 → 레코드 목록을 임시 파일에 보관 (한 번에 한 키의 레코드만 메모리에 올림)"""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.offsets = {}
+        self.order = {}
+        self.record_count = 0
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, key):
+        return key in self.offsets
+
+    def add(self, key, records, order=None):
+        """키의 레코드 목록 추가 (order: 출력 순서 키, 같은 키는 가장 앞선 값 사용 - 없으면 처음 넣은 순서)"""
+        self._file.seek(0, 2)
+        self.offsets.setdefault(key, []).append(self._file.tell())
+        self._file.write(json.dumps(records, ensure_ascii=False) + '\n')
+        if order is None:
+            self.order.setdefault(key, (len(self.order),))
+        else:
+            self.order[key] = min(self.order.get(key, order), order)
+        self.record_count += len(records)
+
+    def _read(self, key):
+        records = []
+        for offset in self.offsets.get(key, []):
+            self._file.seek(offset)
+            records.extend(json.loads(self._file.readline()))
+        return records
+
+    def take(self, key):
+        """키의 레코드 목록을 합쳐서 꺼내고 보관 목록에서 제거 (없으면 빈 리스트)"""
+        records = self._read(key)
+        self.record_count -= len(records)
+        self.offsets.pop(key, None)
+        self.order.pop(key, None)
+        return records
+
+    def items(self):
+        """(키, 합친 레코드 목록)을 출력 순서대로 하나씩 반환"""
+        for key in sorted(self.offsets, key=self.order.get):
+            yield key, self._read(key)
+
+    def close(self):
+        """임시 파일 삭제"""
+        self._file.close()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+지역별 수집 상태 저장소
+실행 간 지역별 응답 해시와 파싱 결과를 유지해 변경된 지역만 다시 처리하고,
+지역별 차량 추가/삭제/변경 내역을 리포트로 남깁니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from compact_json import AMOUNT_FIELDS as SUBSIDY_FIELDS
+from vehicle_record import VehicleRecord
+
+
+class RegionStateStore:
+    """지역코드 단위 상태 저장 (소비자별로 파일 분리: csv, sheets 등)"""
+
+    def __init__(self, name, year, car_type="11", state_dir='ev_data'):
+        self.name = name
+        self.year = year
+        self.car_type = car_type
+        self.state_dir = state_dir
+        self.state_file = os.path.join(state_dir, f"region_state_{name}_{year}_{car_type}.json")
+        self.report_file = os.path.join(state_dir, f"change_report_{name}_{year}_{car_type}.json")
+
+        self._lock = threading.Lock()
+        self.changes = {}
+        self.unchanged_regions = []
+
+        os.makedirs(state_dir, exist_ok=True)
+        self.regions = self.load_state()
+
+    def load_state(self):
+        """이전 실행 상태 로드 (차량은 VehicleRecord로, 금액이 문자열인 이전 형식도 읽음)"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    regions = json.load(f).get('regions', {})
+                for entry in regions.values():
+                    entry['vehicles'] = [VehicleRecord.from_dict(vehicle) for vehicle in entry['vehicles']]
+                return regions
+            except Exception as e:
+                print(f"⚠️ 지역 상태 로드 실패, 전체 재처리: {e}")
+        return {}
+
+    def save_state(self):
+        """현재 상태 저장"""
+        with self._lock:
+            state = {
+                'updated_at': datetime.now().isoformat(),
+                'year': self.year,
+                'car_type': self.car_type,
+                'regions': {
+                    code: {**entry, 'vehicles': [vehicle.to_dict() for vehicle in entry['vehicles']]}
+                    for code, entry in self.regions.items()
+                }
+            }
+            temp_file = self.state_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temp_file, self.state_file)
+
+    @staticmethod
+    def content_hash(content):
+        """응답 본문 해시값 계산"""
+        return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def vehicle_key(vehicle):
+        """차량 식별 키 (제조사+차종+모델명)"""
+        return f"{vehicle.get('manufacturer', '')}_{vehicle.get('model', '')}_{vehicle.get('model_detail', '')}"
+
+    def get_unchanged(self, region, content_hash):
+        """응답이 이전과 같으면 이전 파싱 결과 반환, 다르면 None"""
+        with self._lock:
+            previous = self.regions.get(region['code'])
+            if previous and previous['hash'] == content_hash:
+                self.unchanged_regions.append(region['name'])
+                return previous['vehicles']
+        return None
+
+    def record(self, region, content_hash, vehicles):
+        """새 파싱 결과 저장 및 이전 결과와 비교"""
+        with self._lock:
+            previous = self.regions.get(region['code'])
+            self.regions[region['code']] = {
+                'name': region['name'],
+                'hash': content_hash,
+                'vehicles': vehicles
+            }
+
+            changes = self.diff_vehicles(previous['vehicles'] if previous else [], vehicles)
+            if any(changes.values()):
+                # 같은 이름의 지역(예: 고성군)이 있어 지역코드를 함께 기록
+                self.changes[f"{region['name']} ({region['code']})"] = changes
+            else:
+                self.unchanged_regions.append(region['name'])
+            return changes
+
+    def diff_vehicles(self, old_vehicles, new_vehicles):
+        """차량 목록 비교 - 추가/삭제/보조금 변경"""
+        old_map = {self.vehicle_key(v): v for v in old_vehicles}
+        new_map = {self.vehicle_key(v): v for v in new_vehicles}
+
+        added = [key for key in new_map if key not in old_map]
+        removed = [key for key in old_map if key not in new_map]
+        modified = []
+        for key in new_map:
+            if key in old_map:
+                before = {field: old_map[key].get(field) for field in SUBSIDY_FIELDS}
+                after = {field: new_map[key].get(field) for field in SUBSIDY_FIELDS}
+                if before != after:
+                    modified.append({'vehicle': key, 'before': before, 'after': after})
+
+        return {'added': added, 'removed': removed, 'modified': modified}
+
+    def has_changes(self):
+        """이번 실행에서 변경된 지역이 있는지 확인"""
+        return bool(self.changes)
+
+    def save_report(self):
+        """변경 리포트 저장 및 요약 출력"""
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'year': self.year,
+            'car_type': self.car_type,
+            'changed_regions': len(self.changes),
+            'unchanged_regions': len(self.unchanged_regions),
+            'changes': self.changes
+        }
+        with open(self.report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print(f"\n🔄 변경 리포트 ({self.name}): 변경 {len(self.changes)}개 지역, "
+              f"변경 없음 {len(self.unchanged_regions)}개 지역")
+        for region_name, changes in self.changes.items():
+            print(f"   {region_name}: ➕ {len(changes['added'])}  ➖ {len(changes['removed'])}  "
+                  f"📝 {len(changes['modified'])}")
+        print(f"📁 변경 리포트 저장: {self.report_file}")
+        return report
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+지역 상세 페이지 응답 캐시
+(연도, 지역코드, 차종) 단위로 HTML을 디스크에 저장하고
+ETag/Last-Modified 조건부 요청과 캐시 재생 모드를 지원합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ResponseCache:
+    """디스크 기반 응답 캐시 (TTL 내에는 재요청 없음, 최대 용량 초과 시 오래된 항목부터 삭제)"""
+
+    def __init__(self, cache_dir=os.path.join('ev_data', 'response_cache'),
+                 ttl_seconds=6 * 3600, max_age_seconds=30 * 24 * 3600,
+                 max_size_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.Lock()
+        self.stats = {'hit': 0, 'miss': 0, 'not_modified': 0, 'stored': 0, 'evicted': 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self.load_index()
+
+        # 시작 시 만료 항목/용량 정리
+        with self._lock:
+            self._evict()
+            self._save_index()
+
+    @staticmethod
+    def make_key(year, local_cd, car_type):
+        """캐시 키 생성"""
+        return f"{year}_{car_type}_{local_cd}"
+
+    @staticmethod
+    def content_hash(content):
+        """응답 본문 해시값 계산"""
+        return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+    def load_index(self):
+        """캐시 인덱스 로드"""
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️ 캐시 인덱스 로드 실패, 새로 시작: {e}")
+        return {}
+
+    def _save_index(self):
+        """캐시 인덱스 저장 (잠금 보유 상태에서 호출)"""
+        temp_file = self.index_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(temp_file, self.index_file)
+
+    def _remove_entry(self, key):
+        """캐시 항목과 파일 삭제 (잠금 보유 상태에서 호출)"""
+        entry = self.index.pop(key, None)
+        if entry:
+            try:
+                os.remove(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
+            self.stats['evicted'] += 1
+
+    def _evict(self):
+        """최대 보관 기간 초과 항목 삭제 후, 용량 초과 시 가장 오래 쓰지 않은 항목부터 삭제"""
+        now = time.time()
+        for key in [k for k, e in self.index.items() if now - e['fetched_at'] > self.max_age_seconds]:
+            self._remove_entry(key)
+
+        total_size = sum(e['size'] for e in self.index.values())
+        if total_size <= self.max_size_bytes:
+            return
+
+        for key in sorted(self.index, key=lambda k: self.index[k]['accessed_at']):
+            total_size -= self.index[key]['size']
+            self._remove_entry(key)
+            if total_size <= self.max_size_bytes:
+                break
+
+    def get(self, year, local_cd, car_type):
+        """캐시 항목 조회 - 항목 정보에 'content'를 포함해 반환, 없으면 None"""
+        key = self.make_key(year, local_cd, car_type)
+        with self._lock:
+            entry = self.index.get(key)
+            if not entry:
+                return None
+
+            try:
+                with open(os.path.join(self.cache_dir, entry['file']), 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except OSError:
+                self.index.pop(key, None)
+                return None
+
+            entry['accessed_at'] = time.time()
+            return dict(entry, content=content)
+
+    def is_fresh(self, entry):
+        """TTL 이내 항목인지 확인"""
+        return entry is not None and time.time() - entry['fetched_at'] < self.ttl_seconds
+
+    def conditional_headers(self, entry):
+        """조건부 요청 헤더 (ETag/Last-Modified가 있는 경우만)"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, year, local_cd, car_type, content, etag=None, last_modified=None):
+        """응답 저장"""
+        key = self.make_key(year, local_cd, car_type)
+        filename = f"{key}.html"
+        data = content.encode('utf-8')
+        now = time.time()
+
+        with self._lock:
+            with open(os.path.join(self.cache_dir, filename), 'wb') as f:
+                f.write(data)
+
+            self.index[key] = {
+                'file': filename,
+                'content_hash': self.content_hash(content),
+                'fetched_at': now,
+                'accessed_at': now,
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': len(data)
+            }
+            self.stats['stored'] += 1
+            self._evict()
+            self._save_index()
+
+    def touch(self, year, local_cd, car_type):
+        """304 응답 시 수집 시각만 갱신"""
+        key = self.make_key(year, local_cd, car_type)
+        with self._lock:
+            if key in self.index:
+                self.index[key]['fetched_at'] = time.time()
+                self._save_index()
+
+    def count(self, kind):
+        """캐시 사용 통계 기록 (hit, miss, not_modified)"""
+        with self._lock:
+            self.stats[kind] += 1
+
+    def print_stats(self):
+        """캐시 사용 통계 출력"""
+        print(f"💾 응답 캐시: 적중 {self.stats['hit']}건, 304 재검증 {self.stats['not_modified']}건, "
+              f"신규 저장 {self.stats['stored']}건, 미적중 {self.stats['miss']}건, 삭제 {self.stats['evicted']}건")
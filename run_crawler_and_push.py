@@ -27,7 +27,7 @@ def run_crawler():
         
         # 크롤러 실행
         result = subprocess.run(
-            [sys.executable, "electric_car_csv_crawler.py"],
+            [sys.executable, "electric_car_csv_crawler.py", "--compact"],
             capture_output=True,
             text=True,
             check=True
@@ -65,6 +65,12 @@ def git_add_and_commit():
         logging.info("📁 CSV 파일을 Git에 추가 중...")
         subprocess.run(["git", "add", "csv/*.csv"], shell=True, check=True)
         subprocess.run(["git", "add", "csv/*.json"], shell=True, check=True)
+        # 컬럼형 스냅샷 (pyarrow 미설치 시 없으므로 무시)
+        subprocess.run("git add csv/*.arrow", shell=True)
+        # 지역별 변경 추적 상태 (없으면 무시)
+        subprocess.run("git add ev_data/region_state_csv_*.json ev_data/change_report_csv_*.json", shell=True)
+        # 사이트용 지역/제조사별 샤드 (삭제된 이전 샤드 포함)
+        subprocess.run("git add -A data", shell=True)
         
         # 커밋 메시지 생성
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
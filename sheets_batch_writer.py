@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Google Sheets 일괄 업로드 (Sheets API v4)
+스프레드시트 메타데이터는 한 번만 읽고, 시트 생성/삭제/값 입력/포맷팅을 모아 두었다가
+flush() 때 몇 번의 batchUpdate / values.batchGet / values.batchUpdate 호출로 반영합니다.
+160개 지역 기준 지역마다 5번씩(약 800번) 호출하던 것을 5번 안팎으로 줄입니다.
+
+sync_sheet로 예약한 시트는 기존 값을 values.batchGet 한 번으로 읽어 sheets_delta로 바뀐 행만 계산하고,
+수정/추가 행은 values.batchUpdate, 없어진 행은 deleteDimension으로만 반영합니다.
+"""
+
+from sheets_delta import cell_text, column_letter, compute_delta, delete_row_requests, plan_writes
+
+# 기본 시트 범위 (기존 데이터 삭제 범위와 동일)
+DEFAULT_CLEAR_COLUMNS = 'A1:Z1000'
+
+# values.batchUpdate 한 번에 보낼 최대 셀 수 (요청 크기 제한 대비)
+MAX_CELLS_PER_REQUEST = 100000
+
+
+def header_format_requests(sheet_id, column_count):
+    """헤더 행 강조 + 열 너비 자동 조정 요청"""
+    return [
+        {
+            'repeatCell': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 1
+                },
+                'cell': {
+                    'userEnteredFormat': {
+                        'backgroundColor': {
+                            'red': 0.2,
+                            'green': 0.5,
+                            'blue': 0.8
+                        },
+                        'textFormat': {
+                            'foregroundColor': {
+                                'red': 1.0,
+                                'green': 1.0,
+                                'blue': 1.0
+                            },
+                            'bold': True
+                        }
+                    }
+                },
+                'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+            }
+        },
+        {
+            'autoResizeDimensions': {
+                'dimensions': {
+                    'sheetId': sheet_id,
+                    'dimension': 'COLUMNS',
+                    'startIndex': 0,
+                    'endIndex': column_count
+                }
+            }
+        }
+    ]
+
+
+class SheetsBatchWriter:
+    """시트 단위 쓰기를 모아 한 번에 반영하는 Sheets 싱크
+
+    execute는 googleapiclient 요청 객체를 실행하는 함수입니다.
+    (예: EVSubsidyCrawler.execute - 공유 제한기와 재시도 적용)
+    """
+
+    def __init__(self, service, spreadsheet_id, execute=None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.execute = execute or (lambda request, description=None: request.execute())
+
+        self.sheet_ids = None
+        self.pending = {}
+
+    def load(self):
+        """스프레드시트의 시트 목록(제목 → sheetId)을 한 번만 조회"""
+        if self.sheet_ids is None:
+            spreadsheet = self.execute(self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ), description="시트 목록 조회")
+            self.sheet_ids = {
+                sheet['properties']['title']: sheet['properties']['sheetId']
+                for sheet in spreadsheet.get('sheets', [])
+            }
+        return self.sheet_ids
+
+    def has_sheet(self, title):
+        """시트 존재 여부 (이번 실행에서 생성 예정인 시트 포함)"""
+        return title in self.load() or title in self.pending
+
+    def write_sheet(self, title, values, clear=True, format_header=True):
+        """시트 전체 값 쓰기 예약 (values는 헤더 포함 2차원 리스트, A1부터 기록)"""
+        self.pending[title] = {
+            'data': [{'range': f"'{title}'!A1", 'values': values}] if values else [],
+            'deletes': [],
+            'clear': clear,
+            'format_header': format_header
+        }
+
+    def sync_sheet(self, title, headers, rows, key_width, compare_width=None):
+        """바뀐 행만 반영하는 쓰기 예약 (키: 앞쪽 key_width개 컬럼, 비교: 앞쪽 compare_width개 컬럼)
+
+        새 시트이거나 비어 있거나 헤더가 다르면 flush() 때 전체 쓰기로 바뀝니다.
+        """
+        self.pending[title] = {
+            'sync': (headers, rows, key_width, compare_width),
+            'data': [],
+            'deletes': [],
+            'clear': False,
+            'format_header': False
+        }
+
+    def _plan_syncs(self, existing_titles):
+        """sync_sheet 시트의 기존 값을 values.batchGet 한 번으로 읽어 변경분 계획"""
+        synced = [title for title, item in self.pending.items() if 'sync' in item]
+        readable = [title for title in synced if title in existing_titles]
+
+        existing_values = {}
+        if readable:
+            response = self.execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=[f"'{title}'!A:{column_letter(len(self.pending[title]['sync'][0]))}"
+                        for title in readable]
+            ), description=f"시트 {len(readable)}개 읽기")
+            for title, value_range in zip(readable, response.get('valueRanges', [])):
+                existing_values[title] = value_range.get('values', [])
+
+        for title in synced:
+            item = self.pending[title]
+            headers, rows, key_width, compare_width = item['sync']
+            values = existing_values.get(title, [])
+            width = len(headers)
+
+            if not values or [cell_text(cell) for cell in values[0][:width]] != [cell_text(h) for h in headers]:
+                # 새 시트/빈 시트/헤더 변경 - 전체 다시 쓰기
+                item['data'] = [{'range': f"'{title}'!A1", 'values': [headers] + rows}]
+                item['clear'] = bool(values)
+                item['format_header'] = True
+                continue
+
+            delta = compute_delta(values, rows, key_width, compare_width=compare_width)
+            print(f"   🔄 {title}: {delta.summary()}")
+            item['data'], item['deletes'], _ = plan_writes(delta, len(values), width,
+                                                           range_prefix=f"'{title}'!")
+
+    def _create_missing_sheets(self):
+        """없는 시트를 batchUpdate 한 번으로 생성"""
+        missing = [title for title in self.pending if title not in self.sheet_ids]
+        if not missing:
+            return
+
+        response = self.execute(self.service.spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': [{'addSheet': {'properties': {'title': title}}} for title in missing]}
+        ), description=f"시트 {len(missing)}개 생성")
+
+        for reply in response.get('replies', []):
+            properties = reply['addSheet']['properties']
+            self.sheet_ids[properties['title']] = properties['sheetId']
+        print(f"   ✅ 새 시트 {len(missing)}개 생성")
+
+    def _clear_sheets(self):
+        """기존 데이터 삭제를 values.batchClear 한 번으로 처리"""
+        ranges = [f"'{title}'!{DEFAULT_CLEAR_COLUMNS}" for title, item in self.pending.items() if item['clear']]
+        if not ranges:
+            return
+
+        self.execute(self.service.spreadsheets().values().batchClear(
+            spreadsheetId=self.spreadsheet_id,
+            body={'ranges': ranges}
+        ), description=f"시트 {len(ranges)}개 삭제")
+
+    def _write_values(self):
+        """값 입력을 values.batchUpdate로 처리 (셀 수가 많으면 나눠서 전송)"""
+        batches = [[]]
+        cells = 0
+        for item in self.pending.values():
+            for entry in item['data']:
+                size = sum(len(row) for row in entry['values'])
+                if batches[-1] and cells + size > MAX_CELLS_PER_REQUEST:
+                    batches.append([])
+                    cells = 0
+                batches[-1].append(entry)
+                cells += size
+
+        for data in batches:
+            if not data:
+                continue
+            self.execute(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={
+                    'valueInputOption': 'RAW',
+                    'data': data
+                }
+            ), description=f"범위 {len(data)}개 값 입력")
+
+    def _delete_rows(self):
+        """없어진 행을 batchUpdate(deleteDimension) 한 번으로 삭제 (값 입력 후, 시트별로 아래쪽부터)"""
+        requests = []
+        for title, item in self.pending.items():
+            if item['deletes']:
+                requests.extend(delete_row_requests(self.sheet_ids[title], item['deletes']))
+        if not requests:
+            return
+
+        self.execute(self.service.spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': requests}
+        ), description=f"행 삭제 {len(requests)}건")
+
+    def _format_sheets(self):
+        """헤더 포맷팅을 batchUpdate 한 번으로 처리 (실패해도 업로드는 성공으로 봄)"""
+        requests = []
+        for title, item in self.pending.items():
+            if item['format_header'] and item['data']:
+                requests.extend(header_format_requests(self.sheet_ids[title], len(item['data'][0]['values'][0])))
+        if not requests:
+            return
+
+        try:
+            self.execute(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'requests': requests}
+            ), description="시트 포맷팅")
+        except Exception as e:
+            print(f"   ⚠️ 포맷팅 실패 (무시하고 계속): {e}")
+
+    def flush(self):
+        """예약된 모든 쓰기 반영 - 성공하면 반영한 시트 제목 목록, 실패하면 None"""
+        if not self.pending:
+            return []
+
+        titles = list(self.pending)
+        try:
+            existing_titles = set(self.load())
+            self._create_missing_sheets()
+            self._plan_syncs(existing_titles)
+            self._clear_sheets()
+            self._write_values()
+            self._delete_rows()
+        except Exception as e:
+            print(f"   ❌ 시트 일괄 업로드 실패: {e}")
+            return None
+
+        self._format_sheets()
+        self.pending = {}
+        print(f"📊 Google Sheets 일괄 업로드 완료: {len(titles)}개 시트")
+        return titles
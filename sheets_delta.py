@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Google Sheets 행 단위 변경분 동기화
+시트를 한 번 읽어 키(앞쪽 식별 컬럼, 예: 제조사+차종+모델명) → 행 번호 색인을 만들고,
+새 데이터와 비교해 추가/수정/삭제할 행만 계산합니다.
+쓰기량과 API 호출 수가 시트 크기가 아니라 변경 건수에 비례합니다.
+"""
+
+import math
+
+
+def cell_text(value):
+    """비교용 셀 문자열 (None/NaN은 빈 문자열, 정수인 실수는 정수로)"""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def sheet_cell(value):
+    """시트에 기록할 값 (None/NaN은 빈 문자열, 나머지는 그대로)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    return value
+
+
+def column_letter(number):
+    """열 번호(1부터) → 열 문자 (1 → A, 27 → AA)"""
+    letters = ''
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def row_key(row, key_width):
+    """행의 식별 키 (앞쪽 key_width개 컬럼)"""
+    return tuple(cell_text(row[i]) if i < len(row) else '' for i in range(key_width))
+
+
+def build_index(values, key_width, header_rows=1):
+    """시트 값 → {키: (행 번호(1부터), 행)} 색인과 중복 키 행 번호 목록
+
+    빈 행은 색인에 넣지 않고, 같은 키가 다시 나오면 뒤의 행을 중복으로 분류합니다.
+    """
+    index = {}
+    duplicates = []
+    for row_number, row in enumerate(values[header_rows:], start=header_rows + 1):
+        if not any(cell_text(cell) for cell in row):
+            continue
+        key = row_key(row, key_width)
+        if key in index:
+            duplicates.append(row_number)
+        else:
+            index[key] = (row_number, row)
+    return index, duplicates
+
+
+class SheetDelta:
+    """시트 변경분 (updates: [(행 번호, 행)], inserts: [행], deletes: [행 번호])"""
+
+    def __init__(self):
+        self.updates = []
+        self.inserts = []
+        self.deletes = []
+        self.unchanged = 0
+
+    def is_empty(self):
+        return not (self.updates or self.inserts or self.deletes)
+
+    def summary(self):
+        return (f"➕ {len(self.inserts)}  📝 {len(self.updates)}  ➖ {len(self.deletes)}  "
+                f"(변경 없음 {self.unchanged})")
+
+
+def compute_delta(values, rows, key_width, compare_width=None, header_rows=1):
+    """기존 시트 값(헤더 포함)과 새 행 목록을 비교해 변경분 계산
+
+    compare_width를 지정하면 앞쪽 그 개수의 컬럼만 비교합니다 (예: 최종수정시간 제외).
+    """
+    index, duplicates = build_index(values, key_width, header_rows)
+    delta = SheetDelta()
+    width = compare_width or max((len(row) for row in rows), default=0)
+
+    for row in rows:
+        existing = index.pop(row_key(row, key_width), None)
+        if existing is None:
+            delta.inserts.append(row)
+            continue
+
+        row_number, existing_row = existing
+        old = [cell_text(existing_row[i]) if i < len(existing_row) else '' for i in range(width)]
+        new = [cell_text(row[i]) if i < len(row) else '' for i in range(width)]
+        if old != new:
+            delta.updates.append((row_number, row))
+        else:
+            delta.unchanged += 1
+
+    delta.deletes = sorted([row_number for row_number, _ in index.values()] + duplicates)
+    return delta
+
+
+def plan_writes(delta, last_row, width, range_prefix=''):
+    """변경분 → (values.batchUpdate용 data, 삭제할 행 번호, 기록 후 필요한 마지막 행 번호)
+
+    삭제될 행 자리는 새 행으로 먼저 채우고, 남은 새 행은 마지막 행 뒤에 이어 붙입니다.
+    range_prefix는 googleapiclient에서 쓰는 "'시트명'!" 형식 접두어입니다.
+    """
+    end_column = column_letter(width)
+    data = [
+        {'range': f"{range_prefix}A{row_number}:{end_column}{row_number}", 'values': [row]}
+        for row_number, row in delta.updates
+    ]
+
+    reused = min(len(delta.inserts), len(delta.deletes))
+    for row_number, row in zip(delta.deletes[:reused], delta.inserts[:reused]):
+        data.append({'range': f"{range_prefix}A{row_number}:{end_column}{row_number}", 'values': [row]})
+
+    appended = delta.inserts[reused:]
+    if appended:
+        start = last_row + 1
+        data.append({
+            'range': f"{range_prefix}A{start}:{end_column}{start + len(appended) - 1}",
+            'values': appended
+        })
+
+    return data, delta.deletes[reused:], last_row + len(appended)
+
+
+def delete_row_requests(sheet_id, row_numbers):
+    """행 삭제 batchUpdate 요청 (연속 행은 묶고, 아래쪽부터 삭제해 행 번호가 밀리지 않게 함)"""
+    spans = []
+    for row_number in sorted(row_numbers):
+        if spans and spans[-1][1] == row_number - 1:
+            spans[-1][1] = row_number
+        else:
+            spans.append([row_number, row_number])
+
+    return [
+        {
+            'deleteDimension': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'dimension': 'ROWS',
+                    'startIndex': start - 1,
+                    'endIndex': end
+                }
+            }
+        }
+        for start, end in reversed(spans)
+    ]
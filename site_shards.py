@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+정적 사이트용 지역/제조사별 데이터 샤드
+csv/{연도}.csv를 지역별·제조사별 작은 JSON 파일로 나누고, 내용 해시를 파일명에 넣어
+CDN/브라우저가 오래 캐시할 수 있게 합니다. 어떤 파일을 읽을지는 data/manifest.json에 기록합니다.
+샤드마다 .gz(brotli 설치 시 .br) 압축본을 함께 만듭니다 (static_artifacts 참고).
+
+    data/manifest.json                          # 연도별 인덱스/샤드 경로 (짧게 캐시)
+    data/2025/index.<해시>.json                 # 지역/제조사 목록과 요약 (compact_json 표 형식)
+    data/2025/regions/<해시>.json(.gz/.br)      # 지역 한 곳의 차량별 보조금 (스키마 헤더 + 값 배열, 금액은 숫자)
+    data/2025/manufacturers/<해시>.json(.gz/.br)  # 제조사 한 곳의 지역별 보조금
+
+사용법:
+    python site_shards.py            # csv 폴더의 모든 연도 CSV로 샤드 생성
+    python site_shards.py 2025       # 지정 연도만
+"""
+
+import csv
+import glob
+import os
+import sys
+from collections import OrderedDict
+
+from static_artifacts import (
+    BROTLI_AVAILABLE, COMPRESSED_VARIANTS, MANIFEST_FILE, SHARD_ROOT,
+    base_path, compress_variants, content_hash, load_manifest, save_manifest, site_path, write_atomic
+)
+from compact_json import (
+    AMOUNT_FIELDS, NUMBER, TEXT, compact_header, dumps, pack_rows, pack_table, schema_header, vehicle_columns
+)
+from streaming_csv_writer import CSV_HEADERS
+
+# 샤드 행 컬럼 (CSV 한국어 헤더 이름, 연도/수집일시는 샤드 머리에 한 번만)
+SHARD_COLUMNS = vehicle_columns(
+    ['region', 'category', 'manufacturer', 'model', 'model_detail'] + list(AMOUNT_FIELDS), CSV_HEADERS
+)
+
+# 인덱스 표 컬럼 (짧은 키, 이름, 타입)
+INDEX_REGION_COLUMNS = [
+    ('k', 'key', TEXT),
+    ('r', 'region', TEXT),
+    ('g', 'category', TEXT),
+    ('v', 'vehicleCount', NUMBER),
+    ('a', 'avgLocalSubsidy', NUMBER),
+    ('x', 'maxLocalSubsidy', NUMBER)
+]
+INDEX_MANUFACTURER_COLUMNS = [
+    ('m', 'manufacturer', TEXT),
+    ('c', 'modelCount', NUMBER),
+    ('r', 'regionCount', NUMBER)
+]
+
+
+def _dump(data):
+    """공백 없는 UTF-8 JSON 바이트"""
+    return dumps(data, compact=True).encode('utf-8')
+
+
+def write_hashed(directory, data, prefix=''):
+    """내용 해시 파일명으로 저장 (같은 내용이면 기존 파일 재사용) - (사이트 경로, 바이트 수)"""
+    payload = _dump(data)
+    path = os.path.join(directory, f"{prefix}{content_hash(payload)}.json")
+
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        write_atomic(path, payload)
+    compress_variants(path, payload)
+
+    return site_path(path), len(payload)
+
+
+def _shard_keys(groups):
+    """그룹 키((광역시도, 지역명) 등) → 매니페스트 키 (이름이 겹칠 때만 광역시도를 붙임)"""
+    names = [name for _, name in groups]
+    return {
+        (parent, name): name if names.count(name) == 1 else f"{parent} {name}"
+        for parent, name in groups
+    }
+
+
+def read_rows(csv_path):
+    """크롤러 CSV를 한국어 헤더 dict 목록으로 읽기"""
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def build_year_shards(csv_path, root=SHARD_ROOT):
+    """한 연도 CSV → 샤드/인덱스 파일 저장 후 매니페스트 항목 반환"""
+    rows = read_rows(csv_path)
+    year = os.path.splitext(os.path.basename(csv_path))[0]
+    year_dir = os.path.join(root, year)
+
+    region_header = CSV_HEADERS['region']
+    category_header = CSV_HEADERS['category']
+    manufacturer_header = CSV_HEADERS['manufacturer']
+    column_names = [name for _, name, _ in SHARD_COLUMNS]
+    region_column = column_names.index(region_header)
+    detail_column = column_names.index(CSV_HEADERS['model_detail'])
+    local_column = column_names.index(CSV_HEADERS['local_subsidy'])
+
+    crawl_date = rows[0][CSV_HEADERS['crawl_date']] if rows else ''
+    data_year = rows[0][CSV_HEADERS['data_year']] if rows else year
+
+    # 지역별/제조사별로 한 번에 나누기 (CSV 순서 유지, 금액은 여기서 한 번만 숫자로 변환)
+    # 샤드 행은 SHARD_COLUMNS 순서의 값 배열 (연도/수집일시는 샤드 머리에 한 번만)
+    regions = OrderedDict()
+    manufacturers = OrderedDict()
+    for row, shard_row in zip(rows, pack_rows(rows, SHARD_COLUMNS)):
+        regions.setdefault((row[category_header], row[region_header]), []).append(shard_row)
+        manufacturers.setdefault(('', row[manufacturer_header]), []).append(shard_row)
+
+    header = {**compact_header(), 'year': data_year, 'crawlDate': crawl_date}
+    columns = schema_header(SHARD_COLUMNS)
+    region_index = []
+    manufacturer_index = []
+    entry = {
+        'crawlDate': crawl_date,
+        'rows': len(rows),
+        'variants': [name for name, _ in COMPRESSED_VARIANTS if name != 'br' or BROTLI_AVAILABLE],
+        'regions': {},
+        'manufacturers': {}
+    }
+
+    region_keys = _shard_keys(list(regions))
+    for (category, name), region_rows in regions.items():
+        path, size = write_hashed(os.path.join(year_dir, 'regions'),
+                                  {**header, 'region': name, 'category': category,
+                                   'columns': columns, 'rows': region_rows})
+        key = region_keys[(category, name)]
+        entry['regions'][key] = {'file': path, 'rows': len(region_rows), 'bytes': size}
+
+        local_amounts = [row[local_column] for row in region_rows if row[local_column] is not None]
+        region_index.append({
+            'key': key,
+            'region': name,
+            'category': category,
+            'vehicleCount': len(region_rows),
+            'avgLocalSubsidy': round(sum(local_amounts) / len(local_amounts), 1) if local_amounts else 0,
+            'maxLocalSubsidy': max(local_amounts) if local_amounts else 0
+        })
+
+    for (_, name), manufacturer_rows in manufacturers.items():
+        path, size = write_hashed(os.path.join(year_dir, 'manufacturers'),
+                                  {**header, 'manufacturer': name, 'columns': columns, 'rows': manufacturer_rows})
+        entry['manufacturers'][name] = {'file': path, 'rows': len(manufacturer_rows), 'bytes': size}
+        manufacturer_index.append({
+            'manufacturer': name,
+            'modelCount': len({row[detail_column] for row in manufacturer_rows}),
+            'regionCount': len({row[region_column] for row in manufacturer_rows})
+        })
+
+    index = {
+        **header,
+        'regions': pack_table(region_index, INDEX_REGION_COLUMNS),
+        'manufacturers': pack_table(manufacturer_index, INDEX_MANUFACTURER_COLUMNS)
+    }
+    entry['index'], entry['indexBytes'] = write_hashed(year_dir, index, prefix='index.')
+    return year, entry
+
+
+def _referenced_files(entry):
+    """매니페스트 항목이 가리키는 파일 경로(로컬)"""
+    paths = [entry['index']]
+    paths.extend(item['file'] for item in entry['regions'].values())
+    paths.extend(item['file'] for item in entry['manufacturers'].values())
+    return {os.path.normpath(path.lstrip('/')) for path in paths}
+
+
+def remove_stale_shards(year, entry, root=SHARD_ROOT):
+    """이번 매니페스트에서 빠진 이전 샤드(압축본 포함) 삭제"""
+    keep = _referenced_files(entry)
+    removed = 0
+    for path in glob.glob(os.path.join(root, year, '**', '*.json*'), recursive=True):
+        if os.path.normpath(base_path(path)) not in keep and not path.endswith('.tmp'):
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def write_site_shards(csv_paths, manifest_path=MANIFEST_FILE):
+    """연도별 CSV로 샤드를 만들고 매니페스트 갱신 (다른 연도 항목은 유지)"""
+    manifest = load_manifest(manifest_path)
+    root = os.path.dirname(manifest_path) or '.'
+
+    try:
+        for csv_path in csv_paths:
+            year, entry = build_year_shards(csv_path, root)
+            manifest['years'][year] = entry
+            removed = remove_stale_shards(year, entry, root)
+
+            largest = max((item['bytes'] for item in entry['regions'].values()), default=0)
+            print(f"🧩 사이트 샤드 저장: {year}년 지역 {len(entry['regions'])}개, 제조사 {len(entry['manufacturers'])}개 "
+                  f"(지역 샤드 최대 {largest / 1024:.0f}KB, 이전 파일 {removed}개 삭제)")
+
+        return save_manifest(manifest, manifest_path)
+
+    except Exception as e:
+        print(f"❌ 사이트 샤드 저장 실패: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        csv_files = [os.path.join('csv', f"{year}.csv") for year in sys.argv[1:]]
+    else:
+        # 연도 파일만 (차종별 분리 파일 csv/2025_11.csv 제외)
+        csv_files = sorted(path for path in glob.glob(os.path.join('csv', '*.csv'))
+                           if os.path.splitext(os.path.basename(path))[0].isdigit())
+
+    if not csv_files or not write_site_shards(csv_files):
+        print("❌ 샤드를 만들 CSV 파일이 없습니다.")
+        sys.exit(1)
+    print(f"✅ 매니페스트: {MANIFEST_FILE}")
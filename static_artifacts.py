@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+정적 사이트 데이터 파일 사전 압축/배포
+데이터 파일마다 .gz(및 brotli 설치 시 .br) 압축본을 미리 만들고, csv/{연도}.csv 같은 파일은
+내용 해시가 들어간 이름(data/files/2025.<해시>.csv)으로 복사해 data/manifest.json에 기록합니다.
+페이지는 매니페스트에서 경로를 찾아 압축본을 받으므로, 서버/CDN은 변하지 않는 파일로 오래 캐시할 수 있습니다.
+
+사용법:
+    python static_artifacts.py                       # csv 폴더의 연도 CSV/JSON 배포
+    python static_artifacts.py csv/2025.csv ...      # 지정 파일만
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+
+# Brotli (선택적)
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+SHARD_ROOT = 'data'
+MANIFEST_FILE = os.path.join(SHARD_ROOT, 'manifest.json')
+MANIFEST_VERSION = 1
+
+# 내용 해시 이름으로 배포한 파일 위치
+PUBLISHED_DIR = os.path.join(SHARD_ROOT, 'files')
+
+# 파일명에 넣을 내용 해시 길이
+HASH_LENGTH = 12
+
+# 압축본 확장자 (매니페스트 키, 확장자)
+COMPRESSED_VARIANTS = (('gzip', '.gz'), ('br', '.br'))
+
+
+def content_hash(payload):
+    """파일명에 넣을 내용 해시"""
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+def site_path(path):
+    """로컬 경로 → 사이트 절대 경로 (/data/...)"""
+    return '/' + os.path.normpath(path).replace(os.sep, '/')
+
+
+def base_path(path):
+    """압축본 경로면 원본 경로로 (a.json.gz → a.json)"""
+    for _, extension in COMPRESSED_VARIANTS:
+        if path.endswith(extension):
+            return path[:-len(extension)]
+    return path
+
+
+def write_atomic(path, payload):
+    """임시 파일에 쓴 뒤 교체"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+
+
+def compress_variants(path, payload=None):
+    """.gz/.br 압축본 생성 (원본보다 새 압축본이 있으면 재사용) - {'gzip': 경로, 'br': 경로}"""
+    variants = {}
+    source_mtime = os.path.getmtime(path)
+
+    for name, extension in COMPRESSED_VARIANTS:
+        if name == 'br' and not BROTLI_AVAILABLE:
+            continue
+
+        variant_path = path + extension
+        if not os.path.exists(variant_path) or os.path.getmtime(variant_path) < source_mtime:
+            if payload is None:
+                with open(path, 'rb') as f:
+                    payload = f.read()
+            if name == 'gzip':
+                # mtime=0: 같은 내용이면 같은 압축 파일 (불필요한 git 변경 방지)
+                compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+            else:
+                compressed = brotli.compress(payload, quality=11)
+            write_atomic(variant_path, compressed)
+
+        variants[name] = variant_path
+    return variants
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """기존 매니페스트 (없으면 빈 매니페스트)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault('years', {})
+    manifest.setdefault('files', {})
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    manifest['version'] = MANIFEST_VERSION
+    manifest['generatedAt'] = datetime.now().isoformat()
+    manifest['latestYear'] = max(manifest['years']) if manifest['years'] else None
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_atomic(path, json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+    return path
+
+
+def publish_file(path, dest_dir=PUBLISHED_DIR):
+    """파일을 내용 해시 이름으로 복사하고 압축본 생성 - 매니페스트 항목"""
+    with open(path, 'rb') as f:
+        payload = f.read()
+
+    stem, extension = os.path.splitext(os.path.basename(path))
+    published = os.path.join(dest_dir, f"{stem}.{content_hash(payload)}{extension}")
+    if not os.path.exists(published):
+        os.makedirs(dest_dir, exist_ok=True)
+        shutil.copyfile(path, published + '.tmp')
+        os.replace(published + '.tmp', published)
+
+    entry = {'file': site_path(published), 'bytes': len(payload)}
+    for name, variant_path in compress_variants(published, payload).items():
+        entry[name] = site_path(variant_path)
+        entry[f"{name}Bytes"] = os.path.getsize(variant_path)
+    return entry
+
+
+def remove_stale_published(path, entry, dest_dir=PUBLISHED_DIR):
+    """같은 원본의 이전 해시 파일(압축본 포함) 삭제"""
+    stem, extension = os.path.splitext(os.path.basename(path))
+    keep = os.path.normpath(entry['file'].lstrip('/'))
+    removed = 0
+    for candidate in glob.glob(os.path.join(dest_dir, f"{stem}.*{extension}*")):
+        if os.path.normpath(base_path(candidate)) != keep and not candidate.endswith('.tmp'):
+            os.remove(candidate)
+            removed += 1
+    return removed
+
+
+def publish_static_files(paths, manifest_path=MANIFEST_FILE):
+    """데이터 파일들을 해시 이름 + 압축본으로 배포하고 매니페스트의 files 항목 갱신"""
+    dest_dir = os.path.join(os.path.dirname(manifest_path) or '.', 'files')
+
+    try:
+        manifest = load_manifest(manifest_path)
+        for path in paths:
+            if not path or not os.path.exists(path):
+                continue
+
+            entry = publish_file(path, dest_dir)
+            manifest['files'][path.replace(os.sep, '/')] = entry
+            remove_stale_published(path, entry, dest_dir)
+
+            ratio = entry['gzipBytes'] / entry['bytes'] * 100 if entry['bytes'] else 0
+            print(f"🗜️ 압축본 배포: {path} → {entry['file']} "
+                  f"({entry['bytes'] / 1024:.0f}KB → gzip {entry['gzipBytes'] / 1024:.0f}KB, {ratio:.0f}%"
+                  + (f", br {entry['brBytes'] / 1024:.0f}KB)" if 'brBytes' in entry else ")"))
+
+        return save_manifest(manifest, manifest_path)
+
+    except Exception as e:
+        print(f"❌ 압축본 배포 실패: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        files = sys.argv[1:]
+    else:
+        # 연도 파일만 (차종별 분리 파일 csv/2025_11.csv 제외)
+        files = sorted(path for path in glob.glob(os.path.join('csv', '*.*'))
+                       if os.path.splitext(path)[1] in ('.csv', '.json')
+                       and os.path.splitext(os.path.basename(path))[0].isdigit())
+
+    if not BROTLI_AVAILABLE:
+        print("⚠️  brotli가 설치되지 않아 .gz 압축본만 만듭니다. pip install brotli")
+
+    if not files or not publish_static_files(files):
+        print("❌ 배포할 파일이 없습니다.")
+        sys.exit(1)
+    print(f"✅ 매니페스트: {MANIFEST_FILE}")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+지역별 보조금 CSV 스트리밍 저장
+지역 수집이 끝날 때마다 최종 정렬 순서(광역시도 > 지역 > 제조사 > 차종)대로 바로 기록하고,
+미리보기용 통계도 기록하면서 함께 집계합니다. (pandas 불필요)
+순서가 아직 오지 않은 지역의 행은 임시 파일(RegionSpool)에 두어 메모리에는 한 지역분만 올립니다.
+"""
+
+import csv
+import os
+from collections import Counter
+from datetime import datetime
+
+from region_spool import RegionSpool
+from vehicle_record import format_amount
+
+# CSV 컬럼 순서와 한국어 헤더
+CSV_COLUMNS = ['data_year', 'region', 'category', 'manufacturer', 'model', 'model_detail',
+               'national_subsidy', 'local_subsidy', 'total_subsidy', 'crawl_date']
+
+CSV_HEADERS = {
+    'data_year': '데이터연도',
+    'region': '지역',
+    'category': '광역시도',
+    'manufacturer': '제조사',
+    'model': '차종',
+    'model_detail': '모델명',
+    'national_subsidy': '국비보조금(만원)',
+    'local_subsidy': '지방비보조금(만원)',
+    'total_subsidy': '총보조금(만원)',
+    'crawl_date': '수집일시'
+}
+
+# 의도한 순서로 정렬하기 위한 광역시도 순서 (목록에 없으면 맨 뒤)
+CATEGORY_ORDER = {
+    '특별시': 1,
+    '경기도': 2,
+    '광역시': 3,
+    '특별자치시': 4,
+    '강원도': 5,
+    '충청북도': 6,
+    '충청남도': 7,
+    '전라북도': 8,
+    '전라남도': 9,
+    '경상북도': 10,
+    '경상남도': 11,
+    '특별자치도': 12,
+    '기타': 13
+}
+
+
+def region_sort_key(region):
+    """지역 출력 순서 키: 광역시도 순서 > 지역명"""
+    return CATEGORY_ORDER.get(region.get('category', '기타'), 999), region['name']
+
+
+def row_sort_key(values):
+    """지역 내 행 출력 순서 키: 제조사 > 차종 (CSV 값 dict)"""
+    return values['manufacturer'], values['model']
+
+
+class CSVStats:
+    """미리보기용 통계 (행 수, 광역시도/지역/제조사별 개수, 상위 샘플)"""
+
+    def __init__(self, sample_size=5):
+        self.sample_size = sample_size
+        self.row_count = 0
+        self.category_counts = Counter()
+        self.region_counts = Counter()
+        self.manufacturer_counts = Counter()
+        self.sample_rows = []
+
+    def add_row(self, row):
+        """한 행(한국어 헤더 기준 dict) 반영"""
+        self.row_count += 1
+        self.category_counts[row['광역시도']] += 1
+        self.region_counts[row['지역']] += 1
+        if row['제조사']:
+            self.manufacturer_counts[row['제조사']] += 1
+        if len(self.sample_rows) < self.sample_size:
+            self.sample_rows.append(row)
+
+    @classmethod
+    def from_csv(cls, csv_file):
+        """이미 저장된 CSV 파일을 한 줄씩 읽어 통계 생성"""
+        stats = cls()
+        with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                stats.add_row(row)
+        return stats
+
+
+class StreamingCSVWriter:
+    """지역 단위 스트리밍 CSV 저장
+
+    지역은 완료 순서와 관계없이 add_region으로 넘기면 되고, 출력 순서상 앞선 지역이
+    아직 끝나지 않은 경우에만 행을 임시 파일에 보관했다가 순서가 되면 바로 기록합니다.
+    parts > 1이면 (예: 같은 연도의 여러 차종) 지역마다 parts번 전달받은 뒤 합쳐서 기록합니다.
+    임시 파일에 기록한 뒤 commit() 시점에 대상 파일로 교체합니다.
+    """
+
+    def __init__(self, filepath, regions, data_year, crawl_date=None, parts=1):
+        self.filepath = filepath
+        self.temp_path = filepath + '.tmp'
+        self.data_year = data_year
+        self.crawl_date = crawl_date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 출력 순서 (같은 키는 지역 목록 순서 유지)
+        ordered = sorted(regions, key=region_sort_key)
+        self.regions = ordered
+        self.rank = {region['code']: i for i, region in enumerate(ordered)}
+        self.parts = parts
+        self.pending = RegionSpool()
+        self.received = {}
+        self.next_rank = 0
+
+        self.stats = CSVStats()
+        self.region_count = 0
+
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        self._file = open(self.temp_path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.writer(self._file, lineterminator='\n')
+        self._writer.writerow([CSV_HEADERS[column] for column in CSV_COLUMNS])
+
+    def add_region(self, region, vehicles):
+        """지역 수집 결과 전달 (데이터 없음/실패 지역도 빈 리스트로 전달해야 다음 지역이 기록됨)"""
+        rank = self.rank.get(region['code'])
+        if rank is None or rank < self.next_rank:
+            return
+
+        rows = [self._row_values(region, vehicle) for vehicle in vehicles or []]
+        self.received[rank] = self.received.get(rank, 0) + 1
+        if rank == self.next_rank and self.received[rank] >= self.parts and rank not in self.pending:
+            # 순서가 된 지역은 보관하지 않고 바로 기록
+            self.received.pop(rank)
+            self.next_rank += 1
+            self._write_region(rows)
+        elif rows:
+            self.pending.add(rank, rows)
+        self._flush()
+
+    def _flush(self, force=False):
+        """출력 순서가 된 지역부터 차례로 기록 (force면 전달받지 못한 부분은 건너뜀)"""
+        while self.next_rank < len(self.regions) and (
+                force or self.received.get(self.next_rank, 0) >= self.parts):
+            self.received.pop(self.next_rank, None)
+            rows = self.pending.take(self.next_rank)
+            self.next_rank += 1
+            self._write_region(rows)
+
+    def _row_values(self, region, vehicle):
+        """차량 한 대 → CSV 값 dict (컬럼 → 값)"""
+        return {
+            'data_year': self.data_year,
+            'region': region['name'],
+            'category': region.get('category', '기타'),
+            'manufacturer': vehicle.manufacturer or '',
+            'model': vehicle.model or '',
+            'model_detail': vehicle.model_detail or '',
+            'national_subsidy': format_amount(vehicle.national_subsidy),
+            'local_subsidy': format_amount(vehicle.local_subsidy),
+            'total_subsidy': format_amount(vehicle.total_subsidy),
+            'crawl_date': self.crawl_date
+        }
+
+    def _write_region(self, rows):
+        """한 지역의 행 기록 (행이 없으면 건너뜀)"""
+        if not rows:
+            return
+        for values in sorted(rows, key=row_sort_key):
+            row = [values[column] for column in CSV_COLUMNS]
+            self._writer.writerow(row)
+            self.stats.add_row({CSV_HEADERS[column]: str(value) for column, value in values.items()})
+        self.region_count += 1
+
+    def commit(self):
+        """남은 지역을 순서대로 기록하고 대상 파일로 교체 - 기록된 행이 없으면 None"""
+        self._flush(force=True)
+        self._file.close()
+        self.pending.close()
+
+        if self.stats.row_count == 0:
+            os.remove(self.temp_path)
+            return None
+
+        os.replace(self.temp_path, self.filepath)
+        return self.filepath
+
+    def discard(self):
+        """기록 중인 임시 파일 삭제 (기존 파일 유지)"""
+        if not self._file.closed:
+            self._file.close()
+        self.pending.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
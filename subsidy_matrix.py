@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+지역 × 차량 지자체 보조금 행렬
+중첩 dict(vehicleSubsidyByRegion)를 지역/차량 ID 목록과 int16 밀집 행렬(만원×10)로 바꿔
+base64로 묶은 작은 JSON 하나로 저장하고, 인덱스로 바로 조회하는 리더를 제공합니다.
+
+파일 형식:
+    {
+      "format": "ev-subsidy-matrix", "version": 1,
+      "dtype": "int16", "byteOrder": "little", "scale": 10, "missing": -32768,
+      "regions": [지역명, ...], "vehicles": [차량 ID, ...], "shape": [지역 수, 차량 수],
+      "data": base64(행 우선 int16 배열)
+    }
+    값 = 보조금(만원) × scale, 해당 지역에 없는 차량은 missing
+
+사용법:
+    python subsidy_matrix.py ev_complete_data_20250713.json   # 전체 데이터 JSON → 행렬 파일 변환
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+from array import array
+
+MATRIX_FORMAT = 'ev-subsidy-matrix'
+MATRIX_VERSION = 1
+
+# 만원 단위 소수 첫째 자리까지 정수로 저장 (int16 최대 3,276.7만원)
+SCALE = 10
+MISSING = -32768
+INT16_MAX = 32767
+
+
+def _to_little_endian(values):
+    """array('h')를 리틀 엔디언 바이트로 (빅 엔디언 시스템이면 뒤집기)"""
+    if sys.byteorder == 'big':
+        values = array('h', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(raw):
+    """리틀 엔디언 바이트 → array('h')"""
+    values = array('h')
+    values.frombytes(raw)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def build_subsidy_matrix(subsidy_by_region, vehicle_ids=None, regions=None, metadata=None):
+    """{지역: {차량 ID: 보조금(만원)}} → 행렬 파일 dict
+
+    vehicle_ids/regions를 주면 그 순서를 따르고(없는 ID는 추가), 없으면 입력 순서대로 만듭니다.
+    """
+    regions = list(regions or [])
+    region_index = {name: i for i, name in enumerate(regions)}
+    for name in subsidy_by_region:
+        if name not in region_index:
+            region_index[name] = len(regions)
+            regions.append(name)
+
+    vehicle_ids = list(vehicle_ids or [])
+    vehicle_index = {vehicle_id: i for i, vehicle_id in enumerate(vehicle_ids)}
+    for subsidies in subsidy_by_region.values():
+        for vehicle_id in subsidies:
+            if vehicle_id not in vehicle_index:
+                vehicle_index[vehicle_id] = len(vehicle_ids)
+                vehicle_ids.append(vehicle_id)
+
+    width = len(vehicle_ids)
+    values = array('h', [MISSING]) * (len(regions) * width)
+    for name, subsidies in subsidy_by_region.items():
+        offset = region_index[name] * width
+        for vehicle_id, amount in subsidies.items():
+            if amount is None:
+                continue
+            scaled = int(round(float(amount) * SCALE))
+            if not -INT16_MAX <= scaled <= INT16_MAX:
+                raise ValueError(f"보조금 범위 초과 ({name} - {vehicle_id}: {amount}만원)")
+            values[offset + vehicle_index[vehicle_id]] = scaled
+
+    return {
+        'format': MATRIX_FORMAT,
+        'version': MATRIX_VERSION,
+        'metadata': metadata or {},
+        'dtype': 'int16',
+        'byteOrder': 'little',
+        'scale': SCALE,
+        'missing': MISSING,
+        'regions': regions,
+        'vehicles': vehicle_ids,
+        'shape': [len(regions), width],
+        'data': base64.b64encode(_to_little_endian(values)).decode('ascii')
+    }
+
+
+def save_subsidy_matrix(matrix, filename):
+    """행렬 파일 저장 (공백 없는 JSON, 임시 파일에 쓴 뒤 교체)"""
+    temp_path = filename + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(matrix, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, filename)
+    return filename
+
+
+class SubsidyMatrix:
+    """행렬 파일 리더 (지역/차량 인덱스 또는 이름으로 조회, 값 단위: 만원)"""
+
+    def __init__(self, matrix):
+        if matrix.get('format') != MATRIX_FORMAT:
+            raise ValueError(f"보조금 행렬 파일이 아닙니다: {matrix.get('format')}")
+
+        self.metadata = matrix.get('metadata', {})
+        self.scale = matrix['scale']
+        self.missing = matrix['missing']
+        self.regions = matrix['regions']
+        self.vehicles = matrix['vehicles']
+        self.shape = tuple(matrix['shape'])
+        self.values = _from_little_endian(base64.b64decode(matrix['data']))
+        if len(self.values) != self.shape[0] * self.shape[1]:
+            raise ValueError(f"행렬 크기 불일치: {len(self.values)} != {self.shape}")
+
+        self.region_index = {name: i for i, name in enumerate(self.regions)}
+        self.vehicle_index = {vehicle_id: i for i, vehicle_id in enumerate(self.vehicles)}
+
+    @classmethod
+    def load(cls, filename):
+        """행렬 파일 로드"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def value(self, region_idx, vehicle_idx):
+        """인덱스로 조회 - 보조금(만원), 해당 지역에 없는 차량이면 None"""
+        raw = self.values[region_idx * self.shape[1] + vehicle_idx]
+        if raw == self.missing:
+            return None
+        amount = raw / self.scale
+        return int(amount) if amount.is_integer() else amount
+
+    def lookup(self, region, vehicle_id):
+        """지역명/차량 ID로 조회 (모르는 지역/차량이면 None)"""
+        region_idx = self.region_index.get(region)
+        vehicle_idx = self.vehicle_index.get(vehicle_id)
+        if region_idx is None or vehicle_idx is None:
+            return None
+        return self.value(region_idx, vehicle_idx)
+
+    def region_subsidies(self, region):
+        """한 지역의 {차량 ID: 보조금} (없는 차량 제외)"""
+        region_idx = self.region_index[region]
+        return {
+            vehicle_id: amount
+            for vehicle_id, amount in ((vehicle_id, self.value(region_idx, i)) for i, vehicle_id in enumerate(self.vehicles))
+            if amount is not None
+        }
+
+    def to_nested_dict(self):
+        """원래의 {지역: {차량 ID: 보조금}} 형태로 복원"""
+        return {region: self.region_subsidies(region) for region in self.regions}
+
+
+def matrix_filename(date_str):
+    """행렬 파일명 (ev_subsidy_matrix_YYYYMMDD.json)"""
+    return f"ev_subsidy_matrix_{date_str}.json"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python subsidy_matrix.py ev_complete_data_YYYYMMDD.json")
+        sys.exit(1)
+
+    source = sys.argv[1]
+    with open(source, 'r', encoding='utf-8') as f:
+        complete = json.load(f)
+
+    matrix = build_subsidy_matrix(
+        complete['vehicleSubsidyByRegion'],
+        vehicle_ids=[vehicle['id'] for vehicle in complete.get('vehicles', [])],
+        metadata=complete.get('metadata', {})
+    )
+    date_str = os.path.splitext(source)[0].rsplit('_', 1)[-1]
+    output = save_subsidy_matrix(matrix, matrix_filename(date_str))
+
+    # 원본과 동일한지 확인 후 크기/파싱 시간 비교
+    start = time.perf_counter()
+    with open(source, 'r', encoding='utf-8') as f:
+        json.load(f)
+    source_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    reader = SubsidyMatrix.load(output)
+    matrix_ms = (time.perf_counter() - start) * 1000
+
+    if reader.to_nested_dict() != complete['vehicleSubsidyByRegion']:
+        print("❌ 변환 결과가 원본과 다릅니다")
+        sys.exit(1)
+
+    print(f"✅ 보조금 행렬 저장: {output} ({reader.shape[0]}개 지역 × {reader.shape[1]}개 차량)")
+    print(f"   📦 {os.path.getsize(source) / 1024:.0f}KB → {os.path.getsize(output) / 1024:.0f}KB")
+    print(f"   ⚡ 로드 {source_ms:.1f}ms → {matrix_ms:.1f}ms")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+구매보조금 지원 페이지(initBuySubsidySupprtAction.do) 직접 요청
+국고/지자체 보조금 테이블은 클라이언트에서 만들어지는 것이 아니라 서버가 내려주는 HTML에 이미 들어 있습니다
+(페이지의 ajax 호출은 만족도 조사뿐). 그래서 브라우저 렌더링 없이 페이지를 한 번 요청하고,
+전체 DOM(약 570KB, 대부분 메뉴/스크립트) 대신 table.table01.fz15 조각(약 100KB)만 잘라 파싱합니다.
+
+사용법 (저장된 페이지 소스로 전체 파싱과 조각 파싱 비교):
+    python subsidy_page.py [HTML 파일 ...]
+"""
+
+import importlib.util
+import re
+import sys
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+from rate_limiter import EV_SITE_LIMITER, request_with_retry, shared_limiter
+
+# C 기반 파서 (선택적) - 조각 파싱 결과는 html.parser와 같음 (BeautifulSoup이 직접 불러오므로 설치 여부만 확인)
+LXML_AVAILABLE = importlib.util.find_spec('lxml') is not None
+
+# 국고 보조금 표를 정상적으로 읽었다고 볼 최소 행 수 (이보다 적으면 대안 파서/다른 방법 시도)
+MIN_NATIONAL_ROWS = 90
+
+SUBSIDY_SUPPORT_URL = "https://www.ev.or.kr/nportal/buySupprt/initBuySubsidySupprtAction.do"
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.6,en;q=0.4',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 보조금 테이블 시작 태그 (국고/지자체 모두 class="table01 fz15")
+SUBSIDY_TABLE_START = re.compile(r'<table\b[^>]*\bclass\s*=\s*["\']table01 fz15["\'][^>]*>', re.IGNORECASE)
+TABLE_TAG = re.compile(r'<(/?)table\b', re.IGNORECASE)
+
+
+def fetch_subsidy_page(url=SUBSIDY_SUPPORT_URL, session=None, timeout=30):
+    """보조금 페이지 HTML 한 번 요청 (ev.or.kr 공유 제한기 적용 - 속도는 제한기를 만든 쪽(--rps) 설정을 따름)"""
+    session = session or requests.Session()
+    response = request_with_retry(
+        lambda: session.get(url, headers=REQUEST_HEADERS, timeout=timeout),
+        shared_limiter(EV_SITE_LIMITER), description="보조금 페이지")
+    response.raise_for_status()
+    # Content-Type에 charset이 없으면 requests가 ISO-8859-1로 읽으므로 페이지 meta charset(utf-8) 사용
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = 'utf-8'
+    return response.text
+
+
+def table_fragments(html):
+    """HTML에서 보조금 테이블 조각 목록 (중첩 table 포함, 닫는 태그가 없으면 문서 끝까지)"""
+    fragments = []
+    position = 0
+    while True:
+        start = SUBSIDY_TABLE_START.search(html, position)
+        if not start:
+            return fragments
+
+        depth = 0
+        end = len(html)
+        for tag in TABLE_TAG.finditer(html, start.start()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = html.find('>', tag.end()) + 1 or len(html)
+                break
+
+        fragments.append(html[start.start():end])
+        position = end
+
+
+def subsidy_tables_soup(html):
+    """보조금 테이블 조각만 파싱한 soup (테이블이 없으면 None)
+
+    extract_both_tables가 테이블의 부모 div를 기준으로 읽으므로 조각마다 div로 감쌉니다.
+    """
+    fragments = table_fragments(html)
+    if not fragments:
+        return None
+    document = ''.join(f'<div>{fragment}</div>' for fragment in fragments)
+    return BeautifulSoup(document, 'lxml' if LXML_AVAILABLE else 'html.parser')
+
+
+def compare_parsing(paths):
+    """전체 DOM 파싱과 테이블 조각 파싱의 크기/시간/테이블 수 비교"""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        start = time.perf_counter()
+        full_tables = BeautifulSoup(html, 'html.parser').find_all('table', class_='table01 fz15')
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        soup = subsidy_tables_soup(html)
+        fragment_time = time.perf_counter() - start
+        fragment_tables = soup.find_all('table', class_='table01 fz15') if soup else []
+
+        fragment_size = sum(len(fragment) for fragment in table_fragments(html))
+        print(f"📄 {path}: {len(html) / 1024:.0f}KB → 테이블 조각 {fragment_size / 1024:.0f}KB")
+        print(f"   전체 파싱 {full_time * 1000:.0f}ms (테이블 {len(full_tables)}개), "
+              f"조각 파싱 {fragment_time * 1000:.0f}ms (테이블 {len(fragment_tables)}개)")
+
+
+if __name__ == "__main__":
+    compare_parsing(sys.argv[1:] or ['ev_data/debug_page_source.html'])
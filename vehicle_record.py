@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+차량 보조금 레코드
+지역 상세 페이지 차량 테이블의 한 행을 __slots__ 객체 하나로 담습니다.
+금액(국비/지방비/총보조금, 만원)은 테이블을 읽을 때 한 번만 숫자로 바꾸고,
+CSV/시트처럼 사이트 표기("1,036")가 필요한 곳에서는 format_amount로 되돌립니다.
+"""
+
+from compact_json import AMOUNT_FIELDS, to_number
+
+VEHICLE_FIELDS = ('manufacturer', 'model', 'model_detail') + AMOUNT_FIELDS
+
+
+def format_amount(value):
+    """숫자 금액 → 사이트 표기 문자열 (1036 → "1,036", 1247.4 → "1,247.4", None → "")"""
+    return '' if value is None else f"{value:,}"
+
+
+class VehicleRecord:
+    """차량 한 대의 보조금 정보 (없는 필드는 None)"""
+
+    __slots__ = VEHICLE_FIELDS
+
+    def __init__(self, manufacturer=None, model=None, model_detail=None,
+                 national_subsidy=None, local_subsidy=None, total_subsidy=None):
+        self.manufacturer = manufacturer
+        self.model = model
+        self.model_detail = model_detail
+        self.national_subsidy = national_subsidy
+        self.local_subsidy = local_subsidy
+        self.total_subsidy = total_subsidy
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict → 레코드 (이전 실행의 상태/결과 파일처럼 금액이 문자열이어도 됨)"""
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data.get('manufacturer'),
+            data.get('model'),
+            data.get('model_detail'),
+            to_number(data.get('national_subsidy')),
+            to_number(data.get('local_subsidy')),
+            to_number(data.get('total_subsidy'))
+        )
+
+    def get(self, field, default=None):
+        """dict처럼 필드 조회 (값이 없으면 default)"""
+        value = getattr(self, field, None) if field in VEHICLE_FIELDS else None
+        return default if value is None else value
+
+    def amount_text(self, field):
+        """금액 필드의 사이트 표기 문자열 (CSV/시트 기록용)"""
+        return format_amount(getattr(self, field))
+
+    def to_dict(self):
+        """JSON 저장용 dict (없는 필드 제외, 금액은 숫자)"""
+        return {field: getattr(self, field) for field in VEHICLE_FIELDS if getattr(self, field) is not None}
+
+    def __eq__(self, other):
+        if not isinstance(other, VehicleRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in VEHICLE_FIELDS)
+
+    def __repr__(self):
+        return f"VehicleRecord({self.to_dict()})"
+
+
+def header_columns(headers):
+    """테이블 헤더 → {필드: 열 번호} (테이블마다 한 번만 계산)"""
+    columns = {'manufacturer': 0, 'model': 1, 'model_detail': 2}
+
+    for i, h in enumerate(headers):
+        if '제조사' in h:
+            columns['manufacturer'] = i
+        elif '차종' in h and '모델명' not in h:
+            columns['model'] = i
+        elif '모델명' in h:
+            columns['model_detail'] = i
+
+    if columns['model_detail'] == columns['model']:
+        del columns['model_detail']
+
+    # 보조금 정보
+    for i, h in enumerate(headers):
+        if '국비' in h and '만원' in h:
+            columns['national_subsidy'] = i
+        elif '지방비' in h and '만원' in h:
+            columns['local_subsidy'] = i
+        elif ('보조금' in h or '합계' in h) and '만원' in h and '국비' not in h and '지방비' not in h:
+            columns['total_subsidy'] = i
+
+    return columns
+
+
+def map_vehicle_row(columns, row_data):
+    """헤더 열 번호와 행 데이터를 매핑하여 차량 레코드 생성"""
+    record = VehicleRecord()
+    for field, i in columns.items():
+        if i < len(row_data):
+            value = row_data[i]
+            setattr(record, field, to_number(value) if field in AMOUNT_FIELDS else value)
+    return record
+
+
+def parse_vehicle_rows(headers, rows):
+    """차량 테이블(헤더, 행 목록) → 차량 레코드 목록
+
+    빈 행, "자료가 없습니다" 행, 제조사/차종이 없는 행은 제외합니다.
+    """
+    columns = header_columns(headers)
+    vehicles = []
+
+    for row_data in rows:
+        if len(row_data) >= 3:
+            # 빈 데이터나 "자료가 없습니다" 제외
+            if row_data[0] and '자료가 없습니다' not in ''.join(row_data):
+                vehicle = map_vehicle_row(columns, row_data)
+                if vehicle.manufacturer and vehicle.model:
+                    vehicles.append(vehicle)
+
+    return vehicles
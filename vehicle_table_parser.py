@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+지역 상세 페이지 차량 테이블 추출기
+table.table01 (없으면 첫 번째 table)의 thead 헤더와 tbody 행 텍스트만 추출합니다.
+lxml(C 기반) 백엔드를 우선 사용하고, 오류 시 BeautifulSoup으로 대체합니다.
+
+사용법 (백엔드별 결과 일치 여부 및 속도 확인):
+    python vehicle_table_parser.py [HTML 파일 ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+# C 기반 파서 (선택적)
+# html.parser와 트리 구성이 같은 lxml만 사용 (HTML5 파서는 tbody를 자동 삽입해 결과가 달라짐)
+try:
+    import lxml.html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# BeautifulSoup get_text()가 제외하는 태그 (스크립트/스타일 내용)
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+TABLE01_XPATH = "//table[contains(concat(' ', normalize-space(@class), ' '), ' table01 ')]"
+
+
+def extract_table_bs4(html_content):
+    """BeautifulSoup 기준 구현 - (헤더 리스트, 행별 셀 텍스트 리스트)"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    table = soup.find('table', class_='table01')
+    if not table:
+        table = soup.find('table')
+    if not table:
+        return [], []
+
+    headers = []
+    thead = table.find('thead')
+    if thead:
+        header_row = thead.find('tr')
+        if header_row:
+            headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+
+    rows = []
+    tbody = table.find('tbody')
+    if tbody:
+        for row in tbody.find_all('tr'):
+            rows.append([cell.get_text(strip=True) for cell in row.find_all('td')])
+
+    return headers, rows
+
+
+def _lxml_text(element):
+    """BeautifulSoup get_text(strip=True)와 같은 규칙으로 텍스트 추출"""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in NON_TEXT_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(element)
+    return ''.join(part.strip() for part in parts if part.strip())
+
+
+def _first(element, tag):
+    """하위 요소 중 첫 번째 태그 (BeautifulSoup find와 동일하게 자기 자신 제외)"""
+    for node in element.iterdescendants(tag):
+        return node
+    return None
+
+
+def extract_table_lxml(html_content):
+    """lxml 구현"""
+    root = lxml.html.fromstring(html_content)
+
+    tables = root.xpath(TABLE01_XPATH) or root.xpath('//table')
+    if not tables:
+        return [], []
+    table = tables[0]
+
+    headers = []
+    thead = _first(table, 'thead')
+    if thead is not None:
+        header_row = _first(thead, 'tr')
+        if header_row is not None:
+            headers = [_lxml_text(cell) for cell in header_row.iterdescendants('th', 'td')]
+
+    rows = []
+    tbody = _first(table, 'tbody')
+    if tbody is not None:
+        for row in tbody.iterdescendants('tr'):
+            rows.append([_lxml_text(cell) for cell in row.iterdescendants('td')])
+
+    return headers, rows
+
+
+BACKENDS = {
+    'bs4': extract_table_bs4,
+    'lxml': extract_table_lxml,
+}
+
+
+def available_backends():
+    """설치된 백엔드 목록 (빠른 순)"""
+    backends = []
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    backends.append('bs4')
+    return backends
+
+
+def default_backend():
+    """기본 백엔드 (lxml > bs4)"""
+    return available_backends()[0]
+
+
+def extract_vehicle_table(html_content, backend=None):
+    """차량 테이블 추출 - 선택한 백엔드 실패 시 BeautifulSoup으로 대체"""
+    backend = backend or default_backend()
+    if backend != 'bs4' and backend in available_backends():
+        try:
+            return BACKENDS[backend](html_content)
+        except Exception as e:
+            print(f"   ⚠️ {backend} 파싱 실패, BeautifulSoup으로 대체: {e}")
+    return extract_table_bs4(html_content)
+
+
+def compare_backends(paths, repeat=5):
+    """파일별로 각 백엔드 결과가 BeautifulSoup과 일치하는지, 속도는 어떤지 확인"""
+    backends = available_backends()
+    timings = {backend: 0.0 for backend in backends}
+    mismatches = []
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+
+        expected = None
+        for backend in reversed(backends):  # bs4 먼저
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = BACKENDS[backend](html_content)
+            timings[backend] += (time.perf_counter() - start) / repeat
+
+            if backend == 'bs4':
+                expected = result
+            elif result != expected:
+                mismatches.append((path, backend))
+
+    print(f"📄 비교 파일: {len(paths)}개")
+    for backend in backends:
+        speedup = timings['bs4'] / timings[backend] if timings[backend] else 0
+        print(f"   {backend}: {timings[backend] * 1000:.1f}ms (bs4 대비 {speedup:.1f}배)")
+
+    if mismatches:
+        print(f"❌ 결과 불일치 {len(mismatches)}건:")
+        for path, backend in mismatches:
+            print(f"   {backend}: {path}")
+    else:
+        print("✅ 모든 백엔드 결과가 BeautifulSoup과 동일합니다")
+
+    return not mismatches
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:]
+    if not files:
+        # 기본: 응답 캐시 + 저장된 페이지 소스
+        files = sorted(glob.glob(os.path.join('ev_data', 'response_cache', '*.html')))
+        files += [path for path in [os.path.join('ev_data', 'debug_page_source.html')] if os.path.exists(path)]
+
+    if not files:
+        print("❌ 비교할 HTML 파일이 없습니다.")
+        sys.exit(1)
+
+    sys.exit(0 if compare_backends(files) else 1)